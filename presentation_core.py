@@ -0,0 +1,275 @@
+# Timing and layout core of the 3D Presentation Plug-in
+# plain numbers and lists in and out, nothing from bpy (the plug-in applies the results)
+
+import bisect
+from math import sqrt, radians, sin, cos, tan, pi, pow, floor
+
+# frames of a component placed at time, its keyframes go from min_x to max_x
+# returns (strip offset, marker offset, frame_start, frame_end)
+def get_component_timing(time, min_x, max_x, interpolation_time):
+    offset = time - min_x
+    marker_offset = int(time) - int(min_x)
+    frame_end = time + max_x - min_x
+    #the camera flies in before the component starts
+    if time != 1:
+        offset += interpolation_time
+        marker_offset += int(interpolation_time)
+        frame_end += interpolation_time
+    return offset, marker_offset, frame_end - (max_x - min_x), frame_end
+
+# markers of one component from its markers.txt line "name:LS-1;5;LE-9;"
+# returns (name, [[frame, "LOOP_START" / "LOOP_END" / None for a stop], ...], min frame, max frame)
+# None if the component has no markers
+def parse_markers_line(line):
+    name, _, data = line.partition(":")
+    markers = []
+    for m in data.strip().split(";")[:-1]:
+        if "LS-" in m:
+            markers.append([int(m.split("-")[-1]), "LOOP_START"])
+        elif "LE-" in m:
+            markers.append([int(m.split("-")[-1]), "LOOP_END"])
+        else:
+            markers.append([int(m), None])
+    if len(markers) == 0:
+        return None
+    frames = [m[0] for m in markers]
+    return name, markers, min(frames), max(frames)
+
+# frame of the real-time player after elapsed seconds, started on start_frame
+# loop = [start, end] plays start+1 .. end-1 over and over, like the frame by frame player
+def get_realtime_frame(start_frame, elapsed, fps, direction, loop=None):
+    steps = floor(elapsed * fps)
+    if loop is None:
+        return start_frame + direction*steps
+    if steps == 0:
+        return start_frame
+    length = max(loop[1] - loop[0] - 1, 1)
+    return loop[0] + 1 + (start_frame - loop[0] + steps - 1) % length
+
+# stop frames and loops [start, end] of the markers [(frame, name), ...]
+# a LOOP_START is a stop too, a LOOP_END is not
+def get_stops(markers):
+    stops = set()
+    loops = []
+    last_loop_start = -1
+    for frame, name in sorted(markers):
+        if name == "LOOP_END":
+            loops.append([last_loop_start, frame])
+            continue
+        if name == "LOOP_START":
+            last_loop_start = frame
+        stops.add(frame)
+    return sorted(stops), loops
+
+# camera markers and transition of the i-th new component, n_tmp already imported, its keyframes end on max_frame
+# returns ([(marker name, frame, camera number), ...], (camera number, next camera number, frame_from, frame_to) or None)
+def get_camera_change(i, n_tmp, slide_count, max_frame, min_frame, interpolation_time):
+    markers = []
+    if i == 0:
+        if n_tmp != 0:
+            #camera for the slide after the already imported ones
+            markers.append(("SLIDE " + str(n_tmp) + " START", min_frame, n_tmp))
+        else:
+            #camera for the first slide
+            markers.append(("SLIDE 0 START", 1, 0))
+    i += n_tmp
+    #last camera doesnt fly anywhere
+    if i == slide_count-1:
+        return markers, None
+    marker_frame = max_frame + interpolation_time
+    markers.append(("SLIDE " + str(i) + " START", marker_frame, i+1))
+    return markers, (i, i+1, max_frame, marker_frame)
+
+# location and z rotation (None = keep) of the i-th new component, n_tmp already imported
+# components are 50 apart, 30 under each other
+def get_component_placement(i, n_tmp, n, arrangement, already_imported):
+    if arrangement == "x_axis":
+        return ((i+n_tmp)*50, 0, 0), None
+    if arrangement == "y_axis":
+        return (0, (i+n_tmp)*50, 0), None
+    if arrangement == "z_axis":
+        return (0, 0, -(i+n_tmp)*30), None
+    if already_imported:
+        return (0, -i*30, 0), None
+    #n-polygon with side length 50
+    z_rot = 360/n
+    r2 = 50/(2*tan(radians(180.0)/n))   #inner circle radius
+    rotation = radians(-i*z_rot-90)
+    if n == 1:
+        return (0, 0, 0), rotation
+    if n == 2:
+        return (pow(-1,i)*25, 0, 0), rotation
+    return (cos(-i*2*pi/n)*r2, sin(-i*2*pi/n)*r2, 0), rotation
+
+# location, z rotation and camera angle (degrees) of the i-th of n images
+def get_image_placement(i, n, arrangement):
+    distance = sin(radians(60.0))
+    if arrangement == "x_axis":
+        return (i, distance, 0), 0, 60.0
+    if arrangement == "y_axis":
+        return (0, (i+1)*distance, 0), 0, 60.0
+    if arrangement == "z_axis":
+        return (distance, 0, -i), radians(-90.0), 60.0
+    #n-polygon with side length 1
+    z_rot = 360/n
+    r2 = 1/(2*tan(radians(180.0)/n))   #inner circle radius
+    rotation = radians(-i*z_rot-90)
+    if n == 1:
+        return (distance, 0, 0), rotation, 60.0
+    if n == 2:
+        return (pow(-1,i)*distance, 0, 0), rotation, 60.0
+    return (cos(-i*2*pi/n)*r2, sin(-i*2*pi/n)*r2, 0), rotation, z_rot
+
+# image dimensions scaled to width 1 (height at most 1) and the tallest image so far
+def fit_image_dimensions(dimensions, max_y, i):
+    coef = 1/dimensions[0]
+    #too tall -> height 1
+    if dimensions[1]*coef > 1:
+        coef /= dimensions[1]*coef
+    fitted = (dimensions[0]*coef, dimensions[1]*coef, dimensions[2])
+    if i == 0 or fitted[1] > max_y:
+        max_y = fitted[1]
+    return fitted, max_y
+
+# placed bounding spheres in a grid of cells, for the overlap checks of the layout
+class LayoutIndex:
+    def __init__(self, cell):
+        self.cell = cell
+        self.cells = {}
+
+    def key(self, p):
+        return (floor(p[0] / self.cell), floor(p[1] / self.cell), floor(p[2] / self.cell))
+
+    def add(self, p, r):
+        self.cells.setdefault(self.key(p), []).append((p, r))
+
+    # how far the sphere is inside the clearance of the placed ones, 0 = free (r <= cell / 2)
+    def get_overlap(self, p, r, clearance):
+        overlap = 0
+        kx, ky, kz = self.key(p)
+        for x in (kx-1, kx, kx+1):
+            for y in (ky-1, ky, ky+1):
+                for z in (kz-1, kz, kz+1):
+                    for q, rq in self.cells.get((x, y, z), []):
+                        d = r + rq + clearance
+                        dist2 = (p[0]-q[0])**2 + (p[1]-q[1])**2 + (p[2]-q[2])**2
+                        if dist2 < d*d:
+                            overlap = max(overlap, d - sqrt(dist2))
+        return overlap
+
+# place the components one after another along a curve point(t), step_length(t) = arc length per t
+# a blocked component moves on by its overlap (no free place is skipped), at least by its own size / 4
+def march_layout(sizes, clearance, point, step_length):
+    radii = [sqrt(h[0]**2 + h[1]**2 + h[2]**2) for h in sizes]
+    r_max = max(radii)
+    index = LayoutIndex(2*r_max + clearance)
+    positions = []
+    t = 0
+    for r in radii:
+        step = max(r / 4, clearance / 4, 1e-3)
+        p, length = point(t), step_length(t)
+        overlap = index.get_overlap(p, r, clearance)
+        while overlap > 0:
+            t += max(overlap, step) / length
+            p, length = point(t), step_length(t)
+            overlap = index.get_overlap(p, r, clearance)
+        index.add(p, r)
+        positions.append(p)
+    return positions
+
+# nearest neighbour distance of points on the unit sphere
+def get_min_distance(points):
+    cell = 4 / sqrt(len(points))
+    index = {}
+    for n, p in enumerate(points):
+        index.setdefault((floor(p[0] / cell), floor(p[1] / cell), floor(p[2] / cell)), []).append(n)
+    best = 2.0
+    for (kx, ky, kz), members in index.items():
+        near = []
+        for x in (kx-1, kx, kx+1):
+            for y in (ky-1, ky, ky+1):
+                for z in (kz-1, kz, kz+1):
+                    near += index.get((x, y, z), [])
+        for n in members:
+            p = points[n]
+            for m in near:
+                if m != n:
+                    q = points[m]
+                    best = min(best, sqrt((p[0]-q[0])**2 + (p[1]-q[1])**2 + (p[2]-q[2])**2))
+    return best
+
+# centers of the component bounds, sizes = [half extents (x, y, z), ...] in presentation order
+# path = [(x, y, z), ...] polyline for the PATH layout
+def layout_positions(sizes, arrangement, clearance, path=None):
+    n = len(sizes)
+    if n == 0:
+        return []
+    #rows: each box right behind the previous one
+    if arrangement in ("ROW_X", "ROW_Y", "COLUMN_Z"):
+        axis = {"ROW_X": 0, "ROW_Y": 1, "COLUMN_Z": 2}[arrangement]
+        sign = -1 if axis == 2 else 1
+        positions = []
+        offset = 0
+        for i, h in enumerate(sizes):
+            if i != 0:
+                offset += sizes[i-1][axis] + clearance + h[axis]
+            p = [0, 0, 0]
+            p[axis] = sign*offset
+            positions.append(tuple(p))
+        return positions
+    #grid: shelves of boxes in the xy plane, about as wide as deep
+    if arrangement == "GRID":
+        area = sum((2*h[0] + clearance) * (2*h[1] + clearance) for h in sizes)
+        width = max(sqrt(area), max(2*h[0] for h in sizes))
+        positions = []
+        x = y = row_depth = 0
+        for h in sizes:
+            if x != 0 and x + 2*h[0] > width:
+                x = 0
+                y -= row_depth + clearance
+                row_depth = 0
+            positions.append((x + h[0], y - h[1], 0))
+            x += 2*h[0] + clearance
+            row_depth = max(row_depth, 2*h[1])
+        return positions
+    radii = [sqrt(h[0]**2 + h[1]**2 + h[2]**2) for h in sizes]
+    r_max = max(radii)
+    #sphere: fibonacci points, radius from the closest two of them
+    if arrangement == "SPHERE":
+        if n == 1:
+            return [(0, 0, 0)]
+        golden = pi * (3 - sqrt(5))
+        points = []
+        for i in range(n):
+            z = 1 - 2*(i + 0.5)/n
+            r = sqrt(1 - z*z)
+            points.append((cos(golden*i)*r, sin(golden*i)*r, z))
+        radius = (2*r_max + clearance) / get_min_distance(points)
+        return [(p[0]*radius, p[1]*radius, p[2]*radius) for p in points]
+    #spiral: turns far enough apart, only neighbours on the curve can touch
+    if arrangement == "SPIRAL":
+        b = (2*r_max + clearance) / (2*pi)
+        theta0 = 2*pi
+        return march_layout(sizes, clearance,
+                            lambda t: (b*(t+theta0)*cos(t+theta0) - b*theta0, b*(t+theta0)*sin(t+theta0), 0),
+                            lambda t: b*sqrt((t+theta0)**2 + 1))
+    #helix: about 8 components per turn, turns one component apart
+    if arrangement == "HELIX":
+        radius = 8 * (2*sum(radii)/n + clearance) / (2*pi)
+        pitch = (2*r_max + clearance) / (2*pi)
+        return march_layout(sizes, clearance,
+                            lambda t: (radius*cos(t) - radius, radius*sin(t), -pitch*t),
+                            lambda t: sqrt(radius**2 + pitch**2))
+    #path: along the polyline, straight on after its end
+    if path is None or len(path) < 2:
+        return layout_positions(sizes, "ROW_X", clearance)
+    lengths = [0]
+    for a, c in zip(path, path[1:]):
+        lengths.append(lengths[-1] + sqrt(sum((c[k]-a[k])**2 for k in range(3))))
+    def point(t):
+        i = min(max(bisect.bisect_right(lengths, t) - 1, 0), len(path) - 2)
+        a, c = path[i], path[i+1]
+        seg = max(lengths[i+1] - lengths[i], 1e-9)
+        f = (t - lengths[i]) / seg
+        return tuple(a[k] + (c[k]-a[k])*f for k in range(3))
+    return march_layout(sizes, clearance, point, lambda t: 1)
@@ -10,9 +10,19 @@ bl_info = {
     "category": "3D View",
 }
 
-import bpy, os, platform, glob, random, json
-from math import radians, sin, cos, tan, pi, pow, ceil
+import bpy, os, sys, platform, glob, random, json, hashlib, bisect, subprocess, time, shutil
+from array import array
+from math import radians, sin, ceil, floor
+from mathutils import Vector, Matrix
 from bpy.app.handlers import persistent
+import bpy.utils.previews
+
+#the timing and layout core lies next to this file, also when it is run with --python
+if os.path.dirname(os.path.realpath(__file__)) not in sys.path:
+    sys.path.append(os.path.dirname(os.path.realpath(__file__)))
+from presentation_core import (get_component_timing, parse_markers_line, get_realtime_frame, get_stops,
+                               get_camera_change, get_component_placement, get_image_placement,
+                               fit_image_dimensions, layout_positions)
 
         
 
@@ -20,51 +30,301 @@ from bpy.app.handlers import persistent
 #                                               PROPERTIES
 # -----------------------------------------------------------------------------------------------------
 
+# chosen file ready to import (component or image)
+class PresFileItem(bpy.types.PropertyGroup):
+    filepath: bpy.props.StringProperty(name="File Path", default="", subtype='FILE_PATH')
+    # source component file of a timed copy and its modification time (watch mode)
+    source: bpy.props.StringProperty(name="Source File", default="", subtype='FILE_PATH')
+    # nanoseconds as a string, a float property is too coarse for the time stamp
+    source_mtime: bpy.props.StringProperty(name="Source Modified", default="")
+    # component collection and camera in the file
+    collection: bpy.props.StringProperty(name="Collection", default="")
+    camera: bpy.props.StringProperty(name="Camera", default="")
+
+# scanned component file of the catalogue, name = file name
+class PresCatalogueItem(bpy.types.PropertyGroup):
+    filepath: bpy.props.StringProperty(name="File Path", default="", subtype='FILE_PATH')
+    frame_start: bpy.props.IntProperty(name="Start", default=0)
+    frame_end: bpy.props.IntProperty(name="End", default=0)
+    markers: bpy.props.IntProperty(name="Markers", default=0)
+    loops: bpy.props.IntProperty(name="Loops", default=0)
+    camera: bpy.props.StringProperty(name="Camera", default="")
+    # number of cameras in the component, exactly 1 is valid
+    cameras: bpy.props.IntProperty(name="Cameras", default=0)
+    objects: bpy.props.IntProperty(name="Objects", default=0)
+    polygons: bpy.props.IntProperty(name="Polygons", default=0)
+    thumbnail: bpy.props.StringProperty(name="Thumbnail", default="", subtype='FILE_PATH')
+    # chosen for import
+    selected: bpy.props.BoolProperty(name="Select", default=False)
+
+# marker moving with a component timer, name = marker name
+class PresMarkerItem(bpy.types.PropertyGroup):
+    frame: bpy.props.IntProperty(name="Frame", default=0)
+
+# one component timer, name = timer strip name
+class PresTimerItem(bpy.types.PropertyGroup):
+    # timer empty with the strip
+    timer: bpy.props.PointerProperty(name="Timer", type=bpy.types.Object)
+    # component camera
+    camera: bpy.props.PointerProperty(name="Camera", type=bpy.types.Object)
+    # strip range, a different strip range means the strip was moved
+    start: bpy.props.IntProperty(name="Start", default=0)
+    end: bpy.props.IntProperty(name="End", default=0)
+    # markers moving with the strip
+    markers: bpy.props.CollectionProperty(type=PresMarkerItem)
+
+# resources of one component for the budget report, name = component name
+class PresReportItem(bpy.types.PropertyGroup):
+    frame_start: bpy.props.IntProperty(name="Start", default=0)
+    frame_end: bpy.props.IntProperty(name="End", default=0)
+    objects: bpy.props.IntProperty(name="Objects", default=0)
+    polygons: bpy.props.IntProperty(name="Polygons", default=0)
+    materials: bpy.props.IntProperty(name="Materials", default=0)
+    texture_mb: bpy.props.FloatProperty(name="Texture memory [MB]", default=0)
+    fcurves: bpy.props.IntProperty(name="Animated F-Curves", default=0)
+    drivers: bpy.props.IntProperty(name="Scripted drivers", default=0)
+    constraints: bpy.props.IntProperty(name="Constraints", default=0)
+    # average evaluation time of a frame in the component range
+    eval_ms: bpy.props.FloatProperty(name="Evaluation [ms]", default=0)
+    # exceeded budgets, "" = within budget
+    flags: bpy.props.StringProperty(name="Over budget", default="")
+
+# one stop of the presentation for the slide index
+class PresSlideItem(bpy.types.PropertyGroup):
+    # stop frame
+    frame: bpy.props.IntProperty(name="Frame", default=1)
+    # component (section) number
+    section: bpy.props.IntProperty(name="Section", default=0)
+    # end of the loop starting at this stop, 0 = no loop
+    loop_end: bpy.props.IntProperty(name="Loop end", default=0)
+
+
 class PresMenuProperties(bpy.types.PropertyGroup):
     script_file = os.path.realpath(__file__)
     script_dir = os.path.dirname(script_file)
     
-    # chosen slides, ready to import   
-    # slide_list = [[filepath, parent_collection, camera_name], ...]
-    slide_list = []
+    # slide index cache for O(log n) lookups
+    # slide_frames = [frame, ...], slide_loops = [[start, end], ...], slide_sections = [frame, ...]
+    slide_frames = []
+    slide_loops = []
+    slide_sections = []
+    slide_index_dirty = True
+    
+    # components hidden by the culling
+    # culling_targets = [[object or collection, ...] per section], culling_visible = {section, ...}
+    culling_targets = []
+    culling_visible = set()
+    # spatial index for the camera view culling
+    # culling_boxes = [(min, max) per section], culling_grid = {(x, y, z): {section, ...}}
+    culling_boxes = []
+    culling_grid = {}
     
-    # chosen images, ready to import 
-    # image_list = [filepath1, filepath2, ...]
-    image_list = []
+    # components waiting for the streaming timer, nearest first
+    # stream_queue = [[instance name, load or unload], ...]
+    stream_queue = []
+    # slide picked in the slide index list, None = no jump waiting
+    slide_request = None
     
-    # camera objects for interpolation
-    camera_objects = []
+    # the slideshow shows the pre-rendered frames
+    prerender_playing = False
+    # progress of the running video export for the UI, "" = not running
+    export_status = ""
+    # progress of the running catalogue scan for the UI, "" = not running
+    catalogue_status = ""
+    # progress of the running proxy build for the UI, "" = not running
+    lod_status = ""
+    # achieved frame rate of the played transitions
+    # transition_log = [{"from", "to", "frames", "drawn", "seconds", "planned_seconds", "fps", "realtime"}, ...]
+    transition_log = []
+    transition_status = ""
+    # running component rebuild of the watch mode
+    # watch_job = [process, timed copy path, result path, markers.txt size before (-1 = none)], None = no rebuild
+    watch_job = None
+    watch_status = ""
+    # chosen components waiting for their timed copy, written one after another
+    # write_queue = {"scene", "files": [path, ...], "count", "time", "interpolation_time", "n_tmp", "warning", "error"}
+    # write_job = [process, source path, job path, result path], None = no copy being written
+    write_queue = None
+    write_job = None
+    write_status = ""
+    # sha1 of the files, valid while their size and modification time stay the same
+    # file_hashes = {absolute path: [size, mtime_ns, sha1]}
+    file_hashes = {}
+    # progress of the running component generation for the UI, "" = not running
+    template_status = ""
     
-    # loops = {end_frame1: start_frame1, end_frame2: start_frame2, ...}
-    loops = {}
+    # loaded catalogue index files
+    # catalogue_cache = {directory: {file name: entry}}
+    catalogue_cache = {}
     
-    # structure for marker movement
-    # marker_timers = {TIMER strip: [marker1, marker2, ...], ...}
-    marker_timers = {}
+    # component instances waiting for a lazy override
+    override_queue = set()
     
-    # structure for checking nla changes
-    # nla_strips = {name: [start, end], ...}
-    nla_strips = {}
+    # decoded baked camera path for the slideshow
+    # camera_bake = [frame_start, array of floats (BAKE_STRIDE per frame)]
+    camera_bake = []
     
     # structure for type count (template creation) 
     assigned_types = {'H1':0, 'H2':0, 'OL':0, 'UL':0, 'IMAGE':0, 'NUMBER':0}
+    # assigned object types of the template, rebuilt when objects are added or removed
+    # type_registry = {object key (get_id_key): type name}, without the UNASSIGNED objects
+    type_registry = {}
+    type_registry_dirty = True
+    type_registry_version = 0
+    # filtered object list of the last redraw
+    # template_filter_cache = [filter key, flags, listed object names]
+    template_filter_cache = []
+    # overridden and all components for the streaming and LOD options of the last redraw
+    # override_count_cache = [key, overridden, total]
+    override_count_cache = []
 
     # enter fullscreen for slideshow or not
     fullscreen: bpy.props.BoolProperty(name="Enter fullscreen mode", default=True)
+    # scene is a presentation (has components), the editing handlers run only then
+    is_presentation: bpy.props.BoolProperty(name="Flag for presentation scene", default=False)
     # already used override or not
     overriden: bpy.props.BoolProperty(name="Flag for overriding", default=False)
     # show objects with unassigned type in UI
     show_unassigned: bpy.props.BoolProperty(name="Show UNASSIGNED objects", default=True)
+    # show only objects of one type in the template list
+    template_filter: bpy.props.EnumProperty(name="Show",
+                items = [("ALL", "All types", "Show objects of every type"),
+                        ("H1", "H1", "Heading 1"),
+                        ("H2", "H2", "Heading 2"),
+                        ("OL", "OL", "Ordered List"),
+                        ("UL", "UL", "Unordered List"),
+                        ("IMAGE", "IMAGE", "Image file"),
+                        ("NUMBER", "NUMBER", "Component number"),
+                        ("UNASSIGNED", "UNASSIGNED", "Background objects")])
+    # active object of the template list, selecting it selects the object
+    template_index: bpy.props.IntProperty(name="Object", default=0, update=lambda self, context: select_template_object(context, self.template_index))
     # does component has more collections
     more_collections: bpy.props.BoolProperty(name="Flag for component with more collections", default=False)
     # interpolate camera inbetween components or not
     interpolate_camera: bpy.props.BoolProperty(name="Interpolate camera", default=True)
+    # drive the slideshow camera from the baked camera path
+    play_baked: bpy.props.BoolProperty(name="Play baked camera path", default=False)
+    # transitions take their time on the clock, frames are skipped when the viewport is slow
+    realtime_transitions: bpy.props.BoolProperty(name="Real-time transitions", default=False)
+    # where to store the baked camera path
+    bake_storage: bpy.props.EnumProperty(name="Store bake in",
+                items = [("BLEND", ".blend file", "Store the baked camera path inside this .blend file"),
+                        ("SIDECAR", "Sidecar file", "Store the baked camera path next to the timed components")])
+    # present the pre-rendered frames instead of rendering live
+    play_prerendered: bpy.props.BoolProperty(name="Play pre-rendered deck", default=False)
+    # which frames are pre-rendered
+    prerender_range: bpy.props.EnumProperty(name="Pre-render",
+                items = [("ALL", "Every frame", "Pre-render the whole presentation with the transitions"),
+                        ("STOPS", "Stops and loops", "Pre-render only the stops and loops, the slideshow jumps between them")])
+    # number of background Blender processes for pre-rendering
+    prerender_jobs: bpy.props.IntProperty(name="Processes", default=2, min=1, max=64)
+    # video file of the exported deck
+    export_path: bpy.props.StringProperty(name="Video File", default="//presentation.mp4", subtype='FILE_PATH')
+    # how long the video stays on a stop
+    export_hold: bpy.props.FloatProperty(name="Stop duration  [s]", default=3, subtype='TIME', unit='TIME', min=0, max=3600)
+    # how many times the video plays a loop
+    export_loops: bpy.props.IntProperty(name="Loop repeats", default=2, min=1, max=100)
+    # rebuild components when their source .blend file changes
+    watch_components: bpy.props.BoolProperty(name="Watch source Components", default=False, update=lambda self, context: toggle_component_watch(self))
+    # save the .blend file before overriding
+    save_before_override: bpy.props.BoolProperty(name="Save before Override", default=False)
+    # override components when they are first selected for editing
+    lazy_override: bpy.props.BoolProperty(name="Override on first edit", default=False)
+    # hide components that are far away during the slideshow
+    culling_mode: bpy.props.EnumProperty(name="Culling",
+                items = [("NONE", "None", "All components stay visible"),
+                        ("SLIDES", "Nearby slides", "Only components around the current slide are visible"),
+                        ("FRUSTUM", "Camera view", "Only components the camera can see are visible")])
+    # number of components visible before and after the current one
+    culling_window: bpy.props.IntProperty(name="Visible components around", default=1, min=1, max=100)
+    # keep only the components around the current slide loaded
+    stream_components: bpy.props.BoolProperty(name="Stream Components", default=False, update=lambda self, context: toggle_streaming(context.scene))
+    # number of components loaded before and after the current one
+    stream_window: bpy.props.IntProperty(name="Loaded components around", default=2, min=1, max=100)
+    # swap distant components for simplified proxies during the slideshow
+    lod_mode: bpy.props.EnumProperty(name="Level of detail",
+                items = [("NONE", "Full detail", "All components are shown in full detail"),
+                        ("SLIDES", "Nearby slides", "Components far from the current slide are shown as proxies"),
+                        ("DISTANCE", "Camera distance", "Components far from the camera are shown as proxies")])
+    # number of components in full detail before and after the current one
+    lod_window: bpy.props.IntProperty(name="Full detail components around", default=1, min=0, max=100)
+    # components further from the camera are shown as proxies
+    lod_distance: bpy.props.FloatProperty(name="Full detail distance", default=100, min=0, subtype='DISTANCE', unit='LENGTH')
+    # share of the polygons kept in the proxies
+    lod_ratio: bpy.props.FloatProperty(name="Proxy polygons", default=0.2, min=0.01, max=1, subtype='FACTOR')
+    # largest texture side in the proxies
+    lod_texture_size: bpy.props.IntProperty(name="Proxy texture size", default=256, min=16, max=8192)
+    # arrangement of the layout engine, by the component bounds
+    layout_arrangement: bpy.props.EnumProperty(name="Layout",
+                items = [("ROW_X", "Row (x-axis)", "Next to each other in the x-axis", "FORWARD", 0),
+                        ("ROW_Y", "Row (y-axis)", "Behind each other in the y-axis", "TRANSFORM_ORIGINS", 1),
+                        ("COLUMN_Z", "Column (z-axis)", "Under each other in the z-axis", "SORT_ASC", 2),
+                        ("GRID", "Grid", "Rows of components packed by their size", "MESH_GRID", 3),
+                        ("SPIRAL", "Spiral", "Spiral going out from the first component", "FORCE_VORTEX", 4),
+                        ("SPHERE", "Sphere", "Evenly on the surface of a sphere", "MESH_UVSPHERE", 5),
+                        ("HELIX", "Helix", "Helix going down", "MOD_SCREW", 6),
+                        ("PATH", "Path", "Along a curve object", "CURVE_DATA", 7)])
+    # free space between the bounds of two components
+    layout_clearance: bpy.props.FloatProperty(name="Clearance", default=5, min=0, subtype='DISTANCE', unit='LENGTH')
+    # curve for the path layout
+    layout_path: bpy.props.PointerProperty(name="Path", type=bpy.types.Object, poll=lambda self, obj: obj.type == 'CURVE')
+    # arrange the components by their size after importing
+    layout_on_import: bpy.props.BoolProperty(name="Arrange after import", default=False)
+    # folder with component .blend files for the catalogue
+    catalogue_dir: bpy.props.StringProperty(name="Components Folder", default="//", subtype='DIR_PATH')
+    # scanned component files
+    catalogue: bpy.props.CollectionProperty(type=PresCatalogueItem)
+    catalogue_index: bpy.props.IntProperty(name="Component", default=0)
+    # chosen components, ready to import
+    slide_list: bpy.props.CollectionProperty(type=PresFileItem)
+    # chosen images, ready to import
+    image_list: bpy.props.CollectionProperty(type=PresFileItem)
+    # component timers in timeline order, for nla changes and marker movement
+    timers: bpy.props.CollectionProperty(type=PresTimerItem)
+    # slide index of the presentation
+    slides: bpy.props.CollectionProperty(type=PresSlideItem)
+    # resource budget report of the components
+    report: bpy.props.CollectionProperty(type=PresReportItem)
+    report_index: bpy.props.IntProperty(name="Component", default=0)
+    report_sort: bpy.props.EnumProperty(name="Sort by",
+                items = [("frame_start", "Order", "Order in the presentation"),
+                        ("polygons", "Polygons", "Most polygons first"),
+                        ("texture_mb", "Textures", "Most texture memory first"),
+                        ("eval_ms", "Evaluation", "Slowest evaluation first"),
+                        ("drivers", "Drivers", "Most scripted drivers first"),
+                        ("fcurves", "F-Curves", "Most animated F-Curves first")])
+    # budgets, a component over any of them is flagged
+    budget_polygons: bpy.props.IntProperty(name="Polygons", default=500000, min=0)
+    budget_texture_mb: bpy.props.FloatProperty(name="Textures [MB]", default=512, min=0)
+    budget_eval_ms: bpy.props.FloatProperty(name="Evaluation [ms]", default=16, min=0)
+    # frames evaluated per component for the timing
+    report_samples: bpy.props.IntProperty(name="Timed frames", default=24, min=1, max=1000)
+    # selected slide in the slide index, selecting jumps to it
+    slide_index_active: bpy.props.IntProperty(name="Slide", default=0, update=lambda self, context: request_go_to_slide(self.slide_index_active))
     # path to the JSON file
     json_path: bpy.props.StringProperty(name="JSON File", default="//", subtype='FILE_PATH')
     # path to this .blend file
     this_file: bpy.props.StringProperty(name="Path to this .blend file", default="//", subtype='FILE_PATH')
     # time of the camera transition
     transition_time: bpy.props.FloatProperty(name="Transition time  [s]", default=2, subtype='TIME', unit='TIME', step=20, min=0.2, max=3600)
+    # how are the camera transitions evaluated
+    transition_mode: bpy.props.EnumProperty(name="Transitions",
+                items = [("CONSTRAINTS", "Camera constraints", "Every component camera gets constraints to the next camera", "CONSTRAINT", 0),
+                        ("PRESENTER", "Presenter camera", "Bake all transitions onto one presenter camera, no constraints", "OUTLINER_OB_CAMERA", 1)])
+    # easing curve of the presenter camera transitions
+    transition_easing: bpy.props.EnumProperty(name="Easing",
+                items = [("LINEAR", "Linear", "Constant speed"),
+                        ("BEZIER", "Bezier", "Smooth ease in and out"),
+                        ("SINE", "Sine", "Sinusoidal easing"),
+                        ("QUAD", "Quadratic", "Quadratic easing"),
+                        ("CUBIC", "Cubic", "Cubic easing"),
+                        ("QUART", "Quartic", "Quartic easing"),
+                        ("QUINT", "Quintic", "Quintic easing"),
+                        ("EXPO", "Exponential", "Exponential easing"),
+                        ("CIRC", "Circular", "Circular easing"),
+                        ("BACK", "Back", "Overshoot a little and settle"),
+                        ("ELASTIC", "Elastic", "Spring-like easing"),
+                        ("BOUNCE", "Bounce", "Bounce at the end of the transition")], default="BEZIER")
     # number of images chosen, but not imported
     image_chosen: bpy.props.IntProperty(name="Number of images chosen, but not imported", default=0, min=0, max=999)
     # number of components chosen, but not imported
@@ -174,40 +434,23 @@ class TEMPLATE_PT_panel(SlidePanel, bpy.types.Panel):
         row.prop(pres_tool, "show_unassigned")
         row = layout.row()
         row.operator("presentation.assign_object_type", text="Assign Type to Selected")
+        row.operator("presentation.assign_object_type", text="Assign Type to Listed").listed = True
         row = layout.row()
-        if len(bpy.data.objects.values()) == 0:
+        if len(scene.objects) == 0:
             row.label(text="Add some objects to the scene first")
             row = layout.row()
         else:
-            row.label(text="OBJECT")
-            row.label(text=" ")
-            row.label(text="TYPE")
+            counts = get_type_counts()
+            flow = layout.column_flow(columns=3, align=True)
+            for type in ['H1', 'H2', 'OL', 'UL', 'IMAGE', 'NUMBER']:
+                flow.label(text=type + ": " + str(counts.get(type, 0)))
+            row = layout.row()
+            row.prop(pres_tool, "template_filter")
+            row = layout.row()
+            row.template_list("PRESENTATION_UL_template", "", scene, "objects", pres_tool, "template_index", rows=8)
             row = layout.row()
         
-        for obj in bpy.context.scene.objects:
-            if obj.type == 'GPENCIL':
-                icon = 'OUTLINER_OB_GREASEPENCIL'
-            elif obj.type == 'LIGHT_PROBE':
-                icon = 'OUTLINER_OB_LIGHTPROBE'
-            else:
-                icon = 'OUTLINER_OB_' + obj.type
-                
-            try:
-                if pres_tool.show_unassigned is False and obj["OBJECT TYPE"] == "UNASSIGNED":
-                    continue
-                row.label(text=obj.name + ":", icon=icon)
-                if obj.select_get():
-                    row.label(text="(selected)")
-                else:
-                     row.label(text=" ")
-                row.label(text=obj["OBJECT TYPE"])
-                row = layout.row()
-            except:
-                if pres_tool.show_unassigned is True:
-                    row.label(text="UNASSIGNED")
-                    row = layout.row()
-        
-        if len(bpy.data.objects.values()) != 0:
+        if len(scene.objects) != 0:
             row = layout.row()
             row = layout.row()
             row.label(text="If your template is finished, generate the JSON file.")
@@ -237,7 +480,10 @@ class GENERATING_PT_panel(SlidePanel, bpy.types.Panel):
         row = layout.row()
         row.label(text="This blender file will be filled with the JSON data.")
         row = layout.row()
-        row.operator("presentation.component_from_template", text="Create Component(s)")   
+        if PresMenuProperties.template_status != "":
+            row.label(text=PresMenuProperties.template_status, icon='TIME')
+        else:
+            row.operator("presentation.component_from_template", text="Create Component(s)")   
     
 
 # -------------------------------------------------------------------
@@ -283,6 +529,11 @@ class IMPORT_SETTINGS_PT_panel(PresentationPanel, bpy.types.Panel):
             row.prop(pres_tool, "interpolate_camera")
             if pres_tool.interpolate_camera:
                 row.prop(pres_tool, "transition_time")
+                row = layout.row()
+                row.prop(pres_tool, "transition_mode")
+                if pres_tool.transition_mode == "PRESENTER":
+                    row = layout.row()
+                    row.prop(pres_tool, "transition_easing")
             row = layout.row()
             row = layout.row()
             row = layout.row()
@@ -293,8 +544,31 @@ class IMPORT_SETTINGS_PT_panel(PresentationPanel, bpy.types.Panel):
         row = layout.row()
         row.operator("presentation.choose_slide", text="Choose Component(s)")
         row = layout.row()
+        row.prop(pres_tool, "catalogue_dir")
+        row = layout.row()
+        if PresMenuProperties.catalogue_status != "":
+            row.label(text=PresMenuProperties.catalogue_status, icon='TIME')
+        else:
+            row.operator("presentation.scan_catalogue", text="Scan Catalogue", icon='FILE_REFRESH')
+        if len(pres_tool.catalogue) != 0:
+            row = layout.row()
+            row.template_list("PRESENTATION_UL_catalogue", "", pres_tool, "catalogue", pres_tool, "catalogue_index", rows=5)
+            if 0 <= pres_tool.catalogue_index < len(pres_tool.catalogue):
+                item = pres_tool.catalogue[pres_tool.catalogue_index]
+                row = layout.row()
+                row.template_icon(icon_value=get_catalogue_icon(item), scale=6)
+                col = row.column()
+                col.label(text="Frames: " + str(item.frame_start) + " - " + str(item.frame_end))
+                col.label(text="Markers: " + str(item.markers) + ", loops: " + str(item.loops))
+                col.label(text="Camera: " + (item.camera if item.cameras == 1 else str(item.cameras) + " cameras!"))
+                col.label(text="Objects: " + str(item.objects) + ", polygons: " + str(item.polygons))
+            row = layout.row()
+            row.operator("presentation.choose_from_catalogue", text="Choose Selected Component(s)")
+        row = layout.row()
         
-        if pres_tool.slides_chosen != 0:
+        if PresMenuProperties.write_status != "":
+            row.label(text=PresMenuProperties.write_status, icon='TIME')
+        elif pres_tool.slides_chosen != 0:
             row.label(text=str(pres_tool.slides_chosen) + " Component(s) chosen, but not imported")
             row = layout.row()
             row.operator("presentation.add_slide", text="Import Component(s)")
@@ -323,7 +597,18 @@ class PRESENTATION_SETTINGS_PT_panel(PresentationPanel, bpy.types.Panel):
         else:
             row.label(text=str(pres_tool.slide_count) + " Components imported")
             row = layout.row()
-        if pres_tool.slide_count != 0:
+        if pres_tool.slide_count != 0 and can_override_by_api():
+            row.prop(pres_tool, "save_before_override")
+            row = layout.row()
+            row.prop(pres_tool, "lazy_override")
+            row = layout.row()
+            row.operator("presentation.override_slides", text="Override All")
+            row.operator("presentation.override_selected", text="Override Selected")
+            row = layout.row()
+            if pres_tool.overriden is True:
+                row.label(text="Filter NLA Strips by TIMERS Collection", icon ="FILTER")
+                row = layout.row()
+        elif pres_tool.slide_count != 0:
             try:
                 if bpy.data.workspaces["Presentation"] is not None:
                     if bpy.context.window.workspace != bpy.data.workspaces["Presentation"]:
@@ -347,6 +632,72 @@ class PRESENTATION_SETTINGS_PT_panel(PresentationPanel, bpy.types.Panel):
             row = layout.row()
             row.operator("presentation.recalculate_cameras", text="Recalculate cameras")
             row = layout.row()
+            row.operator("presentation.move_component", text="Move Earlier", icon='TRIA_LEFT').direction = "EARLIER"
+            row.operator("presentation.move_component", text="Move Later", icon='TRIA_RIGHT').direction = "LATER"
+            row = layout.row()
+            row.prop(pres_tool, "layout_arrangement")
+            row.prop(pres_tool, "layout_clearance")
+            row = layout.row()
+            if pres_tool.layout_arrangement == "PATH":
+                row.prop(pres_tool, "layout_path")
+                row = layout.row()
+            row.prop(pres_tool, "layout_on_import")
+            row.operator("presentation.arrange_components", text="Arrange Components", icon='SNAP_VOLUME')
+            row = layout.row()
+            row.prop(pres_tool, "watch_components")
+            row = layout.row()
+            if pres_tool.watch_components and PresMenuProperties.watch_status != "":
+                row.label(text=PresMenuProperties.watch_status, icon='FILE_REFRESH')
+                row = layout.row()
+        if pres_tool.slide_count != 0:
+            row.prop(pres_tool, "transition_mode")
+            row = layout.row()
+            if pres_tool.transition_mode == "PRESENTER":
+                row.prop(pres_tool, "transition_easing")
+                row = layout.row()
+                row.operator("presentation.bake_presenter_camera", text="Bake Presenter Camera")
+                row = layout.row()
+
+
+class REPORT_PT_panel(PresentationPanel, bpy.types.Panel):
+    bl_label = "Resource Report"
+    bl_parent_id = "PRESENTATION_PARENT_PT_panel"
+    bl_options = {'DEFAULT_CLOSED'}
+    
+    def draw_header(self, context):
+        layout = self.layout
+        layout.label(icon= 'MEMORY')
+    
+    def draw(self, context):
+        layout = self.layout
+        scene = context.scene
+        pres_tool = scene.my_pres_tool
+        
+        row = layout.row()
+        row.label(text="Budget per component:")
+        row = layout.row()
+        row.prop(pres_tool, "budget_polygons")
+        row.prop(pres_tool, "budget_texture_mb")
+        row = layout.row()
+        row.prop(pres_tool, "budget_eval_ms")
+        row.prop(pres_tool, "report_samples")
+        row = layout.row()
+        row.operator("presentation.analyse_resources", text="Analyse Components", icon='VIEWZOOM')
+        if len(pres_tool.report) != 0:
+            row = layout.row()
+            row.prop(pres_tool, "report_sort")
+            row = layout.row()
+            row.template_list("PRESENTATION_UL_report", "", pres_tool, "report", pres_tool, "report_index", rows=6)
+            if 0 <= pres_tool.report_index < len(pres_tool.report):
+                item = pres_tool.report[pres_tool.report_index]
+                col = layout.column()
+                col.label(text="Frames: " + str(item.frame_start) + " - " + str(item.frame_end))
+                col.label(text="Objects: " + str(item.objects) + ", polygons: " + str(item.polygons) + ", materials: " + str(item.materials))
+                col.label(text="Textures: " + str(round(item.texture_mb, 1)) + " MB")
+                col.label(text="F-Curves: " + str(item.fcurves) + ", scripted drivers: " + str(item.drivers) + ", constraints: " + str(item.constraints))
+                col.label(text="Evaluation: " + str(round(item.eval_ms, 2)) + " ms per frame")
+                if item.flags != "":
+                    col.label(text="Over budget: " + item.flags, icon='ERROR')
 
 
 class PRESENTATION_RESET_PT_panel(PresentationPanel, bpy.types.Panel):
@@ -406,12 +757,94 @@ class PRESENTATION_START_PT_panel(PresentationPanel, bpy.types.Panel):
         row = layout.row()
         row.prop(pres_tool, "fullscreen")
         row = layout.row()
+        row.prop(pres_tool, "play_baked")
+        row = layout.row()
+        row.prop(pres_tool, "realtime_transitions")
+        if PresMenuProperties.transition_status != "":
+            row = layout.row()
+            row.label(text=PresMenuProperties.transition_status, icon='TIME')
+        row = layout.row()
+        row.prop(pres_tool, "culling_mode")
+        if pres_tool.culling_mode == "SLIDES":
+            row.prop(pres_tool, "culling_window")
+        #streaming and LOD need linked components, overrides stay loaded in full detail
+        overridden, total = get_override_counts(scene)
+        row = layout.row()
+        row.enabled = overridden < total or pres_tool.stream_components
+        row.prop(pres_tool, "stream_components")
+        if pres_tool.stream_components:
+            row.prop(pres_tool, "stream_window")
+        if overridden != 0:
+            row = layout.row()
+            row.label(text=str(overridden) + " of " + str(total) + " components are overridden and always loaded", icon='INFO')
+        row = layout.row()
+        row.enabled = overridden < total or pres_tool.lod_mode != "NONE"
+        row.prop(pres_tool, "lod_mode")
+        if pres_tool.lod_mode == "SLIDES":
+            row.prop(pres_tool, "lod_window")
+        elif pres_tool.lod_mode == "DISTANCE":
+            row.prop(pres_tool, "lod_distance")
+        row = layout.row()
+        if pres_tool.lod_mode != "NONE" and overridden != 0:
+            row.label(text=str(overridden) + " of " + str(total) + " components are overridden and stay in full detail", icon='INFO')
+            row = layout.row()
+        if pres_tool.lod_mode != "NONE":
+            row.prop(pres_tool, "lod_ratio")
+            row.prop(pres_tool, "lod_texture_size")
+            row = layout.row()
+            if PresMenuProperties.lod_status != "":
+                row.label(text=PresMenuProperties.lod_status, icon='TIME')
+            else:
+                row.operator("presentation.build_lod_proxies", text="Build Proxies")
+            row = layout.row()
+        row.prop(pres_tool, "play_prerendered")
+        row = layout.row()
+        if pres_tool.play_prerendered:
+            row.prop(pres_tool, "prerender_range")
+            row.prop(pres_tool, "prerender_jobs")
+            row = layout.row()
+            row.operator("presentation.prerender_deck", text="Pre-render Deck")
+            row.operator("presentation.prerender_deck", text="Re-render All").rerender_all = True
+            row = layout.row()
+        if pres_tool.play_baked:
+            row.prop(pres_tool, "bake_storage")
+            row = layout.row()
+            row.operator("presentation.bake_deck", text="Bake Deck")
+            row = layout.row()
         row.operator("presentation.start", text="START Presentation")
         row = layout.row()
         row.operator("presentation.end", text="END Presentation")
         row = layout.row()
         
         
+class EXPORT_PT_panel(PresentationPanel, bpy.types.Panel):
+    bl_label = "Video Export"
+    bl_parent_id = "PRESENTING_PARENT_PT_panel"
+    bl_options = {'DEFAULT_CLOSED'}
+    
+    def draw_header(self, context):
+        layout = self.layout
+        layout.label(icon= 'RENDER_ANIMATION')
+    
+    def draw(self, context):
+        layout = self.layout
+        scene = context.scene
+        pres_tool = scene.my_pres_tool
+        
+        row = layout.row()
+        row.prop(pres_tool, "export_path")
+        row = layout.row()
+        row.prop(pres_tool, "export_hold")
+        row.prop(pres_tool, "export_loops")
+        row = layout.row()
+        row.prop(pres_tool, "prerender_jobs")
+        row = layout.row()
+        if PresMenuProperties.export_status != "":
+            row.label(text=PresMenuProperties.export_status, icon='TIME')
+        else:
+            row.operator("presentation.export_video", text="Export Video")
+        
+        
 class NAVIGATION_PT_panel(PresentationPanel, bpy.types.Panel):
     bl_label = "Presentation Navigation"
     bl_parent_id = "PRESENTING_PARENT_PT_panel"
@@ -433,6 +866,96 @@ class NAVIGATION_PT_panel(PresentationPanel, bpy.types.Panel):
         cf.operator("wm.rotatecamdown", text="", icon='PLAY_REVERSE')
         cf.operator("wm.rotatecamup", text="", icon='PLAY')
         cf.operator("wm.jumptoend", text="", icon='FF')
+        row = layout.row(align=True)
+        row.operator("presentation.go_to_section", text="Previous Section", icon='TRIA_LEFT_BAR').direction = "PREVIOUS"
+        row.operator("presentation.go_to_section", text="Next Section", icon='TRIA_RIGHT_BAR').direction = "NEXT"
+        row = layout.row()
+        row.template_list("PRESENTATION_UL_slides", "", pres_tool, "slides", pres_tool, "slide_index_active", rows=6)
+        row = layout.row()
+        row.operator("presentation.build_slide_index", text="Rebuild Slide Index", icon='FILE_REFRESH')
+
+
+class PRESENTATION_UL_slides(bpy.types.UIList):
+    
+    def draw_item(self, context, layout, data, item, icon, active_data, active_propname, index):
+        if item.loop_end != 0:
+            icon = 'FILE_REFRESH'
+        else:
+            icon = 'MARKER'
+        row = layout.row()
+        row.label(text=item.name, icon=icon)
+        row.label(text="Section " + str(item.section+1))
+
+
+
+class PRESENTATION_UL_catalogue(bpy.types.UIList):
+    
+    def draw_item(self, context, layout, data, item, icon, active_data, active_propname, index):
+        row = layout.row()
+        row.prop(item, "selected", text="")
+        row.label(text=item.name, icon_value=get_catalogue_icon(item))
+        if item.cameras != 1:
+            row.label(text="", icon='ERROR')
+        row.label(text=str(item.frame_end - item.frame_start + 1) + " frames")
+
+
+
+class PRESENTATION_UL_template(bpy.types.UIList):
+    
+    def draw_item(self, context, layout, data, item, icon, active_data, active_propname, index):
+        if item.type == 'GPENCIL':
+            icon = 'OUTLINER_OB_GREASEPENCIL'
+        elif item.type == 'LIGHT_PROBE':
+            icon = 'OUTLINER_OB_LIGHTPROBE'
+        else:
+            icon = 'OUTLINER_OB_' + item.type
+        row = layout.row()
+        row.label(text=item.name, icon=icon)
+        row.label(text="(selected)" if item.select_get() else " ")
+        row.label(text=item.get("OBJECT TYPE", "UNASSIGNED"))
+
+    # filtered from the type registry, only again when the objects or types changed
+    def filter_items(self, context, data, propname):
+        objects = getattr(data, propname)
+        pres_tool = context.scene.my_pres_tool
+        registry = get_type_registry()
+        key = (PresMenuProperties.type_registry_version, get_id_key(data), len(objects), self.filter_name,
+               pres_tool.show_unassigned, pres_tool.template_filter)
+        cache = PresMenuProperties.template_filter_cache
+        if cache and cache[0] == key:
+            return cache[1], []
+        name_filter = self.filter_name.lower().strip("*")
+        flags = []
+        listed = []
+        for obj in objects:
+            type = registry.get(get_id_key(obj), "UNASSIGNED").split('.')[0]
+            show = (pres_tool.show_unassigned or type != "UNASSIGNED") and \
+                   (pres_tool.template_filter == "ALL" or pres_tool.template_filter == type) and \
+                   (name_filter == "" or name_filter in obj.name.lower())
+            if show:
+                listed.append(obj.name)
+            flags.append(self.bitflag_filter_item if show else 0)
+        PresMenuProperties.template_filter_cache = [key, flags, listed]
+        return flags, []
+
+
+class PRESENTATION_UL_report(bpy.types.UIList):
+    
+    def draw_item(self, context, layout, data, item, icon, active_data, active_propname, index):
+        row = layout.row()
+        row.label(text=item.name, icon='ERROR' if item.flags != "" else 'CHECKMARK')
+        row.label(text=str(item.polygons) + " polys")
+        row.label(text=str(round(item.texture_mb)) + " MB")
+        row.label(text=str(round(item.eval_ms, 1)) + " ms")
+
+    def filter_items(self, context, data, propname):
+        items = getattr(data, propname)
+        key = data.report_sort
+        if key == "frame_start":
+            order = bpy.types.UI_UL_list.sort_items_helper([(i, item.frame_start) for i, item in enumerate(items)], key=lambda x: x[1])
+        else:
+            order = bpy.types.UI_UL_list.sort_items_helper([(i, getattr(item, key)) for i, item in enumerate(items)], key=lambda x: x[1], reverse=True)
+        return [], order
 
 
 
@@ -440,6 +963,85 @@ class NAVIGATION_PT_panel(PresentationPanel, bpy.types.Panel):
 #                                               FUNCTIONS
 # -----------------------------------------------------------------------------------------------------
 
+# assigned object types, read from the objects only after they were added or removed
+# the update handler is registered by the first use, files without a template do not pay for it
+def get_type_registry():
+    if type_registry_update_handler not in bpy.app.handlers.depsgraph_update_post:
+        bpy.app.handlers.depsgraph_update_post.append(type_registry_update_handler)
+        PresMenuProperties.type_registry_dirty = True
+    if PresMenuProperties.type_registry_dirty:
+        registry = {}
+        for obj in bpy.data.objects:
+            type = obj.get("OBJECT TYPE")
+            if isinstance(type, str) and type != "UNASSIGNED":
+                registry[get_id_key(obj)] = type
+        PresMenuProperties.type_registry = registry
+        PresMenuProperties.type_registry_dirty = False
+        PresMenuProperties.type_registry_version += 1
+    return PresMenuProperties.type_registry
+
+# identity of a data-block for this session, kept by renames and never given to a new one
+# (session_uid, name and pointer in Blender versions without it)
+def get_id_key(id):
+    if hasattr(id, "session_uid"):
+        return id.session_uid
+    return (id.name, id.as_pointer())
+
+# number of objects of every type
+def get_type_counts():
+    counts = {}
+    for type in get_type_registry().values():
+        type = type.split('.')[0]
+        counts[type] = counts.get(type, 0) + 1
+    return counts
+
+def set_object_type(obj, type):
+    obj["OBJECT TYPE"] = type
+    registry = get_type_registry()
+    if type == "UNASSIGNED":
+        registry.pop(get_id_key(obj), None)
+    else:
+        registry[get_id_key(obj)] = type
+    PresMenuProperties.type_registry_version += 1
+
+# undo and redo can bring back types or objects
+@persistent
+def type_registry_handler(dummy):
+    PresMenuProperties.type_registry_dirty = True
+
+# added or removed objects relink the collections, edited types update only their objects
+@persistent
+def type_registry_update_handler(scene, depsgraph):
+    if PresMenuProperties.type_registry_dirty:
+        return
+    if depsgraph.id_type_updated('COLLECTION'):
+        PresMenuProperties.type_registry_dirty = True
+        return
+    registry = PresMenuProperties.type_registry
+    for update in depsgraph.updates:
+        if not isinstance(update.id, bpy.types.Object):
+            continue
+        obj = update.id.original
+        type = obj.get("OBJECT TYPE")
+        if not isinstance(type, str) or type == "UNASSIGNED":
+            type = None
+        if registry.get(get_id_key(obj)) != type:
+            if type is None:
+                del registry[get_id_key(obj)]
+            else:
+                registry[get_id_key(obj)] = type
+            PresMenuProperties.type_registry_version += 1
+
+def select_template_object(context, n):
+    objects = context.scene.objects
+    if 0 <= n < len(objects) and objects[n].visible_get():
+        for obj in context.selected_objects:
+            obj.select_set(False)
+        objects[n].select_set(True)
+        context.view_layer.objects.active = objects[n]
+
+#------------------------------------------------------------
+
 def getCorrectTypeName(type):
     pres_tool = bpy.context.scene.my_pres_tool
     
@@ -457,28 +1059,6 @@ def getCorrectTypeName(type):
 
 #------------------------------------------------------------
 
-def check_marker_loops():
-    pres_tool = bpy.context.scene.my_pres_tool
-    pres_tool.loops.clear()
-    last_loop_start = -1
-    markers = bpy.context.scene.timeline_markers
-    
-    m_list = []
-    for m in markers:
-        m_list.append((m.frame, m.name))
-    m_list.sort()
-    
-    for m in m_list:
-        if m[1] == "LOOP_START":
-            last_loop_start = m[0]
-            continue
-        if m[1] == "LOOP_END":
-            pres_tool.loops[m[0]] = last_loop_start
-            continue
-    return
-
-#------------------------------------------------------------
-
 # https://blender.stackexchange.com/questions/146685/how-to-obtain-the-parent-of-a-collection-using-python
 # functions to get the parent collection
 def get_parent_collection_names(collection, parent_names):
@@ -498,58 +1078,305 @@ def get_parent_collection(obj):
         
 #------------------------------------------------------------
 
+# collection of the open component file that gets linked and its cameras (same rule for import and catalogue)
+# returns (collection, None = every object goes into a new one, [camera, ...], more collections)
+def find_component_cameras():
+    component = bpy.data.collections.get("Component")
+    more_collections = False
+    if component is not None:
+        objects = list(component.objects)
+    elif len(bpy.data.collections) == 0:
+        objects = list(bpy.data.objects)
+    elif len(bpy.data.collections) == 1:
+        component = bpy.data.collections[0]
+        objects = list(component.objects)
+    else:
+        #more collections -> the one with a camera
+        more_collections = True
+        cam_obj = None
+        for obj in bpy.data.objects:
+            if obj.type == 'CAMERA':
+                cam_obj = obj
+                break
+        if cam_obj is not None:
+            component = bpy.data.collections.get(get_parent_collection(cam_obj))
+        objects = list(component.objects) if component is not None else []
+    return component, [obj for obj in objects if obj.type == 'CAMERA'], more_collections
+
+#------------------------------------------------------------
+
+# entries read by an older scan (other camera rule) are read again
+CATALOGUE_VERSION = 2
+
+# folder with the catalogue index and thumbnails of a component folder
+def get_catalogue_dir(directory):
+    return os.path.join(directory, ".presentation_catalogue")
+
+# {file name: entry} of a component folder
+def load_catalogue_index(directory):
+    try:
+        with open(os.path.join(get_catalogue_dir(directory), "index.json")) as f:
+            index = json.load(f)
+    except (OSError, ValueError):
+        index = {}
+    PresMenuProperties.catalogue_cache[directory] = index
+    return index
+
+def save_catalogue_index(directory, index):
+    with open(os.path.join(get_catalogue_dir(directory), "index.json"), "w") as f:
+        json.dump(index, f)
+    PresMenuProperties.catalogue_cache[directory] = index
+
+# up to date catalogue entry of a component file, None if it was not scanned
+def get_catalogue_entry(filepath):
+    directory, name = os.path.split(filepath)
+    index = PresMenuProperties.catalogue_cache.get(directory)
+    if index is None:
+        index = load_catalogue_index(directory)
+    entry = index.get(name)
+    try:
+        if entry is None or entry.get("version") != CATALOGUE_VERSION or entry["mtime"] != os.path.getmtime(filepath):
+            return None
+    except OSError:
+        return None
+    return entry
+
+# sha1 of a file, read again only after the file changed (like the catalogue index)
+def get_file_hash(filepath):
+    sha = get_cached_file_hash(filepath)
+    if sha is not None:
+        return sha
+    stat = os.stat(filepath)
+    sha = hashlib.sha1()
+    with open(filepath, "rb") as f:
+        for chunk in iter(lambda: f.read(1 << 20), b""):
+            sha.update(chunk)
+    PresMenuProperties.file_hashes[os.path.abspath(filepath)] = [stat.st_size, stat.st_mtime_ns, sha.hexdigest()]
+    return sha.hexdigest()
+
+# sha1 of a file if it is known for its current size and modification time, None otherwise
+def get_cached_file_hash(filepath):
+    entry = PresMenuProperties.file_hashes.get(os.path.abspath(filepath))
+    if entry is None:
+        return None
+    try:
+        stat = os.stat(filepath)
+    except OSError:
+        return None
+    if entry[0] != stat.st_size or entry[1] != stat.st_mtime_ns:
+        return None
+    return entry[2]
+
+# hashes.json of a store, shared by the presentation and the background processes
+def load_file_hashes(store):
+    try:
+        with open(os.path.join(store, "hashes.json")) as f:
+            hashes = json.load(f)
+    except (OSError, ValueError):
+        return
+    hashes.update(PresMenuProperties.file_hashes)
+    PresMenuProperties.file_hashes = hashes
+
+def save_file_hashes(store):
+    path = os.path.join(store, "hashes.json")
+    try:
+        with open(path + ".tmp", "w") as f:
+            json.dump(PresMenuProperties.file_hashes, f)
+        os.replace(path + ".tmp", path)
+    except OSError:
+        pass
+
+#------------------------------------------------------------
+
+# script for the background blender reading component files for the catalogue
+CATALOGUE_SCAN_SCRIPT = '''import bpy, importlib, json, os, sys
+with open(sys.argv[sys.argv.index("--") + 1]) as f:
+    job = json.load(f)
+sys.path.insert(0, job["script_dir"])
+plugin = importlib.import_module(job["module"])
+for path, known_hash in job["files"]:
+    name = os.path.basename(path)
+    #touched but not changed -> the presentation keeps the entry
+    file_hash = plugin.get_file_hash(path)
+    if file_hash == known_hash:
+        with open(os.path.join(job["out"], name + ".json"), "w") as f:
+            json.dump({"unchanged": True, "hash": file_hash}, f)
+        continue
+    try:
+        bpy.ops.wm.open_mainfile(filepath=path)
+        scene = bpy.context.scene
+        #the same collection and cameras the import takes
+        component, cameras, more_collections = plugin.find_component_cameras()
+        objects = list(component.all_objects) if component is not None else list(bpy.data.objects)
+        markers = sorted((m.frame, m.name) for m in scene.timeline_markers)
+        loops = 0
+        for frame, marker in markers:
+            if marker == "LOOP_END":
+                loops += 1
+        info = {"frame_start": scene.frame_start, "frame_end": scene.frame_end,
+                "markers": markers, "loops": loops,
+                "camera": cameras[0].name if len(cameras) != 0 else "", "cameras": len(cameras),
+                "objects": len(objects),
+                "polygons": sum(len(obj.data.polygons) for obj in objects if obj.type == 'MESH')}
+        if len(cameras) != 0:
+            scene.camera = cameras[0]
+            scene.frame_set(scene.frame_start)
+            render = scene.render
+            render.engine = 'BLENDER_WORKBENCH'
+            render.resolution_x = 256
+            render.resolution_y = 144
+            render.resolution_percentage = 100
+            render.image_settings.file_format = 'PNG'
+            render.filepath = os.path.join(job["out"], name + ".png")
+            try:
+                bpy.ops.render.render(write_still=True)
+                info["thumbnail"] = name + ".png"
+            except RuntimeError:
+                pass
+    except RuntimeError as e:
+        info = {"error": str(e), "cameras": 0}
+    info["hash"] = file_hash
+    with open(os.path.join(job["out"], name + ".json"), "w") as f:
+        json.dump(info, f)
+'''
+
+# read the component files in a background blender, files = [[path, hash of the old entry or None], ...]
+def start_catalogue_worker(directory, files, n):
+    job_path = os.path.join(get_catalogue_dir(directory), "job" + str(n) + ".json")
+    with open(job_path, "w") as f:
+        json.dump({"out": get_catalogue_dir(directory), "files": files, "script_dir": PresMenuProperties.script_dir,
+                   "module": os.path.splitext(os.path.basename(PresMenuProperties.script_file))[0]}, f)
+    script = os.path.join(get_catalogue_dir(directory), "scan.py")
+    with open(script, "w") as f:
+        f.write(CATALOGUE_SCAN_SCRIPT)
+    args = [bpy.app.binary_path, "--background", "--factory-startup", "--python", script, "--", job_path]
+    return subprocess.Popen(args, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+
+#------------------------------------------------------------
+
+# script for the background blender simplifying timed components into proxies
+LOD_PROXY_SCRIPT = '''import bpy, json, os, sys
+with open(sys.argv[sys.argv.index("--") + 1]) as f:
+    job = json.load(f)
+for source, out in job["files"]:
+    try:
+        bpy.ops.wm.open_mainfile(filepath=source)
+        #the proxy stands alone, without the shared base copy
+        bpy.ops.object.make_local(type='ALL')
+        depsgraph = bpy.context.evaluated_depsgraph_get()
+        for obj in list(bpy.data.objects):
+            if obj.type != 'MESH' or obj.library is not None or obj.data.shape_keys is not None:
+                continue
+            #deformed meshes would freeze in one pose
+            if any(mod.type in ('ARMATURE', 'MESH_DEFORM', 'SURFACE_DEFORM', 'HOOK') for mod in obj.modifiers):
+                continue
+            mod = obj.modifiers.new("LOD", 'DECIMATE')
+            mod.ratio = job["ratio"]
+            depsgraph.update()
+            mesh = bpy.data.meshes.new_from_object(obj.evaluated_get(depsgraph))
+            obj.modifiers.clear()
+            obj.data = mesh
+        for img in bpy.data.images:
+            w, h = img.size
+            if img.source != 'FILE' or max(w, h) <= job["size"]:
+                continue
+            scale = job["size"] / max(w, h)
+            img.scale(max(int(w * scale), 1), max(int(h * scale), 1))
+            img.pack()
+        bpy.ops.wm.save_as_mainfile(filepath=out + ".tmp", copy=True, compress=True)
+        os.replace(out + ".tmp", out)
+    except RuntimeError:
+        pass
+'''
+
+# folder of the proxies, shared like the timed copies
+def get_lod_dir():
+    return os.path.join(get_store_dir(os.path.dirname(get_presentation_dir())), "lod")
+
+# proxy file of a timed component with the current settings
+def get_lod_proxy_path(pres_tool, filepath):
+    settings = json.dumps([get_file_hash(filepath), round(pres_tool.lod_ratio, 3), pres_tool.lod_texture_size])
+    return os.path.join(get_lod_dir(), hashlib.sha1(settings.encode()).hexdigest() + ".blend")
+
+# simplify the timed components in a background blender
+def start_lod_worker(pres_tool, files, n):
+    job_path = os.path.join(get_lod_dir(), "job" + str(n) + ".json")
+    with open(job_path, "w") as f:
+        json.dump({"files": files, "ratio": pres_tool.lod_ratio, "size": pres_tool.lod_texture_size}, f)
+    script = os.path.join(get_lod_dir(), "proxy.py")
+    with open(script, "w") as f:
+        f.write(LOD_PROXY_SCRIPT)
+    args = [bpy.app.binary_path, "--background", "--factory-startup", "--python", script, "--", job_path]
+    return subprocess.Popen(args, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+
+#------------------------------------------------------------
+
+# show the catalogue index in the UI list
+def fill_catalogue_items(scene, directory, index):
+    pres_tool = scene.my_pres_tool
+    pres_tool.catalogue.clear()
+    for name in sorted(index):
+        entry = index[name]
+        item = pres_tool.catalogue.add()
+        item.name = name
+        item.filepath = os.path.join(directory, name)
+        item.frame_start = entry.get("frame_start", 0)
+        item.frame_end = entry.get("frame_end", 0)
+        item.markers = len(entry.get("markers", []))
+        item.loops = entry.get("loops", 0)
+        item.camera = entry.get("camera", "")
+        item.cameras = entry.get("cameras", 0)
+        item.objects = entry.get("objects", 0)
+        item.polygons = entry.get("polygons", 0)
+        if "thumbnail" in entry:
+            item.thumbnail = os.path.join(get_catalogue_dir(directory), entry["thumbnail"])
+    pres_tool.catalogue_index = 0
+
+# icon of the catalogue thumbnail (loaded once)
+def get_catalogue_icon(item):
+    if catalogue_previews is None or item.thumbnail == "" or not os.path.exists(item.thumbnail):
+        return 0
+    key = item.thumbnail + str(os.path.getmtime(item.thumbnail))
+    if key not in catalogue_previews:
+        catalogue_previews.load(key, item.thumbnail, 'IMAGE')
+    return catalogue_previews[key].icon_id
+
+#------------------------------------------------------------
+
 # change timing of a component        
 def change_timimg(file, time, interpolation_time, cnt, this_file):
     total_x = time
+    load_file_hashes(bpy.path.abspath(get_store_dir(os.path.dirname(this_file))))
+    key = get_timing_key(file, time, interpolation_time, cnt)
     bpy.ops.wm.open_mainfile(filepath= file)
-    more_collections = False
+    
+    #check for multiple or no cameras (same rule as the catalogue)
+    component, cameras, more_collections = find_component_cameras()
+    if len(cameras) != 1:
+        return -1, False, None
+    cam = cameras[0]
+
+    #unchanged copy for the heavy data, written once per source content whatever the timing
+    store = bpy.path.abspath(get_store_dir(os.path.dirname(this_file)))
+    base = get_base_path(store, file)
+    if not os.path.exists(os.path.dirname(base)):
+        os.makedirs(os.path.dirname(base))
+    if not os.path.exists(base):
+        bpy.ops.wm.save_as_mainfile(filepath=base + ".tmp", copy=True)
+        os.replace(base + ".tmp", base)
         
     #get collection to link ("Component")
-    try:
-        if bpy.data.collections["Component"] is not None:
-            parent_collection = "Component"
-    except:
+    if component is None:
         #no collection -> create Component collection
-        if len(bpy.data.collections.values()) == 0:
-            collection = bpy.data.collections.new(name="Component")
-            bpy.context.scene.collection.children.link(collection)
-            for obj in bpy.data.objects:
-                collection.objects.link(obj)
-                bpy.context.scene.collection.objects.unlink(obj)
-            parent_collection = "Component"
-        #one collection -> rename it to Component
-        elif len(bpy.data.collections.values()) == 1:
-            bpy.data.collections[0].name = "Component"
-            parent_collection = "Component"
-        #more collections -> take the one with a camera + warning
-        else:
-            if len(bpy.data.cameras.values()) != 0:
-                cam_obj = None
-                for obj in bpy.data.objects:
-                    if obj.type == 'CAMERA':
-                        cam_obj = obj
-                        break
-                more_collections = True
-                parent_collection = get_parent_collection(cam_obj)
-                bpy.data.collections[parent_collection].name = "Component"
-                parent_collection = "Component"
-    
-    cam = None
-    cam_found = False
-    cam_multiple = False
-    
-    #check for multiple or no cameras            
-    for obj in bpy.data.collections["Component"].objects:
-        if obj.type == 'CAMERA':
-            if cam_found is False:
-                cam = obj
-                cam_found = True
-            else:
-                cam_multiple = True
-                break
-    
-    if cam_multiple is True or cam is None:
-        return -1
+        collection = bpy.data.collections.new(name="Component")
+        bpy.context.scene.collection.children.link(collection)
+        for obj in bpy.data.objects:
+            collection.objects.link(obj)
+            bpy.context.scene.collection.objects.unlink(obj)
+    else:
+        #one collection or the one with a camera (+ warning) -> rename it to Component
+        component.name = "Component"
+    parent_collection = "Component"
     
     #rename the camera
     new_cam_name = getCorrectCameraName(cnt)
@@ -575,16 +1402,15 @@ def change_timimg(file, time, interpolation_time, cnt, this_file):
         min_x = 1
         max_x = 2
     
+    offset, marker_offset, frame_start, frame_end = get_component_timing(time, min_x, max_x, interpolation_time)
+    
     #convert object keyframes to nla strips and move them
     for obj in bpy.context.scene.objects:
         if obj.animation_data is not None:
             action = obj.animation_data.action
             if action is not None:
                 track = obj.animation_data.nla_tracks.new()
-                frame = total_x - min_x
-                if time != 1:
-                    frame += interpolation_time
-                strip = track.strips.new(action.name, action.frame_range[0] + frame, action)
+                strip = track.strips.new(action.name, action.frame_range[0] + offset, action)
                 strip.use_sync_length = True
                 obj.animation_data.action = None
     
@@ -595,21 +1421,14 @@ def change_timimg(file, time, interpolation_time, cnt, this_file):
                 action = mat.node_tree.animation_data.action
                 if action is not None:
                     track = mat.node_tree.animation_data.nla_tracks.new()
-                    frame = total_x - min_x
-                    if time != 1:
-                        frame += interpolation_time
-                    strip = track.strips.new(action.name, action.frame_range[0] + frame, action)
+                    strip = track.strips.new(action.name, action.frame_range[0] + offset, action)
                     strip.use_sync_length = True
                     mat.node_tree.animation_data.action = None
      
-    l = file.split("\\")
-    dir = ("\\").join(l[:-1])
-    name = l[-1]
-    
-    p = this_file.split("\\")
-    this_dir = ("\\").join(p[:-1])
-    this_fullname = p[-1].split(".")
-    this_name = this_fullname[0]
+    dir, name = os.path.split(file)
+    
+    this_dir, this_fullname = os.path.split(this_file)
+    this_name = this_fullname.split(".")[0]
      
     #create folder for timed components    
     if not os.path.exists(bpy.path.abspath(os.path.join(this_dir, this_name))):
@@ -633,51 +1452,142 @@ def change_timimg(file, time, interpolation_time, cnt, this_file):
     m_list = []
     markers = bpy.context.scene.timeline_markers
     for m in markers:
-        m.frame -= int(min_x)
-        m.frame += int(total_x)
-        if total_x != 1:
-            m.frame += int(interpolation_time)
+        m.frame += marker_offset
         m_list.append([int(m.frame), m.name])
     m_list.sort()
     
     #create a text file with them
     m_name = os.path.join(this_dir, this_name, "markers.txt")
-    with open(m_name, "a") as f:
-        f.write(name + ":")
-        for m in m_list:
-            if m[1] == "LOOP_START":
-                f.write("LS-")
-            if m[1] == "LOOP_END":
-                f.write("LE-")
-            f.write(str(m[0]) + ";")
-        f.write("\n")
+    write_markers_line(m_name, name, m_list)
          
     #calculate total time shift
-    diff = max_x - min_x           
-    total_x += diff
-    if time != 1:
-        total_x += interpolation_time
-                    
-    bpy.context.scene.frame_start = total_x - diff            
-    bpy.context.scene.frame_end = total_x
+    total_x = frame_end
+    bpy.context.scene.frame_start = frame_start
+    bpy.context.scene.frame_end = frame_end
     
     #create empty for better timing change
     create_slide_empty(parent_collection, name)
         
     fname = os.path.join(this_dir, this_name, name)
-    bpy.context.scene.my_pres_tool.slide_list.append([fname, parent_collection, new_cam_name])
                         
-    #save as new file in ./timed
-    bpy.ops.wm.save_as_mainfile(filepath=fname, copy=True)
+    #the timed copy keeps only what the timing changes
+    link_base_data(base)
+
+    #save into the store once, the presentation folder gets a link
+    #(written next to the presentation so the relative paths hold in every presentation folder)
+    stored = os.path.join(store, key + ".blend")
+    bpy.ops.wm.save_as_mainfile(filepath=fname + ".tmp", copy=True)
+    os.replace(fname + ".tmp", stored)
+    with open(os.path.join(store, key + ".json"), "w") as f:
+        json.dump({"total": total_x, "more_collections": more_collections, "collection": parent_collection,
+                   "camera": new_cam_name, "markers": m_list}, f)
+    link_from_store(stored, fname)
+    #known hashes of the source and the timed copy (LOD proxies) for the presentation
+    get_file_hash(fname)
+    save_file_hashes(store)
 
     
-    return total_x, more_collections
+    #chosen file is stored in the presentation file (reopened after this)
+    return total_x, more_collections, [fname, parent_collection, new_cam_name]
   
 #------------------------------------------------------------ 
 
+# shared folder of timed copies for every presentation in a folder
+def get_store_dir(this_dir):
+    return os.path.join(this_dir, ".presentation_store")
+
+# same source file with the same timing -> same timed copy
+def get_timing_key(file, time, interpolation_time, cnt):
+    timing = json.dumps([get_file_hash(file), time, interpolation_time, cnt])
+    return hashlib.sha1(timing.encode()).hexdigest()
+
+# unchanged copy of a source file, shared by all its timed copies
+def get_base_path(store, file):
+    return os.path.join(store, "base", get_file_hash(file) + ".blend")
+
+# swap the meshes, materials and images of the opened component for the ones in its base copy,
+# animated materials (retimed) and the meshes using them stay local
+def link_base_data(base):
+    materials = [m for m in bpy.data.materials if m.library is None and m.animation_data is None
+                 and (m.node_tree is None or m.node_tree.animation_data is None)]
+    meshes = [me for me in bpy.data.meshes if me.library is None and me.animation_data is None
+              and all(mat is None or mat in materials for mat in me.materials)]
+    images = [img for img in bpy.data.images if img.library is None and img.source in ('FILE', 'SEQUENCE', 'TILED')]
+    local = {"meshes": meshes, "materials": materials, "images": images}
+    with bpy.data.libraries.load(base, link=True, relative=True) as (data_from, data_to):
+        for attr, ids in local.items():
+            setattr(data_to, attr, [i.name for i in ids])
+    for attr, ids in local.items():
+        for old, linked in zip(ids, getattr(data_to, attr)):
+            if linked is not None:
+                old.user_remap(linked)
+                getattr(bpy.data, attr).remove(old)
+
+# remove the library of a component and the base copies only it used
+def remove_component_library(lib):
+    bases = [l.filepath for l in bpy.data.libraries if l.parent == lib]
+    bpy.data.libraries.remove(lib)
+    for base in [l for l in bpy.data.libraries if l.filepath in bases]:
+        users = [i for data in (bpy.data.meshes, bpy.data.materials, bpy.data.images) for i in data if i.library == base]
+        if not any(i.users for i in users):
+            bpy.data.libraries.remove(base)
+
+# hardlink the stored copy into the presentation folder, copy across drives
+def link_from_store(stored, fname):
+    if os.path.exists(fname):
+        os.remove(fname)
+    try:
+        os.link(stored, fname)
+    except OSError:
+        shutil.copyfile(stored, fname)
+
+# markers of one component for the import
+def write_markers_line(m_name, name, m_list):
+    with open(m_name, "a") as f:
+        f.write(name + ":")
+        for m in m_list:
+            if m[1] == "LOOP_START":
+                f.write("LS-")
+            if m[1] == "LOOP_END":
+                f.write("LE-")
+            f.write(str(m[0]) + ";")
+        f.write("\n")
+
+# change_timimg result from the store without opening the file, None if not stored yet
+# cached_only -> None also when the source would have to be hashed first (the background process does it)
+def use_stored_timing(file, time, interpolation_time, cnt, this_file, cached_only=False):
+    this_dir, this_fullname = os.path.split(this_file)
+    this_name = this_fullname.split(".")[0]
+    store = bpy.path.abspath(get_store_dir(this_dir))
+    load_file_hashes(store)
+    if cached_only and get_cached_file_hash(file) is None:
+        return None
+    key = get_timing_key(file, time, interpolation_time, cnt)
+    try:
+        with open(os.path.join(store, key + ".json")) as f:
+            meta = json.load(f)
+    except (OSError, ValueError):
+        return None
+    stored = os.path.join(store, key + ".blend")
+    if not os.path.exists(stored):
+        return None
+    name = os.path.basename(file)
+    timed_dir = bpy.path.abspath(os.path.join(this_dir, this_name))
+    if not os.path.exists(timed_dir):
+        os.makedirs(timed_dir)
+    fname = os.path.join(this_dir, this_name, name)
+    link_from_store(stored, fname)
+    write_markers_line(os.path.join(this_dir, this_name, "markers.txt"), name, meta["markers"])
+    return meta["total"], meta["more_collections"], [fname, meta["collection"], meta["camera"]]
+
+#------------------------------------------------------------ 
+
 #converts all to nla strips
 def convert_all_to_nla():
     for obj in bpy.context.scene.objects:
+        #presenter camera keeps its baked action
+        if obj.name == "=> PRESENTER CAMERA":
+            continue
         if obj.animation_data is not None:
             action = obj.animation_data.action
             if action is not None:
@@ -773,133 +1683,2488 @@ def getCorrectCameraName(cnt):
 # setup camera transition inbetween components
 def create_camera_change(i, max_frame, min_frame, n_tmp):
     pres_tool = bpy.context.scene.my_pres_tool
-    
-    if i == 0:
-        if n_tmp != 0:
-            #setup camera for slide after already imported
-            n = i + n_tmp
-            marker = bpy.context.scene.timeline_markers.new(name="SLIDE " + str(n) + " START", frame=min_frame)
-            cam_name = getCorrectCameraName(n)
-            marker.camera = bpy.context.scene.objects.get(cam_name)
-            pres_tool.camera_objects.append(marker.camera)
-        else:
-            #setup camera for first slide
-            marker = bpy.context.scene.timeline_markers.new(name="SLIDE 0 START", frame=1)
-            marker.camera = bpy.context.scene.objects.get("=> CAMERA")
-            pres_tool.camera_objects.append(marker.camera)
-            
-    if n_tmp != 0:
-        i += n_tmp
-        
-    if i != pres_tool.slide_count-1:
-        #set camera interpolation time
-        if pres_tool.interpolate_camera is True:
-            interpolation_time = bpy.context.scene.render.fps * pres_tool.transition_time
-        else:
-            interpolation_time = 1
-
-        # create markers  
-        marker_frame = max_frame + interpolation_time
-        marker = bpy.context.scene.timeline_markers.new(name="SLIDE " + str(i) + " START", frame=marker_frame)
-        cam_name = getCorrectCameraName(i)
-        cam_next_name = getCorrectCameraName(i+1)
-        marker.camera = bpy.context.scene.objects.get(cam_next_name)
-        pres_tool.camera_objects.append(marker.camera)
-        # create camera constraints
-        const_loc = bpy.data.objects[cam_name].constraints.new('COPY_LOCATION')
-        const_rot = bpy.data.objects[cam_name].constraints.new('COPY_ROTATION')
-        const_scl = bpy.data.objects[cam_name].constraints.new('COPY_SCALE')
-        const_loc.target = bpy.data.objects[cam_next_name]
-        const_rot.target = bpy.data.objects[cam_next_name]
-        const_scl.target = bpy.data.objects[cam_next_name]
-        const_loc.influence = 0
-        const_rot.influence = 0
-        const_scl.influence = 0
-        bpy.data.objects[cam_name].keyframe_insert(data_path='constraints["Copy Location"].influence', frame=max_frame)
-        bpy.data.objects[cam_name].keyframe_insert(data_path='constraints["Copy Rotation"].influence', frame=max_frame)
-        bpy.data.objects[cam_name].keyframe_insert(data_path='constraints["Copy Scale"].influence', frame=max_frame)
-        const_loc.influence = 1
-        const_rot.influence = 1
-        const_scl.influence = 1
-        marker_frame = max_frame + interpolation_time
-        bpy.data.objects[cam_name].keyframe_insert(data_path='constraints["Copy Location"].influence', frame=marker_frame)
-        bpy.data.objects[cam_name].keyframe_insert(data_path='constraints["Copy Rotation"].influence', frame=marker_frame)
-        bpy.data.objects[cam_name].keyframe_insert(data_path='constraints["Copy Scale"].influence', frame=marker_frame)
-    
-    return
+    markers, transition = get_camera_change(i, n_tmp, pres_tool.slide_count, max_frame, min_frame, get_interpolation_time())
+    for name, frame, n in markers:
+        marker = bpy.context.scene.timeline_markers.new(name=name, frame=frame)
+        marker.camera = bpy.context.scene.objects.get(getCorrectCameraName(n))
+    #presenter camera -> transitions are baked later, no constraints
+    if transition is None or pres_tool.transition_mode == "PRESENTER":
+        return
+    # create camera constraints
+    n, n_next, frame_from, frame_to = transition
+    add_camera_transition(bpy.data.objects[getCorrectCameraName(n)], bpy.data.objects[getCorrectCameraName(n_next)], frame_from, frame_to)
 
 #------------------------------------------------------------
 
-# scale image to fit the camera
-def normalizeImageDimensions(img_obj, max_y, i):
-    #set width to 1
-    orig_dim = img_obj.dimensions
-    coef = 1/orig_dim[0]
-    y_dim = orig_dim[1]*coef
-    #set heigth to 1
-    if y_dim > 1:
-        coef_y = 1/y_dim
-        img_obj.dimensions = orig_dim[0]*coef*coef_y, orig_dim[1]*coef*coef_y, orig_dim[2]
-        if i == 0:
-            max_y = orig_dim[1]*coef*coef_y
-        if orig_dim[1]*coef > max_y:
-            max_y = orig_dim[1]*coef*coef_y
-    else:
-        img_obj.dimensions = orig_dim[0]*coef, orig_dim[1]*coef, orig_dim[2]
-        if i == 0:
-            max_y = orig_dim[1]*coef
-        if orig_dim[1]*coef > max_y:
-            max_y = orig_dim[1]*coef      
-    return max_y 
+# create the transition constraints of a camera, if they are missing
+def ensure_transition_constraints(cam, target):
+    constraints = []
+    for name, type in [("Copy Location", 'COPY_LOCATION'), ("Copy Rotation", 'COPY_ROTATION'), ("Copy Scale", 'COPY_SCALE')]:
+        constr = cam.constraints.get(name)
+        if constr is None:
+            constr = cam.constraints.new(type)
+            constr.influence = 0
+        constr.target = target
+        constraints.append(constr)
+    return constraints
 
+#------------------------------------------------------------
 
-# -----------------------------------------------------------------------------------------------------
-#                                             HANDLERS
-# -----------------------------------------------------------------------------------------------------
-        
-# called every time the frame changes
-def presentation_handler(scene):
-    frame_current = bpy.context.scene.frame_current
-    markers = bpy.context.scene.timeline_markers
+# camera flies to the target camera between the two frames
+def add_camera_transition(cam, target, frame_from, frame_to):
+    constraints = ensure_transition_constraints(cam, target)
+    for constr in constraints:
+        constr.influence = 0
+        cam.keyframe_insert(data_path='constraints["' + constr.name + '"].influence', frame=frame_from)
+    for constr in constraints:
+        constr.influence = 1
+        cam.keyframe_insert(data_path='constraints["' + constr.name + '"].influence', frame=frame_to)
+
+#------------------------------------------------------------
+
+# length of the camera transition in frames
+def get_interpolation_time():
     pres_tool = bpy.context.scene.my_pres_tool
-    
-    check_marker_loops()
-    
-    for m in markers:
-        if m.frame == frame_current:
-            if m.name == "LOOP_START":
-                bpy.ops.screen.animation_cancel()
-                bpy.context.scene.frame_current = m.frame
-            elif m.name == "LOOP_END":
-                loop_start = pres_tool.loops[m.frame]
-                bpy.context.scene.frame_current = loop_start+1
-            else:
-                bpy.ops.screen.animation_cancel()
-                bpy.context.scene.frame_current = m.frame
+    if pres_tool.interpolate_camera is True:
+        return bpy.context.scene.render.fps * pres_tool.transition_time
+    return 1
+
+#------------------------------------------------------------
 
+# remove the transition constraints from a camera, returns False if it had none
+def remove_camera_constraints(cam):
+    removed = False
+    for name in ["Copy Location", "Copy Rotation", "Copy Scale"]:
+        constr = cam.constraints.get(name)
+        if constr is not None:
+            cam.constraints.remove(constr)
+            removed = True
+    #remove the influence keyframes too
+    if cam.animation_data is not None and cam.animation_data.action is not None:
+        action = cam.animation_data.action
+        for fcurve in list(action.fcurves):
+            if fcurve.data_path.startswith('constraints["Copy '):
+                action.fcurves.remove(fcurve)
+    return removed
 
 #------------------------------------------------------------
 
-# called every time the scene or nla or anything changes
-@persistent
-def nla_handler(scene):
-    pres_tool = bpy.context.scene.my_pres_tool
-    for obj in bpy.context.scene.objects:
-        if "COMPONENT TIMER" in obj.name:
-            nla_name = obj.animation_data.nla_tracks[0].strips[0].name
-            nla_start = obj.animation_data.nla_tracks[0].strips[0].frame_start
-            nla_end = obj.animation_data.nla_tracks[0].strips[0].frame_end
-            nla_len = nla_end - nla_start
-            if nla_name != '':
-                #strip moved -> update strips, markers and drivers
-                if pres_tool.nla_strips[nla_name][0] != nla_start:
-                    
-                    #strip snapping while overlaping
-                    #problem when strips contain one another after -> strip is scaled and unusable
-                    """
-                    if len(bpy.context.selected_nla_strips) == 1:
-                        #snap
-                        restart = True
+# get the presenter camera, create it from the first component camera if needed
+def get_presenter_camera(scene, template_cam=None):
+    presenter = scene.objects.get("=> PRESENTER CAMERA")
+    if presenter is not None:
+        return presenter
+    if template_cam is not None:
+        cam_data = template_cam.data.copy()
+    else:
+        cam_data = bpy.data.cameras.new("=> PRESENTER CAMERA")
+    cam_data.name = "=> PRESENTER CAMERA"
+    presenter = bpy.data.objects.new("=> PRESENTER CAMERA", cam_data)
+    presenter.rotation_mode = 'QUATERNION'
+    scene.collection.objects.link(presenter)
+    return presenter
+
+#------------------------------------------------------------
+
+# sorted list of [frame, camera] from the camera markers (component starts)
+def get_camera_stops(scene):
+    stops = []
+    presenter = scene.objects.get("=> PRESENTER CAMERA")
+    #markers are bound to the presenter camera -> use the remembered cameras
+    if presenter is not None and presenter.get("CAMERA BINDINGS"):
+        for name, frame, cam_name in json.loads(presenter["CAMERA BINDINGS"]):
+            cam = scene.objects.get(cam_name)
+            if cam is not None:
+                stops.append([frame, cam])
+    else:
+        for m in scene.timeline_markers:
+            if m.camera is not None and m.camera != presenter:
+                stops.append([m.frame, m.camera])
+    stops.sort(key=lambda s: s[0])
+    return stops
+
+#------------------------------------------------------------
+
+# is the camera moving inside its component
+def is_camera_animated(cam):
+    obj = cam
+    while obj is not None:
+        if obj.animation_data is not None:
+            anim = obj.animation_data
+            if anim.action is not None or len(anim.nla_tracks) != 0 or len(anim.drivers) != 0:
+                return True
+        obj = obj.parent
+    return False
+
+#------------------------------------------------------------
+
+# remove the plug-in frame handlers while sampling frames, returns the removed ones
+def suspend_frame_handlers():
+    handlers = []
+    for h in [baked_camera_handler]:
+        if h in bpy.app.handlers.frame_change_pre:
+            bpy.app.handlers.frame_change_pre.remove(h)
+            handlers.append(h)
+    return handlers
+
+def resume_frame_handlers(handlers):
+    for h in handlers:
+        if h not in bpy.app.handlers.frame_change_pre:
+            bpy.app.handlers.frame_change_pre.append(h)
+
+#------------------------------------------------------------
+
+# write sampled values as keyframes in one go
+def write_fcurve(action, data_path, index, frames, values, interpolations):
+    fcurve = action.fcurves.new(data_path, index=index)
+    fcurve.keyframe_points.add(len(frames))
+    co = []
+    for f, v in zip(frames, values):
+        co.append(f)
+        co.append(v)
+    fcurve.keyframe_points.foreach_set("co", co)
+    for point, interpolation in zip(fcurve.keyframe_points, interpolations):
+        point.interpolation = interpolation
+        point.easing = 'EASE_IN_OUT'
+        point.handle_left_type = 'AUTO_CLAMPED'
+        point.handle_right_type = 'AUTO_CLAMPED'
+    fcurve.update()
+    return fcurve
+
+#------------------------------------------------------------
+
+# bake all camera transitions onto one presenter camera
+# only the segments of animated cameras are sampled per frame,
+# static cameras need just two keyframes per component
+def bake_presenter_camera(scene):
+    pres_tool = scene.my_pres_tool
+    stops = get_camera_stops(scene)
+    if len(stops) == 0:
+        return None
+    presenter = get_presenter_camera(scene, stops[0][1])
+    interpolation_time = int(round(get_interpolation_time()))
+
+    #frame handlers would jump around the loops while sampling
+    handlers = suspend_frame_handlers()
+    frame_current = scene.frame_current
+
+    #samples = [[frame, location, rotation, scale, lens, interpolation], ...]
+    samples = []
+    last_rot = None
+    for i, (frame, cam) in enumerate(stops):
+        if i != len(stops)-1:
+            seg_end = max(frame, stops[i+1][0] - interpolation_time)
+            seg_interpolation = pres_tool.transition_easing
+        else:
+            seg_end = max(frame, scene.frame_end)
+            seg_interpolation = 'LINEAR'
+        if is_camera_animated(cam):
+            frames = list(range(frame, seg_end+1))
+        elif seg_end != frame:
+            frames = [frame, seg_end]
+        else:
+            frames = [frame]
+        for f in frames:
+            scene.frame_set(f)
+            loc, rot, scl = cam.matrix_world.decompose()
+            #keep the quaternions in the same hemisphere -> shortest rotation
+            if last_rot is not None and last_rot.dot(rot) < 0:
+                rot.negate()
+            last_rot = rot
+            samples.append([f, loc, rot, scl, cam.data.lens, 'LINEAR'])
+        #the last sample of the component starts the transition
+        samples[-1][5] = seg_interpolation
+
+    scene.frame_set(frame_current)
+    resume_frame_handlers(handlers)
+
+    #replace the old bake
+    presenter.rotation_mode = 'QUATERNION'
+    presenter.animation_data_create()
+    presenter.data.animation_data_create()
+    for name in ["PRESENTER CAMERA ACTION", "PRESENTER LENS ACTION"]:
+        old_action = bpy.data.actions.get(name)
+        if old_action is not None:
+            bpy.data.actions.remove(old_action)
+    action = bpy.data.actions.new("PRESENTER CAMERA ACTION")
+    action.use_fake_user = True
+    presenter.animation_data.action = action
+    lens_action = bpy.data.actions.new("PRESENTER LENS ACTION")
+    lens_action.use_fake_user = True
+    presenter.data.animation_data.action = lens_action
+
+    frames = [s[0] for s in samples]
+    interpolations = [s[5] for s in samples]
+    for index in range(3):
+        write_fcurve(action, "location", index, frames, [s[1][index] for s in samples], interpolations)
+        write_fcurve(action, "scale", index, frames, [s[3][index] for s in samples], interpolations)
+    for index in range(4):
+        write_fcurve(action, "rotation_quaternion", index, frames, [s[2][index] for s in samples], interpolations)
+    write_fcurve(lens_action, "lens", 0, frames, [s[4] for s in samples], interpolations)
+
+    #timing of the bake, a different one means the bake is stale
+    presenter["TIMING SIGNATURE"] = get_timing_signature(scene)
+    return presenter
+
+# presenter camera baked for the current timing, baked again after imports or moved timers
+def ensure_presenter_bake(scene):
+    presenter = scene.objects.get("=> PRESENTER CAMERA")
+    if presenter is None or bpy.data.actions.get("PRESENTER CAMERA ACTION") is None \
+            or presenter.get("TIMING SIGNATURE") != get_timing_signature(scene):
+        bake_presenter_camera(scene)
+        presenter = scene.objects.get("=> PRESENTER CAMERA")
+    return presenter
+
+#------------------------------------------------------------
+
+# point all camera markers to the presenter camera, remember the original cameras
+def bind_presenter_camera(scene):
+    presenter = scene.objects.get("=> PRESENTER CAMERA")
+    if presenter is None:
+        return
+    bindings = []
+    for m in scene.timeline_markers:
+        if m.camera is not None and m.camera != presenter:
+            bindings.append([m.name, m.frame, m.camera.name])
+            m.camera = presenter
+    if len(bindings) != 0:
+        presenter["CAMERA BINDINGS"] = json.dumps(bindings)
+    scene.camera = presenter
+
+#------------------------------------------------------------
+
+# give the markers their component cameras back
+def unbind_presenter_camera(scene):
+    presenter = scene.objects.get("=> PRESENTER CAMERA")
+    if presenter is None or not presenter.get("CAMERA BINDINGS"):
+        return
+    bindings = json.loads(presenter["CAMERA BINDINGS"])
+    for m in scene.timeline_markers:
+        if m.camera != presenter:
+            continue
+        for name, frame, cam_name in bindings:
+            if m.name == name and m.frame == frame:
+                m.camera = scene.objects.get(cam_name)
+                break
+    del presenter["CAMERA BINDINGS"]
+    if len(bindings) != 0:
+        scene.camera = scene.objects.get(bindings[0][2])
+
+#------------------------------------------------------------
+
+# folder for the timed components of this presentation
+def get_presentation_dir():
+    this_dir, this_fullname = os.path.split(bpy.path.abspath(bpy.data.filepath))
+    this_name = os.path.splitext(this_fullname)[0]
+    return os.path.join(this_dir, this_name)
+
+#------------------------------------------------------------
+
+# hash of everything the camera path depends on
+def get_timing_signature(scene):
+    pres_tool = scene.my_pres_tool
+    items = [scene.frame_start, scene.frame_end, scene.render.fps, pres_tool.transition_time,
+             pres_tool.interpolate_camera, pres_tool.transition_mode, pres_tool.transition_easing]
+    for m in sorted(scene.timeline_markers, key=lambda m: (m.frame, m.name)):
+        items.append((m.name, m.frame))
+    for frame, cam in get_camera_stops(scene):
+        items.append((frame, cam.name))
+    timers = []
+    for obj in scene.objects:
+        if "COMPONENT TIMER" in obj.name and obj.animation_data is not None:
+            strip = obj.animation_data.nla_tracks[0].strips[0]
+            timers.append((strip.name, strip.frame_start, strip.frame_end))
+    timers.sort()
+    items.extend(timers)
+    return hashlib.sha1(repr(items).encode()).hexdigest()
+
+#------------------------------------------------------------
+
+# location (3), rotation quaternion (4), scale (3), lens (1) per frame
+BAKE_STRIDE = 11
+
+# sample the whole camera path once into a frame -> transform table
+def bake_deck(scene):
+    pres_tool = scene.my_pres_tool
+    table = array('f')
+
+    #frame handlers would jump around the loops while sampling
+    handlers = suspend_frame_handlers()
+    frame_current = scene.frame_current
+
+    last_rot = None
+    for f in range(scene.frame_start, scene.frame_end+1):
+        scene.frame_set(f)
+        cam = scene.camera
+        if cam is None:
+            table.extend([0.0] * BAKE_STRIDE)
+            continue
+        loc, rot, scl = cam.matrix_world.decompose()
+        if last_rot is not None and last_rot.dot(rot) < 0:
+            rot.negate()
+        last_rot = rot
+        table.extend(loc)
+        table.extend(rot)
+        table.extend(scl)
+        table.append(cam.data.lens)
+
+    scene.frame_set(frame_current)
+    resume_frame_handlers(handlers)
+
+    bake = {"signature": get_timing_signature(scene), "frame_start": scene.frame_start}
+    if pres_tool.bake_storage == "SIDECAR":
+        bake_dir = get_presentation_dir()
+        if not os.path.exists(bake_dir):
+            os.makedirs(bake_dir)
+        bake["sidecar"] = os.path.join(bake_dir, "camera_bake.bin")
+        with open(bake["sidecar"], "wb") as f:
+            table.tofile(f)
+    else:
+        bake["table"] = table.tolist()
+    scene["PRESENTATION BAKE"] = bake
+    PresMenuProperties.camera_bake = [scene.frame_start, table]
+    return table
+
+#------------------------------------------------------------
+
+# load the baked camera path, None if missing or out of date
+def load_deck_bake(scene):
+    bake = scene.get("PRESENTATION BAKE")
+    if bake is None or bake["signature"] != get_timing_signature(scene):
+        return None
+    table = array('f')
+    if "sidecar" in bake:
+        try:
+            with open(bake["sidecar"], "rb") as f:
+                table.frombytes(f.read())
+        except OSError:
+            return None
+    else:
+        table.extend(bake["table"])
+    PresMenuProperties.camera_bake = [bake["frame_start"], table]
+    return table
+
+#------------------------------------------------------------
+
+# throw the baked camera path away after a timing change
+def invalidate_deck_bake(scene):
+    PresMenuProperties.camera_bake = []
+    PresMenuProperties.slide_index_dirty = True
+    if scene.get("PRESENTATION BAKE") is not None:
+        del scene["PRESENTATION BAKE"]
+
+#------------------------------------------------------------
+
+# mute the transition constraints, the baked path already contains them
+def mute_camera_constraints(scene, mute):
+    for frame, cam in get_camera_stops(scene):
+        for name in ["Copy Location", "Copy Rotation", "Copy Scale"]:
+            constr = cam.constraints.get(name)
+            if constr is not None:
+                constr.mute = mute
+
+#------------------------------------------------------------
+
+# switch the presenter camera between its baked action and the table
+def use_presenter_actions(presenter, use):
+    presenter.animation_data_create()
+    presenter.data.animation_data_create()
+    if use:
+        presenter.animation_data.action = bpy.data.actions.get("PRESENTER CAMERA ACTION")
+        presenter.data.animation_data.action = bpy.data.actions.get("PRESENTER LENS ACTION")
+    else:
+        presenter.animation_data.action = None
+        presenter.data.animation_data.action = None
+
+#------------------------------------------------------------
+
+# folder with the pre-rendered frames of this presentation
+def get_prerender_dir():
+    return os.path.join(get_presentation_dir(), "prerender")
+
+def get_prerender_path(frame):
+    return os.path.join(get_prerender_dir(), "frame_" + str(frame).zfill(5) + ".png")
+
+#------------------------------------------------------------
+
+# frames to pre-render, every frame or only the stops and loops
+def get_prerender_frames(scene):
+    if scene.my_pres_tool.prerender_range == "ALL":
+        return list(range(scene.frame_start, scene.frame_end+1))
+    stops, loops = get_stop_list(scene)
+    frames = set(stops)
+    for start, end in loops:
+        frames.update(range(start, end+1))
+    return sorted(f for f in frames if scene.frame_start <= f <= scene.frame_end)
+
+#------------------------------------------------------------
+
+# path and modification time of the component .blend file
+def get_component_file_stamp(comp):
+    filename = comp["name"].split(" TIMER STRIP")[0]
+    for lib in bpy.data.libraries:
+        path = bpy.path.abspath(lib.filepath)
+        if os.path.basename(path) == filename:
+            try:
+                return (path, os.path.getmtime(path))
+            except OSError:
+                return (path, None)
+    return None
+
+# values that change between frames or sessions without changing the render
+STAMP_SKIP = {"rna_type", "session_uid", "users", "tag", "is_evaluated", "is_runtime_data", "is_editmode",
+              "is_from_instancer", "is_from_set", "matrix_world", "matrix_local", "matrix_basis",
+              "bound_box", "dimensions", "hide_viewport", "hide_select", "select"}
+
+# rounded values of a float, vector, matrix or set, comparable between sessions
+def get_stamp_value(value):
+    if isinstance(value, float):
+        return round(value, 5)
+    if value is None or isinstance(value, (str, int, bool)):
+        return value
+    if isinstance(value, set):
+        return sorted(value)
+    try:
+        return [get_stamp_value(v) for v in value]
+    except TypeError:
+        return str(value)
+
+# plain RNA values of a struct, pointers and collections are left out
+def get_rna_values(data, skip=()):
+    values = []
+    for prop in data.bl_rna.properties:
+        name = prop.identifier
+        if prop.type in ('POINTER', 'COLLECTION') or name in STAMP_SKIP or name in skip:
+            continue
+        try:
+            values.append((name, get_stamp_value(getattr(data, name))))
+        except (AttributeError, TypeError):
+            continue
+    return values
+
+# keyframes of the actions an ID plays, and the animated data paths
+def get_animation_values(anim):
+    values = []
+    paths = set()
+    if anim is None:
+        return values, paths
+    actions = [anim.action]
+    for track in anim.nla_tracks:
+        for strip in track.strips:
+            values.append((strip.name, strip.frame_start, strip.frame_end, strip.mute))
+            actions.append(strip.action)
+    for action in actions:
+        if action is None:
+            continue
+        for fcurve in action.fcurves:
+            paths.add(fcurve.data_path)
+            values.append((fcurve.data_path, fcurve.array_index,
+                           [get_stamp_value([p.co, p.handle_left, p.handle_right, p.interpolation]) for p in fcurve.keyframe_points]))
+    return values, paths
+
+# values of an ID, animated values as their keyframes (the same on every frame)
+def get_id_values(data):
+    animation, paths = get_animation_values(getattr(data, "animation_data", None))
+    return [data.name_full, get_rna_values(data, paths), animation]
+
+# material and world node values
+def get_node_tree_values(tree):
+    if tree is None:
+        return None
+    animation, paths = get_animation_values(tree.animation_data)
+    values = [animation]
+    for node in tree.nodes:
+        values.append(get_rna_values(node))
+        for i, socket in enumerate(node.inputs):
+            if hasattr(socket, "default_value") and 'nodes["' + node.name + '"].inputs[' + str(i) + '].default_value' not in paths:
+                values.append(get_stamp_value(socket.default_value))
+    for link in tree.links:
+        values.append((link.from_node.name, link.from_socket.identifier, link.to_node.name, link.to_socket.identifier))
+    return values
+
+# everything of an object the render depends on (transform, data, modifiers, materials)
+def get_object_values(obj, materials):
+    values = [get_id_values(obj), [get_rna_values(m) for m in obj.modifiers]]
+    if obj.data is not None:
+        values.append(get_id_values(obj.data))
+        if isinstance(obj.data, bpy.types.Mesh):
+            coords = array('f', [0.0]) * (len(obj.data.vertices) * 3)
+            obj.data.vertices.foreach_get("co", coords)
+            values.append((len(obj.data.polygons), hashlib.sha1(coords.tobytes()).hexdigest()))
+    for slot in obj.material_slots:
+        mat = slot.material
+        if mat is None:
+            continue
+        if mat.name_full not in materials:
+            materials[mat.name_full] = [get_id_values(mat), get_node_tree_values(mat.node_tree)]
+        values.append(materials[mat.name_full])
+    return values
+
+# stamp of a component as it is stored in this file (instance placement and overrides)
+def get_component_main_stamp(comp, materials):
+    instance = comp["instance"]
+    if instance is None:
+        return None
+    values = [get_id_values(instance)]
+    override = get_component_override(instance.instance_collection) if instance.instance_collection is not None else None
+    if override is not None:
+        for obj in sorted(override.all_objects, key=lambda o: o.name_full):
+            values.append(get_object_values(obj, materials))
+    return hashlib.sha1(repr(values).encode()).hexdigest()
+
+# stamp of what the presentation file adds to every frame (world, lights, other objects, visibility)
+def get_scene_main_stamp(scene, components, materials):
+    skip = set()
+    for comp in components:
+        if comp["instance"] is not None:
+            skip.add(comp["instance"].name_full)
+            col = comp["instance"].instance_collection
+            override = get_component_override(col) if col is not None else None
+            if override is not None:
+                skip.update(obj.name_full for obj in override.all_objects)
+    values = []
+    if scene.world is not None:
+        values.append([get_id_values(scene.world), get_node_tree_values(scene.world.node_tree)])
+    for obj in sorted(scene.objects, key=lambda o: o.name_full):
+        #cameras are in the baked path, timers and the screen are not rendered
+        if obj.name_full in skip or obj.type == 'CAMERA' or "COMPONENT TIMER" in obj.name or obj.name.startswith("PRERENDER"):
+            continue
+        values.append(get_object_values(obj, materials))
+    for col in sorted(bpy.data.collections, key=lambda c: c.name_full):
+        values.append((col.name_full, col.hide_render))
+    layers = [scene.view_layers[0].layer_collection] if len(scene.view_layers) != 0 else []
+    while layers:
+        layer = layers.pop()
+        values.append((layer.name, layer.exclude, layer.holdout, layer.indirect_only))
+        layers += list(layer.children)
+    return hashlib.sha1(repr(values).encode()).hexdigest()
+
+# hash of everything one frame depends on (camera, components on screen, edits in this file, render settings)
+# None if the camera path is not baked yet
+def get_prerender_keys(scene, frames):
+    table = load_deck_bake(scene)
+    if table is None:
+        return None
+    render = scene.render
+    settings = [render.engine, render.resolution_x, render.resolution_y,
+                render.resolution_percentage, render.film_transparent]
+    components = get_components(scene)
+    starts = [c["start"] for c in components]
+    materials = {}
+    settings.append(get_scene_main_stamp(scene, components, materials))
+    stamps = {}
+    keys = {}
+    for f in frames:
+        o = (f - scene.frame_start) * BAKE_STRIDE
+        items = list(settings)
+        items.append([round(v, 5) for v in table[o:o+BAKE_STRIDE]])
+        #component on screen and the next one (transition)
+        i = max(bisect.bisect_right(starts, f) - 1, 0)
+        for n in range(i, min(i+2, len(components))):
+            comp = components[n]
+            if n not in stamps:
+                stamps[n] = get_component_main_stamp(comp, materials)
+            items.append((comp["name"], comp["start"], comp["end"], get_component_file_stamp(comp), stamps[n]))
+        keys[str(f)] = hashlib.sha1(repr(items).encode()).hexdigest()
+    return keys
+
+#------------------------------------------------------------
+
+# frame -> key of the finished pre-rendered frames
+def load_prerender_manifest():
+    try:
+        with open(os.path.join(get_prerender_dir(), "prerender.json")) as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+def save_prerender_manifest(manifest):
+    with open(os.path.join(get_prerender_dir(), "prerender.json"), "w") as f:
+        json.dump(manifest, f)
+
+# frames without an up to date pre-rendered image
+def get_prerender_missing(frames, keys, manifest):
+    return [f for f in frames if manifest.get(str(f)) != keys[str(f)] or not os.path.exists(get_prerender_path(f))]
+
+#------------------------------------------------------------
+
+# keys, manifest and the frames to render, old images of those frames are removed
+def prepare_prerender(scene, frames, rerender_all=False):
+    if not os.path.exists(get_prerender_dir()):
+        os.makedirs(get_prerender_dir())
+    unbind_presenter_camera(scene)
+    if load_deck_bake(scene) is None:
+        bake_deck(scene)
+    keys = get_prerender_keys(scene, frames)
+    manifest = {} if rerender_all else load_prerender_manifest()
+    missing = get_prerender_missing(frames, keys, manifest)
+    #old images would pass for finished ones
+    for f in missing:
+        manifest.pop(str(f), None)
+        if os.path.exists(get_prerender_path(f)):
+            os.remove(get_prerender_path(f))
+    save_prerender_manifest(manifest)
+    return keys, manifest, missing
+
+# copy of the deck with the slideshow cameras for the background processes
+def save_prerender_copy(scene):
+    if scene.my_pres_tool.transition_mode == "PRESENTER":
+        presenter = ensure_presenter_bake(scene)
+        if presenter is not None:
+            use_presenter_actions(presenter, True)
+            bind_presenter_camera(scene)
+    blend_path = os.path.join(get_prerender_dir(), "prerender.blend")
+    bpy.ops.wm.save_as_mainfile(filepath=blend_path, copy=True)
+    unbind_presenter_camera(scene)
+    return blend_path
+
+#------------------------------------------------------------
+
+# "1-5,8,10-12" for the blender command line
+def get_frame_ranges(frames):
+    ranges = []
+    start = prev = frames[0]
+    for f in frames[1:] + [None]:
+        if f is not None and f == prev + 1:
+            prev = f
+            continue
+        ranges.append(str(start) if start == prev else str(start) + "-" + str(prev))
+        start = prev = f
+    return ",".join(ranges)
+
+# render the frames in a background blender process (CPU)
+def start_prerender_worker(blend_path, scene, frames):
+    expr = "import bpy\nscene = bpy.context.scene\nif scene.render.engine == 'CYCLES':\n    scene.cycles.device = 'CPU'"
+    args = [bpy.app.binary_path, "--background", blend_path, "--scene", scene.name,
+            "--python-expr", expr,
+            "--render-output", os.path.join(get_prerender_dir(), "frame_#####"),
+            "--render-format", "PNG", "--use-extension", "1",
+            "--render-frame", get_frame_ranges(frames)]
+    return subprocess.Popen(args, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+
+#------------------------------------------------------------
+
+# [first frame, last frame, repeats] of the video, stops held and loops unrolled
+def get_export_edit_list(scene, hold, loop_count):
+    stops, loops = get_stop_list(scene)
+    loop_starts = {l[0]: l for l in loops}
+    edits = []
+    start = scene.frame_start
+    for stop in stops:
+        if stop < start or stop > scene.frame_end:
+            continue
+        edits.append([start, stop, 1])
+        if stop in loop_starts:
+            loop = loop_starts[stop]
+            #the player loops from start+1 to end-1
+            if loop[1] - 1 > stop:
+                edits.append([stop+1, loop[1]-1, loop_count])
+            start = loop[1]
+        else:
+            if hold > 0:
+                edits.append([stop, stop, hold])
+            start = stop + 1
+    if start <= scene.frame_end:
+        edits.append([start, scene.frame_end, 1])
+    return edits
+
+# script for the background blender joining the frames into the video
+EXPORT_ASSEMBLE_SCRIPT = '''import bpy, json, os, sys
+with open(sys.argv[sys.argv.index("--") + 1]) as f:
+    export = json.load(f)
+scene = bpy.context.scene
+render = scene.render
+render.resolution_x, render.resolution_y = export["resolution"]
+render.resolution_percentage = 100
+render.fps, render.fps_base = export["fps"]
+render.image_settings.file_format = 'FFMPEG'
+render.ffmpeg.format = 'MPEG4'
+render.ffmpeg.codec = 'H264'
+render.use_sequencer = True
+render.use_file_extension = False
+render.filepath = export["output"]
+seq = scene.sequence_editor_create()
+frame = 1
+for first, last, repeats in export["edits"]:
+    names = ["frame_" + str(f).zfill(5) + ".png" for f in range(first, last + 1)]
+    #a held frame is one long strip, a loop is the same strip again
+    for r in range(1 if first == last else repeats):
+        strip = seq.sequences.new_image(str(frame), os.path.join(export["frames"], names[0]), 1, frame)
+        for name in names[1:]:
+            strip.elements.append(name)
+        if first == last:
+            strip.frame_final_duration = repeats
+        frame += strip.frame_final_duration
+scene.frame_start = 1
+scene.frame_end = frame - 1
+bpy.ops.render.render(animation=True)
+'''
+
+# join the pre-rendered frames into the video in a background blender
+def start_export_assembly(scene, edits):
+    pres_tool = scene.my_pres_tool
+    render = scene.render
+    export = {"frames": get_prerender_dir(), "edits": edits,
+              "output": bpy.path.abspath(pres_tool.export_path),
+              "fps": [render.fps, render.fps_base],
+              "resolution": [render.resolution_x * render.resolution_percentage // 100,
+                             render.resolution_y * render.resolution_percentage // 100]}
+    export_json = os.path.join(get_prerender_dir(), "export.json")
+    with open(export_json, "w") as f:
+        json.dump(export, f)
+    script = os.path.join(get_prerender_dir(), "export_assemble.py")
+    with open(script, "w") as f:
+        f.write(EXPORT_ASSEMBLE_SCRIPT)
+    args = [bpy.app.binary_path, "--background", "--factory-startup", "--python", script, "--", export_json]
+    return subprocess.Popen(args, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+
+#------------------------------------------------------------
+
+# show the pre-rendered frames on a screen in front of the presenter camera
+def show_prerendered_deck(scene):
+    if not bpy.data.is_saved:
+        return False
+    unbind_presenter_camera(scene)
+    hide_prerendered_deck(scene)
+    frames = get_prerender_frames(scene)
+    if len(frames) == 0:
+        return False
+    keys = get_prerender_keys(scene, frames)
+    if keys is None or len(get_prerender_missing(frames, keys, load_prerender_manifest())) != 0:
+        return False
+
+    stops = get_camera_stops(scene)
+    presenter = get_presenter_camera(scene, stops[0][1] if len(stops) != 0 else None)
+    use_presenter_actions(presenter, False)
+
+    #image sequence, image number = frame number
+    image = bpy.data.images.load(get_prerender_path(frames[0]), check_existing=True)
+    image.source = 'SEQUENCE'
+    mat = bpy.data.materials.get("PRERENDER SCREEN")
+    if mat is None:
+        mat = bpy.data.materials.new("PRERENDER SCREEN")
+        mat.use_nodes = True
+    tex = mat.node_tree.nodes.get("PRERENDER FRAMES")
+    if tex is None:
+        tex = mat.node_tree.nodes.new('ShaderNodeTexImage')
+        tex.name = "PRERENDER FRAMES"
+    tex.image = image
+    tex.image_user.frame_start = 1
+    tex.image_user.frame_offset = 0
+    tex.image_user.frame_duration = scene.frame_end
+    tex.image_user.use_auto_refresh = True
+    mat.node_tree.nodes.active = tex
+
+    #screen filling the camera view, right behind the clip start
+    cam_data = presenter.data
+    corners = cam_data.view_frame(scene=scene)
+    depth = cam_data.clip_start * 2
+    if cam_data.type == 'ORTHO':
+        verts = [(c.x, c.y, -depth) for c in corners]
+    else:
+        verts = [tuple(c * (depth / -c.z)) for c in corners]
+    mesh = bpy.data.meshes.new("PRERENDER SCREEN")
+    mesh.from_pydata(verts, [], [(0, 1, 2, 3)])
+    uv = mesh.uv_layers.new()
+    for loop, co in zip(uv.data, [(1, 1), (1, 0), (0, 0), (0, 1)]):
+        loop.uv = co
+    mesh.materials.append(mat)
+    screen = bpy.data.objects.new("=> PRERENDER SCREEN", mesh)
+    scene.collection.objects.link(screen)
+    screen.parent = presenter
+    bind_presenter_camera(scene)
+
+    #everything else is in the frames already
+    build_culling_targets(scene)
+    set_sections_visible(PresMenuProperties.culling_visible, False)
+    PresMenuProperties.culling_visible = set()
+    PresMenuProperties.prerender_playing = True
+    return True
+
+# remove the pre-rendered screen again
+def hide_prerendered_deck(scene):
+    screen = scene.objects.get("=> PRERENDER SCREEN")
+    if screen is not None:
+        mesh = screen.data
+        bpy.data.objects.remove(screen)
+        bpy.data.meshes.remove(mesh)
+    presenter = scene.objects.get("=> PRESENTER CAMERA")
+    if presenter is not None:
+        use_presenter_actions(presenter, True)
+    PresMenuProperties.prerender_playing = False
+
+#------------------------------------------------------------
+
+# can the hierarchies be overridden through the data API (no outliner context needed)
+def can_override_by_api():
+    return hasattr(bpy.types.ID, "override_hierarchy_create")
+
+#------------------------------------------------------------
+
+# linked (not yet overridden) component instances in the scene
+def get_component_instances(scene):
+    instances = []
+    for obj in scene.objects:
+        if obj.instance_type == 'COLLECTION' and obj.instance_collection is not None:
+            if obj.instance_collection.library is not None and get_component_override(obj.instance_collection) is None:
+                instances.append(obj)
+    return instances
+
+# override of a linked component collection, None if it is not overridden yet
+def get_component_override(collection):
+    for col in bpy.data.collections:
+        if col.override_library is not None and col.override_library.reference == collection:
+            return col
+    return None
+
+#------------------------------------------------------------
+
+# sort overrides, original components and timers into their collections
+def organize_overrides(scene):
+    #fill the structure for nla changes and marker movement
+    refresh_timer_structures(scene)
+            
+    #create a collection for original slides
+    try:
+        if bpy.data.collections["COMPONENTS"] is not None:
+            collection = bpy.data.collections["COMPONENTS"]
+    except:
+        collection = bpy.data.collections.new(name="COMPONENTS")
+        scene.collection.children.link(collection)
+    for obj in bpy.data.objects:
+        if obj.instance_collection is not None:
+            comp_collection = get_parent_collection(obj)
+            if comp_collection == "Master Collection":
+                collection.objects.link(obj)
+                scene.collection.objects.unlink(obj)
+            else:
+                if comp_collection == "COMPONENTS":
+                    continue
+                else:
+                    collection.objects.link(obj)
+                    bpy.data.collections[comp_collection].objects.unlink(obj)
+            
+    #create a collection for override slides
+    try:
+        if bpy.data.collections["OVERRIDES"] is not None:
+            collection = bpy.data.collections["OVERRIDES"]
+    except:
+        collection = bpy.data.collections.new(name="OVERRIDES")
+        scene.collection.children.link(collection)
+    for col in bpy.data.collections:
+        if col.override_library is not None:
+            try:
+                scene.collection.children.unlink(col)
+                collection.children.link(col)
+            except:
+                print(col.name, " is child collection, so its moved already")
+            
+    #create a collection for slide timers
+    try:
+        if bpy.data.collections["TIMERS"] is not None:
+            collection = bpy.data.collections["TIMERS"]
+    except:
+        collection = bpy.data.collections.new(name="TIMERS")
+        scene.collection.children.link(collection)
+    for obj in scene.objects:
+        if "COMPONENT TIMER" in obj.name and obj.name not in bpy.data.collections["TIMERS"].objects:
+            timer = scene.objects.get(obj.name)
+            collection.objects.link(obj)
+            
+            
+    #filter NLA strips by timer collection - doesnt work (??)
+    if bpy.context.screen is None:
+        return
+    for area in bpy.context.screen.areas:
+        #for area in screen.areas:
+        if area.type == "NLA_EDITOR":
+            for space in area.spaces:
+                if space.type == "NLA_EDITOR":
+                    space.dopesheet.filter_collection = bpy.data.collections["TIMERS"]
+                    break
+
+#------------------------------------------------------------
+
+# override only the given component instances, returns the override collections
+def override_components(scene, instances):
+    view_layer = bpy.context.view_layer
+    if view_layer is None:
+        view_layer = scene.view_layers[0]
+    overrides = []
+    overridden = []
+    for instance in list(instances):
+        collection = instance.instance_collection
+        if collection is None or collection.library is None or get_component_override(collection) is not None:
+            continue
+        override = collection.override_hierarchy_create(scene, view_layer, reference=instance)
+        if override is not None:
+            overrides.append(override)
+            overridden.append(instance)
+    if len(overrides) != 0:
+        organize_overrides(scene)
+        scene.my_pres_tool.overriden = True
+    #the override draws the component, the instance only keeps the camera and the timing
+    for instance in overridden:
+        instance.instance_type = 'NONE'
+    return overrides
+
+#------------------------------------------------------------
+
+# override the components that were picked for editing (lazy override)
+def override_queued_components():
+    scene = bpy.context.scene
+    instances = []
+    for name in PresMenuProperties.override_queue:
+        obj = scene.objects.get(name)
+        if obj is not None:
+            instances.append(obj)
+    PresMenuProperties.override_queue.clear()
+    override_components(scene, instances)
+    return None
+
+#------------------------------------------------------------
+
+# fill the stored timers for nla changes and marker movement (after import, delete, reorder)
+def refresh_timer_structures(scene):
+    pres_tool = scene.my_pres_tool
+    pres_tool.timers.clear()
+    markers = sorted((m.frame, m.name) for m in scene.timeline_markers)
+    marker_frames = [m[0] for m in markers]
+    for comp in get_components(scene):
+        item = pres_tool.timers.add()
+        item.name = comp["name"]
+        item.timer = comp["timer"]
+        item.camera = comp["camera"]
+        item.start = comp["start"]
+        item.end = comp["end"]
+        #fill markers
+        first = bisect.bisect_left(marker_frames, comp["start"])
+        last = bisect.bisect_right(marker_frames, comp["end"])
+        for frame, name in markers[first:last]:
+            marker = item.markers.add()
+            marker.name = name
+            marker.frame = frame
+
+# keep the stored timers in timeline order after one of them moved
+def sort_timer_items(pres_tool):
+    timers = pres_tool.timers
+    for i in range(1, len(timers)):
+        j = i
+        while j > 0 and timers[j-1].start > timers[j].start:
+            timers.move(j, j-1)
+            j -= 1
+
+#------------------------------------------------------------
+
+# all components in timeline order
+# [{"name": timer strip name, "timer": object, "strip": timer strip,
+#   "start": frame, "end": frame, "instance": object, "camera": object}, ...]
+def get_components(scene):
+    components = []
+    instances = []
+    for obj in scene.objects:
+        if obj.instance_collection is not None:
+            instances.append(obj)
+        if "COMPONENT TIMER" not in obj.name or obj.animation_data is None:
+            continue
+        if len(obj.animation_data.nla_tracks) == 0 or len(obj.animation_data.nla_tracks[0].strips) == 0:
+            continue
+        strip = obj.animation_data.nla_tracks[0].strips[0]
+        components.append({"name": strip.name, "timer": obj, "strip": strip,
+                           "start": int(strip.frame_start), "end": int(strip.frame_end),
+                           "instance": None, "camera": None})
+    components.sort(key=lambda c: c["start"])
+
+    #pair timers with their component instance and camera
+    for comp in components:
+        for obj in instances:
+            if comp["name"].startswith(obj.name + ".blend TIMER STRIP"):
+                comp["instance"] = obj
+                for child in obj.children:
+                    if child.type == 'CAMERA':
+                        comp["camera"] = child
+                        break
+                break
+    #no camera child -> take the camera marker at the component start
+    stops = get_camera_stops(scene)
+    stop_frames = [s[0] for s in stops]
+    for comp in components:
+        if comp["camera"] is None:
+            i = bisect.bisect_left(stop_frames, comp["start"])
+            if i < len(stops) and stops[i][0] <= comp["end"]:
+                comp["camera"] = stops[i][1]
+    return components
+
+#------------------------------------------------------------
+
+# nla strips of a camera that hold the transition constraint influence
+def get_transition_strips(cam):
+    strips = []
+    if cam is None or cam.animation_data is None:
+        return strips
+    for track in cam.animation_data.nla_tracks:
+        for strip in track.strips:
+            if strip.action is None:
+                continue
+            for fcurve in strip.action.fcurves:
+                if fcurve.data_path.startswith('constraints["Copy '):
+                    strips.append(strip)
+                    break
+    return strips
+
+#------------------------------------------------------------
+
+# move nla strip without changing its length
+def move_strip(strip, delta):
+    if delta < 0:
+        strip.frame_start += delta
+        strip.frame_end += delta
+    elif delta > 0:
+        strip.frame_end += delta
+        strip.frame_start += delta
+
+#------------------------------------------------------------
+
+# shift timers, markers and camera transitions in one pass
+# components = old timeline order, deltas[i] = frame offset of everything
+# from components[i] start up to the next component start
+def shift_timeline(scene, components, deltas):
+    boundaries = [comp["start"] for comp in components]
+    if len(boundaries) == 0:
+        return
+
+    def delta_for(frame):
+        i = bisect.bisect_right(boundaries, frame) - 1
+        if i < 0:
+            return 0
+        return deltas[i]
+
+    #markers first, they are found by the old frames
+    for m in scene.timeline_markers:
+        delta = delta_for(m.frame)
+        if delta != 0:
+            m.frame += delta
+
+    for comp, delta in zip(components, deltas):
+        if delta == 0:
+            continue
+        #timer strip (drivers move the component animation)
+        move_strip(comp["strip"], delta)
+        #camera transition to the next component starts at the component end
+        for strip in get_transition_strips(comp["camera"]):
+            move_strip(strip, delta)
+        if comp["camera"] is not None and comp["camera"].animation_data is not None:
+            action = comp["camera"].animation_data.action
+            if action is not None:
+                for fcurve in action.fcurves:
+                    if fcurve.data_path.startswith('constraints["Copy '):
+                        for point in fcurve.keyframe_points:
+                            point.co.x += delta
+                            point.handle_left.x += delta
+                            point.handle_right.x += delta
+
+#------------------------------------------------------------
+
+# fill the typed template objects with the data of one slide (n-th of slide_cnt)
+def fill_template(data, slide, n, slide_cnt):
+    for key in data[slide]:
+        key_found = False
+        for obj in bpy.data.objects:
+            try:
+                if bpy.data.objects[obj.name]["OBJECT TYPE"] == key:
+                    key_found = True
+                    if "H1" in key or "H2" in key:
+                        obj.data.body = data[slide][key]
+                        break
+                    if "OL" in key:
+                        for i, line in enumerate(data[slide][key]):
+                            if i == 0:
+                                obj.data.body = str(i+1) + ". " + line
+                            else:
+                                obj.data.body += "\n" + str(i+1) + ". " + line
+                        break
+                    if "UL" in key:
+                        for i, line in enumerate(data[slide][key]):
+                            if i == 0:
+                                obj.data.body = "- " + line
+                            else:
+                                obj.data.body += "\n- " + line
+                        break
+                    if "IMAGE" in key:
+                        img = bpy.data.images.load(filepath = data[slide][key])
+                        mat = bpy.data.materials.new(name="New_Mat")
+                        mat.use_nodes = True
+                        bsdf = mat.node_tree.nodes["Principled BSDF"]
+                        texImage = mat.node_tree.nodes.new('ShaderNodeTexImage')
+                        texImage.image = img
+                        mat.node_tree.links.new(bsdf.inputs['Base Color'], texImage.outputs['Color'])
+                        if obj.data.materials:
+                            obj.data.materials[0] = mat
+                        else:
+                            obj.data.materials.append(mat)
+                        break
+                elif bpy.data.objects[obj.name]["OBJECT TYPE"] == "NUMBER":
+                    obj.data.body = str(n+1) + "/" + str(slide_cnt)
+                    key_found = True
+            except:
+                continue
+
+# run in a background blender with the template open: one component file per slide
+def generate_components_job(job_path):
+    with open(job_path) as f:
+        job = json.load(f)
+    with open(job["data"]) as f:
+        data = json.load(f)
+    slide_cnt = len(data)
+    for n, slide in enumerate(data):
+        fill_template(data, slide, n, slide_cnt)
+        # save it as new file
+        path = os.path.join(job["out_dir"], str(slide) + ".blend")
+        bpy.ops.wm.save_as_mainfile(filepath=path, copy=True)
+        with open(job["progress"], "a") as f:
+            f.write(path + "\n")
+
+# fill and save the components in a background blender, the template stays open
+def start_template_worker(template, job, job_path):
+    with open(job_path, "w") as f:
+        json.dump(job, f)
+    module = os.path.splitext(os.path.basename(PresMenuProperties.script_file))[0]
+    expr = ("import sys\nsys.path.insert(0, " + repr(PresMenuProperties.script_dir) + ")\n"
+            "import " + module + "\n" + module + ".generate_components_job(" + repr(job_path) + ")")
+    args = [bpy.app.binary_path, "--background", "--factory-startup", template, "--python-expr", expr]
+    return subprocess.Popen(args, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+
+#------------------------------------------------------------
+
+# exact modification time of a source component for the watch mode
+def get_source_mtime(path):
+    return str(os.stat(path).st_mtime_ns)
+
+# run in a background blender: retime a changed source component into its timed copy
+def retime_component_job(job_path):
+    with open(job_path) as f:
+        job = json.load(f)
+    #stored copy found here -> the presentation did not have to hash the source
+    if job.get("use_store"):
+        stored = use_stored_timing(job["source"], job["time"], job["interpolation_time"], job["cnt"], job["this_file"])
+        if stored is not None:
+            save_file_hashes(bpy.path.abspath(get_store_dir(os.path.dirname(job["this_file"]))))
+            total, more_collections, chosen = stored
+            with open(job["result"], "w") as f:
+                json.dump({"ok": True, "total": total, "more_collections": more_collections, "chosen": chosen}, f)
+            return
+    total, more_collections, chosen = change_timimg(job["source"], job["time"], job["interpolation_time"], job["cnt"], job["this_file"])
+    scene = bpy.context.scene
+    result = {"ok": total != -1, "frame_start": scene.frame_start, "frame_end": scene.frame_end,
+              "markers": sorted([m.frame, m.name] for m in scene.timeline_markers),
+              "total": total, "more_collections": more_collections, "chosen": chosen}
+    with open(job["result"], "w") as f:
+        json.dump(result, f)
+
+# retime a component in a background blender, the presentation stays open
+def start_retime_worker(job, job_path):
+    with open(job_path, "w") as f:
+        json.dump(job, f)
+    module = os.path.splitext(os.path.basename(PresMenuProperties.script_file))[0]
+    expr = ("import sys\nsys.path.insert(0, " + repr(PresMenuProperties.script_dir) + ")\n"
+            "import " + module + "\n" + module + ".retime_component_job(" + repr(job_path) + ")")
+    args = [bpy.app.binary_path, "--background", "--factory-startup", "--python-expr", expr]
+    return subprocess.Popen(args, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+
+# start retiming the component of a chosen file, None if it is not in the timeline
+def start_component_retime(scene, item):
+    name = os.path.basename(item.filepath)
+    components = get_components(scene)
+    comp = None
+    for c in components:
+        if c["name"].startswith(name + " TIMER STRIP"):
+            comp = c
+    if comp is None:
+        return None
+
+    #same placement as when it was imported
+    interpolation_time = get_interpolation_time()
+    time = 1 if comp["start"] == 1 else comp["start"] - interpolation_time
+    cnt = int(item.camera.split(".")[-1]) if "." in item.camera else 0
+    job_dir = os.path.dirname(item.filepath)
+    markers_txt = os.path.join(job_dir, "markers.txt")
+    job = {"source": item.source, "time": time, "interpolation_time": interpolation_time, "cnt": cnt,
+           "this_file": bpy.data.filepath, "result": os.path.join(job_dir, name + ".rebuild.json")}
+    worker = start_retime_worker(job, os.path.join(job_dir, name + ".job.json"))
+    return [worker, item.filepath, job["result"], os.path.getsize(markers_txt) if os.path.exists(markers_txt) else -1]
+
+#------------------------------------------------------------
+
+# chosen component into the slide list, the next one starts where it ends
+def add_chosen_component(pres_tool, source, total, more_collections, chosen):
+    queue = PresMenuProperties.write_queue
+    item = pres_tool.slide_list.add()
+    item.filepath, item.collection, item.camera = chosen
+    item.source = source
+    item.source_mtime = get_source_mtime(source)
+    pres_tool.slides_chosen += 1
+    queue["time"] = total
+    if more_collections is True:
+        queue["warning"] = True
+
+# write the timed copies of the queued components, the stored ones right away
+# returns RUNNING (a copy is being written), FINISHED or CAMERA_ERROR
+def write_timed_components(scene):
+    queue = PresMenuProperties.write_queue
+    pres_tool = scene.my_pres_tool
+    job = PresMenuProperties.write_job
+    if job is not None:
+        worker, source, job_path, result_path = job
+        if worker.poll() is None:
+            return "RUNNING"
+        PresMenuProperties.write_job = None
+        try:
+            with open(result_path) as f:
+                result = json.load(f)
+            os.remove(result_path)
+        except (OSError, ValueError):
+            result = {"ok": False}
+        if os.path.exists(job_path):
+            os.remove(job_path)
+        if not result["ok"]:
+            queue["error"] = source
+            return "CAMERA_ERROR"
+        add_chosen_component(pres_tool, source, result["total"], result["more_collections"], result["chosen"])
+
+    while len(queue["files"]) != 0:
+        source = queue["files"].pop(0)
+        cnt = pres_tool.slides_chosen + pres_tool.slide_count
+        if pres_tool.already_imported is False:
+            cnt += queue["n_tmp"]
+        #same file and timing already in the store -> no need to open it
+        #(only with a known hash, an unknown file is hashed by the background process)
+        stored = use_stored_timing(source, queue["time"], queue["interpolation_time"], cnt, bpy.data.filepath, True)
+        if stored is not None:
+            add_chosen_component(pres_tool, source, *stored)
+            continue
+        #blender file -> change timing in the background
+        job_dir = get_presentation_dir()
+        if not os.path.exists(job_dir):
+            os.makedirs(job_dir)
+        name = os.path.basename(source)
+        job = {"source": source, "time": queue["time"], "interpolation_time": queue["interpolation_time"], "cnt": cnt,
+               "this_file": bpy.data.filepath, "result": os.path.join(job_dir, name + ".write.json"), "use_store": True}
+        job_path = os.path.join(job_dir, name + ".write.job.json")
+        PresMenuProperties.write_job = [start_retime_worker(job, job_path), source, job_path, job["result"]]
+        done = queue["count"] - len(queue["files"])
+        PresMenuProperties.write_status = "Writing " + name + " (" + str(done) + " / " + str(queue["count"]) + ")"
+        return "RUNNING"
+    return "FINISHED"
+
+# chosen components are written, set the timeline like the old synchronous choose
+def finish_timed_components(scene, state):
+    queue = PresMenuProperties.write_queue
+    PresMenuProperties.write_queue = None
+    PresMenuProperties.write_status = ""
+    pres_tool = scene.my_pres_tool
+    if state == "CAMERA_ERROR":
+        pres_tool.slides_chosen = 0
+        pres_tool.slide_list.clear()
+        return queue
+    scene.frame_start = 1
+    scene.frame_end = queue["time"]
+    pres_tool.slides_chosen += queue["n_tmp"]
+    return queue
+
+#------------------------------------------------------------
+
+# take the camera animation of the retimed copy, keep the transition strips
+def reload_component_camera(cam, filepath):
+    with bpy.data.libraries.load(filepath, link=False) as (data_from, data_to):
+        data_to.objects = [name for name in data_from.objects if name == cam.name]
+    if len(data_to.objects) == 0 or data_to.objects[0] is None:
+        return
+    new_cam = data_to.objects[0]
+    transitions = []
+    for strip in get_transition_strips(cam):
+        transitions.append([strip.name, strip.action, strip.frame_start, strip.frame_end, strip.mute])
+    cam.animation_data_create()
+    for track in list(cam.animation_data.nla_tracks):
+        cam.animation_data.nla_tracks.remove(track)
+    #component animation first, transition on top
+    if new_cam.animation_data is not None:
+        for track in new_cam.animation_data.nla_tracks:
+            new_track = cam.animation_data.nla_tracks.new()
+            for strip in track.strips:
+                new_strip = new_track.strips.new(strip.name, int(strip.frame_start), strip.action)
+                new_strip.use_sync_length = True
+    if len(transitions) != 0:
+        track = cam.animation_data.nla_tracks.new()
+        for name, action, start, end, mute in transitions:
+            strip = track.strips.new(name, int(start), action)
+            strip.frame_end = end
+            strip.mute = mute
+    cam.location = new_cam.location
+    cam.rotation_euler = new_cam.rotation_euler
+    cam.rotation_quaternion = new_cam.rotation_quaternion
+    cam.scale = new_cam.scale
+    cam.data.lens = new_cam.data.lens
+    cam_data = new_cam.data
+    bpy.data.objects.remove(new_cam)
+    bpy.data.cameras.remove(cam_data)
+
+#------------------------------------------------------------
+
+# hot-swap a retimed component and move the following ones by its new duration
+def apply_component_rebuild(scene, filepath, result):
+    pres_tool = scene.my_pres_tool
+    name = os.path.basename(filepath)
+    components = get_components(scene)
+    index = None
+    for i, c in enumerate(components):
+        if c["name"].startswith(name + " TIMER STRIP"):
+            index = i
+    if index is None:
+        return False
+    comp = components[index]
+    delta = result["frame_end"] - comp["end"]
+
+    #old markers of the component go, camera markers stay
+    for m in list(scene.timeline_markers):
+        if comp["start"] <= m.frame <= comp["end"] and m.camera is None:
+            scene.timeline_markers.remove(m)
+
+    for lib in bpy.data.libraries:
+        if os.path.basename(bpy.path.abspath(lib.filepath)) == name:
+            lib.reload()
+
+    #following components make room (or close the gap)
+    components = get_components(scene)
+    if delta != 0:
+        shift_timeline(scene, components, [0 if i <= index else delta for i in range(len(components))])
+    for frame, marker in result["markers"]:
+        if marker == "LOOP_START" or marker == "LOOP_END":
+            scene.timeline_markers.new(name=marker, frame=frame)
+        else:
+            scene.timeline_markers.new(name="F_" + str(frame), frame=frame)
+
+    cam = scene.objects.get(components[index]["camera"].name) if components[index]["camera"] is not None else None
+    if cam is not None:
+        reload_component_camera(cam, filepath)
+    components = get_components(scene)
+    retarget_camera_transitions(components)
+    scene.frame_end = components[-1]["end"]
+    refresh_timer_structures(scene)
+    invalidate_deck_bake(scene)
+    if pres_tool.transition_mode == "PRESENTER":
+        bake_presenter_camera(scene)
+    return True
+
+#------------------------------------------------------------
+
+# poll the source component files, rebuild one changed component at a time
+def watch_components_timer():
+    scene = bpy.context.scene
+    pres_tool = scene.my_pres_tool
+    if not pres_tool.watch_components:
+        PresMenuProperties.watch_status = ""
+        return None
+
+    job = PresMenuProperties.watch_job
+    if job is not None:
+        worker, filepath, result_path, markers_size = job
+        if worker.poll() is None:
+            return 0.5
+        PresMenuProperties.watch_job = None
+        #markers.txt is only for importing, drop the line of the rebuild
+        markers_txt = os.path.join(os.path.dirname(filepath), "markers.txt")
+        if markers_size == -1 and os.path.exists(markers_txt):
+            os.remove(markers_txt)
+        elif markers_size != -1:
+            with open(markers_txt, "r+") as f:
+                f.truncate(markers_size)
+        try:
+            with open(result_path) as f:
+                result = json.load(f)
+            os.remove(result_path)
+        except (OSError, ValueError):
+            result = {"ok": False}
+        name = os.path.basename(filepath)
+        if not result["ok"]:
+            PresMenuProperties.watch_status = name + ": rebuild failed (camera error?)"
+        elif apply_component_rebuild(scene, filepath, result):
+            PresMenuProperties.watch_status = name + ": rebuilt"
+        else:
+            PresMenuProperties.watch_status = name + ": Override the Component first"
+        return 0.5
+
+    for item in pres_tool.slide_list:
+        if item.source == "" or not os.path.exists(item.source):
+            continue
+        mtime = get_source_mtime(item.source)
+        if mtime == item.source_mtime:
+            continue
+        item.source_mtime = mtime
+        job = start_component_retime(scene, item)
+        if job is None:
+            PresMenuProperties.watch_status = os.path.basename(item.filepath) + ": Override the Component first"
+            continue
+        PresMenuProperties.watch_job = job
+        PresMenuProperties.watch_status = os.path.basename(item.filepath) + ": rebuilding..."
+        return 0.5
+    return 2.0
+
+def toggle_component_watch(pres_tool):
+    if pres_tool.watch_components and not bpy.app.timers.is_registered(watch_components_timer):
+        bpy.app.timers.register(watch_components_timer, first_interval=1)
+
+#------------------------------------------------------------
+
+# point every camera transition to the camera of the following component
+def retarget_camera_transitions(components):
+    if bpy.context.scene.my_pres_tool.transition_mode == "PRESENTER":
+        return
+    for i, comp in enumerate(components):
+        cam = comp["camera"]
+        if cam is None:
+            continue
+        strips = get_transition_strips(cam)
+        #last camera doesnt fly anywhere
+        if i == len(components)-1:
+            remove_camera_constraints(cam)
+            for strip in strips:
+                strip.mute = True
+            continue
+        target = components[i+1]["camera"]
+        if len(strips) != 0 or cam.constraints.get("Copy Location") is not None:
+            ensure_transition_constraints(cam, target)
+            for strip in strips:
+                strip.mute = False
+        else:
+            #camera was the last one before -> new transition
+            add_camera_transition(cam, target, comp["end"], components[i+1]["start"])
+
+#------------------------------------------------------------
+
+# delete components in one batch and close the gaps they leave in the timeline
+def delete_components(scene, instances):
+    pres_tool = scene.my_pres_tool
+    components = get_components(scene)
+    names = set(obj.name for obj in instances)
+    deleted = [comp for comp in components if comp["instance"] is not None and comp["instance"].name in names]
+    if len(deleted) == 0:
+        return 0
+    deleted_names = set(comp["name"] for comp in deleted)
+
+    #time span of every component (up to the next component start)
+    spans = []
+    for i, comp in enumerate(components):
+        if i != len(components)-1:
+            spans.append(components[i+1]["start"] - comp["start"])
+        elif i != 0:
+            spans.append(comp["end"] - components[i-1]["end"])
+        else:
+            spans.append(comp["end"] - comp["start"])
+
+    #remove markers of the deleted components
+    removed_markers = []
+    for comp in deleted:
+        for m in scene.timeline_markers:
+            if comp["start"] <= m.frame <= comp["end"]:
+                removed_markers.append(m)
+    for m in removed_markers:
+        scene.timeline_markers.remove(m)
+
+    #every following component moves left by the deleted spans before it
+    deltas = []
+    total = 0
+    for comp, span in zip(components, spans):
+        if comp["name"] in deleted_names:
+            total -= span
+        deltas.append(total)
+    kept = [comp for comp in components if comp["name"] not in deleted_names]
+    kept_deltas = [d for comp, d in zip(components, deltas) if comp["name"] not in deleted_names]
+    shift_timeline(scene, kept, kept_deltas)
+
+    #the first component starts the presentation
+    if len(kept) != 0 and components[0]["name"] in deleted_names:
+        for m in scene.timeline_markers:
+            if m.frame == kept[0]["start"] + kept_deltas[0] and m.camera is not None:
+                m.name = "SLIDE 0 START"
+                break
+
+    #remove objects, override collections and orphan libraries in one batch
+    ids = set()
+    libraries = set()
+    for comp in deleted:
+        ids.add(comp["timer"])
+        if comp["camera"] is not None:
+            ids.add(comp["camera"])
+        instance = comp["instance"]
+        ids.add(instance)
+        for child in instance.children:
+            ids.add(child)
+        collection = instance.instance_collection
+        if collection is not None and collection.library is not None:
+            libraries.add(collection.library)
+            for col in bpy.data.collections:
+                if col.override_library is not None and col.override_library.reference == collection:
+                    ids.add(col)
+                    for obj in col.all_objects:
+                        ids.add(obj)
+        for n in reversed(range(len(pres_tool.slide_list))):
+            if os.path.basename(pres_tool.slide_list[n].filepath) == instance.name + ".blend":
+                pres_tool.slide_list.remove(n)
+    bpy.data.batch_remove(ids)
+    for lib in libraries:
+        used = False
+        for obj in scene.objects:
+            if obj.instance_collection is not None and obj.instance_collection.library == lib:
+                used = True
+                break
+        if not used:
+            remove_component_library(lib)
+
+    #cameras of the remaining components follow each other again
+    kept = get_components(scene)
+    retarget_camera_transitions(kept)
+    if len(kept) != 0:
+        scene.frame_end = kept[-1]["end"]
+
+    refresh_timer_structures(scene)
+    invalidate_deck_bake(scene)
+    if pres_tool.transition_mode == "PRESENTER":
+        bake_presenter_camera(scene)
+    return len(deleted)
+
+#------------------------------------------------------------
+
+# change the component order, new_order = component (instance or timer strip) names
+# new start frames are computed in one pass and applied to everything in bulk
+def reorder_components(scene, new_order):
+    pres_tool = scene.my_pres_tool
+    components = get_components(scene)
+    if len(components) < 2:
+        return False
+
+    #find the components by their instance or timer strip name
+    by_name = {}
+    for comp in components:
+        by_name[comp["name"]] = comp
+        if comp["instance"] is not None:
+            by_name[comp["instance"].name] = comp
+    ordered = []
+    for name in new_order:
+        comp = by_name.get(name)
+        if comp is not None and comp not in ordered:
+            ordered.append(comp)
+    #components missing in the new order keep their relative order at the end
+    for comp in components:
+        if comp not in ordered:
+            ordered.append(comp)
+    if [c["name"] for c in ordered] == [c["name"] for c in components]:
+        return False
+
+    #new start frames, gap between components = camera transition
+    gap = int(round(get_interpolation_time()))
+    new_start = {}
+    frame = components[0]["start"]
+    for comp in ordered:
+        new_start[comp["name"]] = frame
+        frame += comp["end"] - comp["start"] + gap
+    deltas = [new_start[comp["name"]] - comp["start"] for comp in components]
+    shift_timeline(scene, components, deltas)
+
+    components = get_components(scene)
+    retarget_camera_transitions(components)
+    scene.frame_end = components[-1]["end"]
+
+    refresh_timer_structures(scene)
+    invalidate_deck_bake(scene)
+    if pres_tool.transition_mode == "PRESENTER":
+        bake_presenter_camera(scene)
+    return True
+
+#------------------------------------------------------------
+
+# stop frames and loops of the presentation, computed once per navigation
+# stops = sorted frames of all markers except LOOP_END, loops = [[loop_start, loop_end], ...]
+def get_stop_list(scene):
+    return get_stops([(m.frame, m.name) for m in scene.timeline_markers])
+
+#------------------------------------------------------------
+
+# loop that contains the frame (start < frame < end), None if there is none
+def find_loop(loops, frame):
+    for loop in loops:
+        if loop[0] < frame < loop[1]:
+            return loop
+    return None
+
+#------------------------------------------------------------
+
+# build the slide index: sorted stop frames, loops and section (component) starts
+def build_slide_index(scene):
+    pres_tool = scene.my_pres_tool
+    stops, loops = get_stop_list(scene)
+    sections = sorted(set(frame for frame, cam in get_camera_stops(scene)))
+    if len(sections) == 0:
+        sections = [scene.frame_start]
+    loop_ends = {}
+    for loop in loops:
+        loop_ends[loop[0]] = loop[1]
+    names = {}
+    for m in scene.timeline_markers:
+        if m.name != "LOOP_END" and m.frame not in names:
+            names[m.frame] = m.name
+
+    pres_tool.slides.clear()
+    for n, frame in enumerate(stops):
+        item = pres_tool.slides.add()
+        item.name = str(n+1) + ": " + names.get(frame, "")
+        item.frame = frame
+        item.section = max(bisect.bisect_right(sections, frame) - 1, 0)
+        item.loop_end = loop_ends.get(frame, 0)
+
+    PresMenuProperties.slide_frames = stops
+    PresMenuProperties.slide_loops = loops
+    PresMenuProperties.slide_sections = sections
+    PresMenuProperties.slide_index_dirty = False
+
+#------------------------------------------------------------
+
+# slide index (frames, loops, sections), rebuilt only after timing changes
+def get_slide_index(scene):
+    pres_tool = scene.my_pres_tool
+    if PresMenuProperties.slide_index_dirty or len(PresMenuProperties.slide_frames) == 0:
+        if len(PresMenuProperties.slide_frames) == 0 and len(pres_tool.slides) != 0 and not PresMenuProperties.slide_index_dirty:
+            #file was reloaded -> restore the cache from the stored index
+            load_slide_index(scene)
+        else:
+            build_slide_index(scene)
+    return PresMenuProperties.slide_frames, PresMenuProperties.slide_loops, PresMenuProperties.slide_sections
+
+# restore the slide index cache from the stored slides, O(n) without the markers
+def load_slide_index(scene):
+    frames = []
+    loops = []
+    sections = []
+    for item in scene.my_pres_tool.slides:
+        frames.append(item.frame)
+        if item.loop_end != 0:
+            loops.append([item.frame, item.loop_end])
+        if item.section >= len(sections):
+            sections.append(item.frame)
+    PresMenuProperties.slide_frames = frames
+    PresMenuProperties.slide_loops = loops
+    PresMenuProperties.slide_sections = sections
+    PresMenuProperties.slide_index_dirty = len(frames) == 0
+
+#------------------------------------------------------------
+
+# index of the slide the presentation is at (last stop <= current frame)
+def get_current_slide(scene):
+    frames, loops, sections = get_slide_index(scene)
+    return max(bisect.bisect_right(frames, scene.frame_current) - 1, 0)
+
+#------------------------------------------------------------
+
+# jump straight to a slide without playing the frames in between
+def go_to_slide(context, n):
+    scene = context.scene
+    frames, loops, sections = get_slide_index(scene)
+    if len(frames) == 0:
+        return
+    n = min(max(n, 0), len(frames)-1)
+    PresentationPlayer.stop()
+    cancel_animation(context)
+    #frame_set switches the marker camera too
+    scene.frame_set(frames[n])
+    update_culling(scene, [frames[n]])
+    update_streaming(scene, [frames[n]])
+    update_lod(scene, [frames[n]])
+
+# slide picked in the slide index list, the jump (operators, loading libraries) waits for a timer
+def request_go_to_slide(n):
+    PresMenuProperties.slide_request = n
+    if not bpy.app.timers.is_registered(go_to_slide_timer):
+        bpy.app.timers.register(go_to_slide_timer, first_interval=0)
+
+def go_to_slide_timer():
+    n = PresMenuProperties.slide_request
+    PresMenuProperties.slide_request = None
+    if n is not None:
+        go_to_slide(bpy.context, n)
+    return None
+
+# stop the timeline playback, also from a timer (no window in the context there)
+def cancel_animation(context):
+    window = context.window
+    if window is None and len(context.window_manager.windows) != 0:
+        window = context.window_manager.windows[0]
+    if window is None or not window.screen.is_animation_playing:
+        return
+    if hasattr(context, "temp_override"):
+        with context.temp_override(window=window, screen=window.screen):
+            bpy.ops.screen.animation_cancel()
+    else:
+        bpy.ops.screen.animation_cancel({"window": window, "screen": window.screen})
+
+#------------------------------------------------------------
+
+# camera of every section, None if there is none
+def get_section_cameras(scene):
+    frames, loops, sections = get_slide_index(scene)
+    stops = get_camera_stops(scene)
+    stop_frames = [s[0] for s in stops]
+    cameras = []
+    for frame in sections:
+        i = bisect.bisect_left(stop_frames, frame)
+        cameras.append(stops[i][1] if i < len(stops) else None)
+    return cameras
+
+# component instance of every section, None if it has no camera parent
+def get_section_instances(scene):
+    #component camera is parented to the component instance
+    return [cam.parent if cam is not None else None for cam in get_section_cameras(scene)]
+
+# objects and override collections of every section (component) for the culling
+def build_culling_targets(scene):
+    targets = get_section_targets(scene)
+    PresMenuProperties.culling_targets = targets
+    PresMenuProperties.culling_visible = set(range(len(targets)))
+    build_culling_grid(targets)
+
+# [[instance, override collection], ...] per section, only what exists
+def get_section_targets(scene):
+    overrides = {}
+    for col in bpy.data.collections:
+        if col.override_library is not None and col.override_library.reference is not None:
+            overrides[col.override_library.reference.name] = col
+    targets = []
+    for instance in get_section_instances(scene):
+        section = []
+        if instance is not None:
+            section.append(instance)
+            if instance.instance_collection is not None and instance.instance_collection.name in overrides:
+                section.append(overrides[instance.instance_collection.name])
+        targets.append(section)
+    return targets
+
+#------------------------------------------------------------
+
+# cell size of the culling grid, components are placed 50 units apart
+CULLING_CELL = 50.0
+
+# world bounding box of every section, sorted into a grid of cells
+def build_culling_grid(targets):
+    boxes = []
+    grid = {}
+    for n, section in enumerate(targets):
+        box = get_section_box(section)
+        boxes.append(box)
+        #no box -> nothing to cull, keep it visible
+        if box is None:
+            continue
+        for cell in get_grid_cells(box[0], box[1]):
+            grid.setdefault(cell, set()).add(n)
+    PresMenuProperties.culling_boxes = boxes
+    PresMenuProperties.culling_grid = grid
+
+# world bounding box (min, max) of a section, None if it has no objects
+def get_section_box(section):
+    corners = []
+    for target in section:
+        if isinstance(target, bpy.types.Collection):
+            for obj in target.all_objects:
+                corners += [obj.matrix_world @ Vector(c) for c in obj.bound_box]
+        elif target.instance_collection is not None:
+            col = target.instance_collection
+            offset = target.matrix_world @ Matrix.Translation(-col.instance_offset)
+            for obj in col.all_objects:
+                corners += [offset @ obj.matrix_world @ Vector(c) for c in obj.bound_box]
+        else:
+            #streamed component -> its placeholder box
+            for child in target.children:
+                if child.name.endswith(" PLACEHOLDER"):
+                    corners += [child.matrix_world @ Vector(c) for c in ((-1, -1, -1), (1, 1, 1))]
+    if not corners:
+        return None
+    box_min = Vector([min(c[i] for c in corners) for i in range(3)])
+    box_max = Vector([max(c[i] for c in corners) for i in range(3)])
+    return box_min, box_max
+
+def get_grid_cells(box_min, box_max):
+    lo = [floor(v / CULLING_CELL) for v in box_min]
+    hi = [floor(v / CULLING_CELL) for v in box_max]
+    return [(x, y, z) for x in range(lo[0], hi[0]+1)
+                      for y in range(lo[1], hi[1]+1)
+                      for z in range(lo[2], hi[2]+1)]
+
+#------------------------------------------------------------
+
+# corners of the camera view (near and far) in world space
+def get_camera_frustum(scene, cam):
+    depsgraph = bpy.context.evaluated_depsgraph_get()
+    cam_eval = cam.evaluated_get(depsgraph)
+    matrix = cam_eval.matrix_world
+    data = cam_eval.data
+    corners = []
+    for clip in (data.clip_start, data.clip_end):
+        for c in data.view_frame(scene=scene):
+            if data.type == 'ORTHO':
+                corners.append(matrix @ Vector((c.x, c.y, -clip)))
+            else:
+                corners.append(matrix @ (c * (clip / -c.z)))
+    return corners
+
+# inward planes (normal, distance) of the camera view
+def get_frustum_planes(corners):
+    #view_frame order: top right, bottom right, bottom left, top left
+    n0, n1, n2, n3, f0, f1, f2, f3 = corners
+    center = sum(corners, Vector()) / 8
+    planes = []
+    for a, b, c in ((n0, n1, n2), (f0, f2, f1), (n0, f0, n1), (n1, f1, n2), (n2, f2, n3), (n3, f3, n0)):
+        normal = (b - a).cross(c - a).normalized()
+        if normal.dot(center - a) < 0:
+            normal = -normal
+        planes.append((normal, normal.dot(a)))
+    return planes
+
+# sections whose bounding box is (at least partly) inside the camera view
+def query_culling_grid(scene, cam):
+    boxes = PresMenuProperties.culling_boxes
+    visible = {n for n, box in enumerate(boxes) if box is None}
+    corners = get_camera_frustum(scene, cam)
+    planes = get_frustum_planes(corners)
+    view_min = Vector([min(c[i] for c in corners) for i in range(3)])
+    view_max = Vector([max(c[i] for c in corners) for i in range(3)])
+    #visit the cells in view, or just the filled cells when there are fewer of them
+    lo = [floor(v / CULLING_CELL) for v in view_min]
+    hi = [floor(v / CULLING_CELL) for v in view_max]
+    grid = PresMenuProperties.culling_grid
+    if (hi[0]-lo[0]+1) * (hi[1]-lo[1]+1) * (hi[2]-lo[2]+1) > len(grid):
+        cells = [cell for cell in grid if all(lo[i] <= cell[i] <= hi[i] for i in range(3))]
+    else:
+        cells = [cell for cell in get_grid_cells(view_min, view_max) if cell in grid]
+    candidates = set()
+    for cell in cells:
+        candidates |= grid[cell]
+    for n in candidates - visible:
+        box_min, box_max = boxes[n]
+        for normal, dist in planes:
+            #box corner furthest along the plane normal
+            p = Vector([box_max[i] if normal[i] >= 0 else box_min[i] for i in range(3)])
+            if normal.dot(p) < dist:
+                break
+        else:
+            visible.add(n)
+    return visible
+
+#------------------------------------------------------------
+
+# show only the components around the given frames, changes only what differs
+def update_culling(scene, frames_around):
+    pres_tool = scene.my_pres_tool
+    if pres_tool.culling_mode == "NONE" or PresMenuProperties.prerender_playing:
+        return
+    frames, loops, sections = get_slide_index(scene)
+    if len(PresMenuProperties.culling_targets) != len(sections):
+        build_culling_targets(scene)
+    if pres_tool.culling_mode == "FRUSTUM":
+        if scene.camera is None:
+            return
+        visible = query_culling_grid(scene, scene.camera)
+    else:
+        k = pres_tool.culling_window
+        visible = set()
+        for frame in frames_around:
+            section = max(bisect.bisect_right(sections, frame) - 1, 0)
+            visible.update(range(max(section-k, 0), min(section+k+1, len(sections))))
+    set_sections_visible(PresMenuProperties.culling_visible - visible, False)
+    set_sections_visible(visible - PresMenuProperties.culling_visible, True)
+    PresMenuProperties.culling_visible = visible
+
+def set_sections_visible(sections, visible):
+    for section in sections:
+        for target in PresMenuProperties.culling_targets[section]:
+            target.hide_viewport = not visible
+
+#------------------------------------------------------------
+
+# show every culled component again
+def clear_culling():
+    hidden = set(range(len(PresMenuProperties.culling_targets))) - PresMenuProperties.culling_visible
+    set_sections_visible(hidden, True)
+    PresMenuProperties.culling_targets = []
+    PresMenuProperties.culling_visible = set()
+    PresMenuProperties.culling_boxes = []
+    PresMenuProperties.culling_grid = {}
+
+#------------------------------------------------------------
+
+# move every component so its bounds center is on the layout position
+def arrange_components(scene):
+    pres_tool = scene.my_pres_tool
+    targets = get_section_targets(scene)
+    cameras = get_section_cameras(scene)
+    sections = []
+    for n, section in enumerate(targets):
+        box = get_section_box(section)
+        if box is None:
+            continue
+        #top objects of the component, the rest follows them
+        roots = []
+        for target in section:
+            if isinstance(target, bpy.types.Collection):
+                roots += [obj for obj in target.all_objects if obj.parent is None]
+            else:
+                roots.append(target)
+        cam = cameras[n]
+        if cam is not None:
+            while cam.parent is not None:
+                cam = cam.parent
+            if cam not in roots:
+                roots.append(cam)
+        sections.append([box, roots])
+    if len(sections) == 0:
+        return 0
+
+    path = None
+    if pres_tool.layout_arrangement == "PATH" and pres_tool.layout_path is not None:
+        curve = pres_tool.layout_path
+        depsgraph = bpy.context.evaluated_depsgraph_get()
+        mesh = curve.evaluated_get(depsgraph).to_mesh()
+        path = [tuple(curve.matrix_world @ v.co) for v in mesh.vertices]
+        curve.evaluated_get(depsgraph).to_mesh_clear()
+    sizes = [tuple((box[1] - box[0]) / 2) for box, roots in sections]
+    positions = layout_positions(sizes, pres_tool.layout_arrangement, pres_tool.layout_clearance, path)
+
+    #the first component stays, the rest is laid out around it
+    origin = (sections[0][0][0] + sections[0][0][1]) / 2 - Vector(positions[0])
+    if path is not None:
+        origin = Vector()
+    for (box, roots), position in zip(sections, positions):
+        delta = origin + Vector(position) - (box[0] + box[1]) / 2
+        #delta transform, animated and linked location keyframes stay untouched
+        for obj in roots:
+            obj.delta_location += delta
+
+    PresMenuProperties.culling_targets = []
+    invalidate_deck_bake(scene)
+    if pres_tool.transition_mode == "PRESENTER":
+        bake_presenter_camera(scene)
+    return len(sections)
+
+#------------------------------------------------------------
+
+# number of overridden components and of all components, cached until components or overrides are added
+def get_override_counts(scene):
+    key = (scene.name, len(scene.objects), len(bpy.data.collections))
+    cache = PresMenuProperties.override_count_cache
+    if cache and cache[0] == key:
+        return cache[1], cache[2]
+    references = set(col.override_library.reference for col in bpy.data.collections if col.override_library is not None)
+    overridden = total = 0
+    for obj in scene.objects:
+        col = obj.instance_collection
+        if col is not None and col.library is not None:
+            total += 1
+            if col in references:
+                overridden += 1
+        elif "stream_library" in obj:
+            total += 1
+    PresMenuProperties.override_count_cache = [key, overridden, total]
+    return overridden, total
+
+# linked component that can be unloaded (overrides need their library)
+def is_streamable(instance):
+    col = instance.instance_collection
+    if col is None or col.library is None:
+        return False
+    return get_component_override(col) is None
+
+# replace the linked library of a component with a bounding box placeholder
+def unload_component(instance):
+    if "lod_proxy" in instance:
+        #stream the full component, the proxy goes with it
+        proxy = instance["lod_proxy"]
+        instance.instance_collection = instance["lod_full"]
+        del instance["lod_full"]
+        del instance["lod_proxy"]
+        if proxy.users == 0:
+            bpy.data.libraries.remove(proxy.library)
+    if not is_streamable(instance):
+        return False
+    col = instance.instance_collection
+    lib = col.library
+    corners = []
+    for obj in col.all_objects:
+        corners += [Matrix.Translation(-col.instance_offset) @ obj.matrix_world @ Vector(c) for c in obj.bound_box]
+    instance["stream_library"] = lib.filepath
+    instance["stream_collection"] = col.name
+    instance.instance_collection = None
+
+    #placeholder box, a child like the camera
+    placeholder = bpy.data.objects.new(instance.name + " PLACEHOLDER", None)
+    placeholder.empty_display_type = 'CUBE'
+    placeholder.hide_select = True
+    for collection in instance.users_collection:
+        collection.objects.link(placeholder)
+    placeholder.parent = instance
+    if corners:
+        box_min = Vector([min(c[i] for c in corners) for i in range(3)])
+        box_max = Vector([max(c[i] for c in corners) for i in range(3)])
+        placeholder.location = (box_min + box_max) / 2
+        placeholder.scale = [max((box_max[i] - box_min[i]) / 2, 0.01) for i in range(3)]
+
+    #the library goes with its last component
+    if not any(c.library == lib and c.users != 0 for c in bpy.data.collections):
+        remove_component_library(lib)
+    return True
+
+# link the library of a streamed component again
+def load_component(instance):
+    if instance.instance_collection is not None or "stream_library" not in instance:
+        return False
+    filepath = instance["stream_library"]
+    collection_name = instance["stream_collection"]
+    if not os.path.isfile(bpy.path.abspath(filepath)):
+        return False
+    with bpy.data.libraries.load(filepath, link=True) as (data_from, data_to):
+        data_to.collections = [name for name in data_from.collections if name == collection_name]
+    if len(data_to.collections) == 0 or data_to.collections[0] is None:
+        return False
+    instance.instance_type = 'COLLECTION'
+    instance.instance_collection = data_to.collections[0]
+    for child in list(instance.children):
+        if child.name.endswith(" PLACEHOLDER") and child.type == 'EMPTY':
+            bpy.data.objects.remove(child)
+    del instance["stream_library"]
+    del instance["stream_collection"]
+    return True
+
+#------------------------------------------------------------
+
+# queue loading the components around the given frames and unloading the rest
+def update_streaming(scene, frames_around):
+    pres_tool = scene.my_pres_tool
+    if not pres_tool.stream_components or PresMenuProperties.prerender_playing:
+        return
+    frames, loops, sections = get_slide_index(scene)
+    instances = get_section_instances(scene)
+    k = pres_tool.stream_window
+    current = [max(bisect.bisect_right(sections, frame) - 1, 0) for frame in frames_around]
+    wanted = set()
+    for section in current:
+        wanted.update(range(max(section-k, 0), min(section+k+1, len(sections))))
+    queue = []
+    for n in sorted(wanted, key=lambda n: min(abs(n - c) for c in current)):
+        if instances[n] is not None and instances[n].instance_collection is None:
+            queue.append([instances[n].name, True])
+    for n, instance in enumerate(instances):
+        if n not in wanted and instance is not None and instance.instance_collection is not None:
+            queue.append([instance.name, False])
+    PresMenuProperties.stream_queue = queue
+    if queue and not bpy.app.timers.is_registered(stream_components_timer):
+        bpy.app.timers.register(stream_components_timer)
+
+# one component per tick, so the slideshow keeps running while loading
+def stream_components_timer():
+    queue = PresMenuProperties.stream_queue
+    if not queue:
+        return None
+    name, load = queue.pop(0)
+    instance = bpy.data.objects.get(name)
+    if instance is None:
+        return 0.01
+    if load:
+        changed = load_component(instance)
+    else:
+        changed = unload_component(instance)
+    #bounding boxes of the camera view culling changed
+    if changed and PresMenuProperties.culling_targets:
+        build_culling_grid(PresMenuProperties.culling_targets)
+    return 0.01 if queue else None
+
+# stream from the current frame, or load everything back for editing
+def toggle_streaming(scene):
+    if scene.my_pres_tool.stream_components:
+        update_streaming(scene, [scene.frame_current])
+        return
+    PresMenuProperties.stream_queue = []
+    for obj in scene.objects:
+        if "stream_library" in obj:
+            load_component(obj)
+
+#------------------------------------------------------------
+
+# link the built proxies next to the full components, both stay in use
+def prepare_lod(scene):
+    for instance in get_section_instances(scene):
+        if instance is None or "lod_proxy_file" not in instance or "lod_proxy" in instance:
+            continue
+        if not is_streamable(instance) or not os.path.exists(instance["lod_proxy_file"]):
+            continue
+        full = instance.instance_collection
+        with bpy.data.libraries.load(instance["lod_proxy_file"], link=True) as (data_from, data_to):
+            data_to.collections = [name for name in data_from.collections if name == full.name]
+        if len(data_to.collections) == 0 or data_to.collections[0] is None:
+            continue
+        #id properties keep a user, the hidden one is not lost on save
+        instance["lod_full"] = full
+        instance["lod_proxy"] = data_to.collections[0]
+
+def set_component_lod(instance, proxy):
+    if "lod_proxy" not in instance:
+        return
+    col = instance["lod_proxy"] if proxy else instance["lod_full"]
+    if instance.instance_collection != col:
+        instance.instance_collection = col
+
+# full detail around the given frames (or near the camera), proxies elsewhere
+def update_lod(scene, frames_around):
+    pres_tool = scene.my_pres_tool
+    if pres_tool.lod_mode == "NONE" or PresMenuProperties.prerender_playing:
+        return
+    frames, loops, sections = get_slide_index(scene)
+    instances = get_section_instances(scene)
+    if pres_tool.lod_mode == "DISTANCE":
+        if scene.camera is None:
+            return
+        cam = scene.camera.matrix_world.translation
+        for instance in instances:
+            if instance is not None:
+                set_component_lod(instance, (instance.matrix_world.translation - cam).length > pres_tool.lod_distance)
+        return
+    k = pres_tool.lod_window
+    full = set()
+    for frame in frames_around:
+        section = max(bisect.bisect_right(sections, frame) - 1, 0)
+        full.update(range(max(section-k, 0), min(section+k+1, len(sections))))
+    for n, instance in enumerate(instances):
+        if instance is not None:
+            set_component_lod(instance, n not in full)
+
+# full components back, the proxy libraries are dropped
+def clear_lod(scene):
+    for obj in scene.objects:
+        if "lod_proxy" not in obj:
+            continue
+        proxy = obj["lod_proxy"]
+        obj.instance_collection = obj["lod_full"]
+        del obj["lod_full"]
+        del obj["lod_proxy"]
+        if proxy is not None and proxy.users == 0 and proxy.library is not None:
+            bpy.data.libraries.remove(proxy.library)
+
+#------------------------------------------------------------
+
+# objects of a section, the override replaces the linked objects
+def get_section_objects(section):
+    objects = []
+    for target in section:
+        if isinstance(target, bpy.types.Collection):
+            objects = list(target.all_objects)
+    if not objects:
+        for target in section:
+            if not isinstance(target, bpy.types.Collection) and target.instance_collection is not None:
+                objects = list(target.instance_collection.all_objects)
+    for target in section:
+        if not isinstance(target, bpy.types.Collection):
+            objects.append(target)
+            objects += [child for child in target.children if child.type == 'CAMERA']
+    return objects
+
+# animated fcurves of the actions in use (active and nla strips)
+def get_animated_fcurves(anim):
+    if anim is None:
+        return set()
+    actions = set()
+    if anim.action is not None:
+        actions.add(anim.action)
+    for track in anim.nla_tracks:
+        for strip in track.strips:
+            if strip.action is not None:
+                actions.add(strip.action)
+    return {(action.name, fc.data_path, fc.array_index) for action in actions for fc in action.fcurves}
+
+# counts and texture memory of one component
+def measure_component(objects):
+    meshes = set()
+    materials = set()
+    fcurves = set()
+    drivers = 0
+    constraints = 0
+    for obj in objects:
+        if obj.type == 'MESH':
+            meshes.add(obj.data)
+        for slot in obj.material_slots:
+            if slot.material is not None:
+                materials.add(slot.material)
+        fcurves |= {(obj.name,) + fc for fc in get_animated_fcurves(obj.animation_data)}
+        if obj.animation_data is not None:
+            drivers += sum(1 for d in obj.animation_data.drivers if d.driver.type == 'SCRIPTED')
+        constraints += len(obj.constraints)
+    images = set()
+    for mat in materials:
+        if mat.node_tree is None:
+            continue
+        fcurves |= {(mat.name,) + fc for fc in get_animated_fcurves(mat.node_tree.animation_data)}
+        for node in mat.node_tree.nodes:
+            if node.type == 'TEX_IMAGE' and node.image is not None:
+                images.add(node.image)
+    texture_bytes = 0
+    for img in images:
+        w, h = img.size
+        texture_bytes += w * h * max(img.channels, 1) * (4 if img.is_float else 1)
+    return {"objects": len(objects), "polygons": sum(len(mesh.polygons) for mesh in meshes),
+            "materials": len(materials), "texture_mb": texture_bytes / (1024 * 1024),
+            "fcurves": len(fcurves), "drivers": drivers, "constraints": constraints}
+
+# average time of evaluating a frame, sampled evenly over the range
+def measure_evaluation(scene, frame_start, frame_end, samples):
+    step = max((frame_end - frame_start + 1) // samples, 1)
+    frames = list(range(frame_start, frame_end + 1, step))[:samples]
+    start = time.perf_counter()
+    for frame in frames:
+        scene.frame_set(frame)
+    return (time.perf_counter() - start) * 1000 / max(len(frames), 1)
+
+# resources of every component, flagged against the budgets
+def analyse_components(scene):
+    pres_tool = scene.my_pres_tool
+    frames, loops, sections = get_slide_index(scene)
+    targets = get_section_targets(scene)
+    #timers of the overridden components name them, linked ones go by their instance
+    names = {}
+    for comp in get_components(scene):
+        if comp["instance"] is not None:
+            names[comp["instance"].name] = comp["name"].split(" TIMER STRIP")[0]
+    current = scene.frame_current
+    report = []
+    for n, section in enumerate(targets):
+        frame_start = sections[n]
+        frame_end = sections[n+1] - 1 if n + 1 < len(sections) else scene.frame_end
+        instance = next((t for t in section if not isinstance(t, bpy.types.Collection)), None)
+        if instance is not None:
+            name = names.get(instance.name, instance.name)
+        else:
+            name = "Section " + str(n+1)
+        entry = {"name": name, "frame_start": frame_start, "frame_end": frame_end}
+        entry.update(measure_component(get_section_objects(section)))
+        entry["eval_ms"] = measure_evaluation(scene, frame_start, frame_end, pres_tool.report_samples)
+        flags = []
+        if entry["polygons"] > pres_tool.budget_polygons:
+            flags.append("POLYGONS")
+        if entry["texture_mb"] > pres_tool.budget_texture_mb:
+            flags.append("TEXTURES")
+        if entry["eval_ms"] > pres_tool.budget_eval_ms:
+            flags.append("EVALUATION")
+        entry["flags"] = flags
+        report.append(entry)
+    scene.frame_set(current)
+    return report
+
+#------------------------------------------------------------
+
+# set up the player to go to the next (direction 1) or previous (-1) stop
+def navigate_presentation(context, direction):
+    scene = context.scene
+    player = PresentationPlayer
+    stops, loops, sections = get_slide_index(scene)
+    frame = scene.frame_current
+    loop = player.loop if player.state == "LOOPING" else find_loop(loops, frame)
+
+    if direction > 0:
+        if loop is not None:
+            #break the loop
+            frame = loop[1] + 1
+        else:
+            #standing on a loop start -> play the loop
+            for l in loops:
+                if l[0] == frame:
+                    update_culling(scene, [frame])
+                    update_streaming(scene, [frame])
+                    update_lod(scene, [frame])
+                    player.start(context, "LOOPING", frame, 1, l)
+                    return
+        i = bisect.bisect_right(stops, frame)
+        target = stops[i] if i < len(stops) else scene.frame_end
+    else:
+        if loop is not None:
+            frame = loop[0] - 1
+        i = bisect.bisect_left(stops, frame) - 1
+        target = stops[i] if i >= 0 else scene.frame_start
+
+    if frame != scene.frame_current:
+        scene.frame_set(frame)
+    #only the stops are pre-rendered, no transition to play
+    if PresMenuProperties.prerender_playing and scene.my_pres_tool.prerender_range == "STOPS":
+        scene.frame_set(target)
+        return
+    #current and target component visible during the transition
+    update_culling(scene, [scene.frame_current, target])
+    #load ahead in the direction of the talk
+    update_streaming(scene, [scene.frame_current, target])
+    update_lod(scene, [scene.frame_current, target])
+    player.start(context, "PLAYING", target, direction, None)
+
+# remember the achieved frame rate of a played transition
+def log_transition(scene, frame_from, frame_to, seconds, drawn, fps):
+    frames = abs(frame_to - frame_from)
+    if frames == 0:
+        return
+    entry = {"from": frame_from, "to": frame_to, "frames": frames, "drawn": drawn,
+             "seconds": round(seconds, 3), "planned_seconds": round(frames / fps, 3),
+             "fps": round(drawn / seconds, 1) if seconds > 0 else fps,
+             "realtime": scene.my_pres_tool.realtime_transitions}
+    PresMenuProperties.transition_log.append(entry)
+    PresMenuProperties.transition_status = ("Last transition: " + str(entry["seconds"]) + " s at " + str(entry["fps"])
+                                            + " fps, " + str(frames - min(drawn, frames)) + " frames skipped")
+
+# write the transition log of the slideshow next to the timed components
+def save_transition_log(scene):
+    if len(PresMenuProperties.transition_log) == 0 or not bpy.data.is_saved:
+        return None
+    if not os.path.exists(get_presentation_dir()):
+        os.makedirs(get_presentation_dir())
+    path = os.path.join(get_presentation_dir(), "transition_log.json")
+    fps = scene.render.fps / scene.render.fps_base
+    with open(path, "w") as f:
+        json.dump({"fps": fps, "transitions": PresMenuProperties.transition_log}, f, indent=2)
+    return path
+
+#------------------------------------------------------------
+
+# scale image to fit the camera
+def normalizeImageDimensions(img_obj, max_y, i):
+    dimensions, max_y = fit_image_dimensions(tuple(img_obj.dimensions), max_y, i)
+    img_obj.dimensions = dimensions
+    return max_y 
+
+
+# -----------------------------------------------------------------------------------------------------
+#                                             HANDLERS
+# -----------------------------------------------------------------------------------------------------
+        
+# called every frame while playing the baked camera path
+def baked_camera_handler(scene):
+    if len(PresMenuProperties.camera_bake) == 0:
+        return
+    presenter = scene.objects.get("=> PRESENTER CAMERA")
+    if presenter is None:
+        return
+    frame_start, table = PresMenuProperties.camera_bake
+    frames = len(table) // BAKE_STRIDE
+    i = min(max(scene.frame_current - frame_start, 0), frames-1)
+    o = i * BAKE_STRIDE
+    presenter.location = table[o:o+3]
+    presenter.rotation_quaternion = table[o+3:o+7]
+    presenter.scale = table[o+7:o+10]
+    presenter.data.lens = table[o+10]
+
+
+#------------------------------------------------------------
+
+# add the editing handlers (only for files with a presentation)
+def activate_presentation_handlers():
+    if nla_handler not in bpy.app.handlers.depsgraph_update_pre:
+        bpy.app.handlers.depsgraph_update_pre.append(nla_handler)
+    if lazy_override_handler not in bpy.app.handlers.depsgraph_update_post:
+        bpy.app.handlers.depsgraph_update_post.append(lazy_override_handler)
+
+def deactivate_presentation_handlers():
+    if nla_handler in bpy.app.handlers.depsgraph_update_pre:
+        bpy.app.handlers.depsgraph_update_pre.remove(nla_handler)
+    if lazy_override_handler in bpy.app.handlers.depsgraph_update_post:
+        bpy.app.handlers.depsgraph_update_post.remove(lazy_override_handler)
+
+# turn the editing handlers on or off for the opened file
+@persistent
+def load_presentation_handler(dummy):
+    presentation = False
+    for scene in bpy.data.scenes:
+        if scene.my_pres_tool.is_presentation:
+            presentation = True
+    #files from older versions have no flag yet
+    if not presentation:
+        for scene in bpy.data.scenes:
+            if any("COMPONENT TIMER" in obj.name for obj in scene.objects):
+                scene.my_pres_tool.is_presentation = True
+                presentation = True
+    if presentation:
+        activate_presentation_handlers()
+    else:
+        deactivate_presentation_handlers()
+
+    #runtime caches belong to the previous file, the stored state is read as it is
+    PresMenuProperties.camera_bake = []
+    PresMenuProperties.culling_targets = []
+    PresMenuProperties.culling_visible = set()
+    PresMenuProperties.culling_boxes = []
+    PresMenuProperties.culling_grid = {}
+    PresMenuProperties.override_queue.clear()
+    PresMenuProperties.prerender_playing = False
+    PresMenuProperties.transition_log = []
+    PresMenuProperties.transition_status = ""
+    PresMenuProperties.stream_queue = []
+    PresMenuProperties.slide_request = None
+    PresMenuProperties.write_queue = None
+    PresMenuProperties.write_job = None
+    PresMenuProperties.write_status = ""
+    PresMenuProperties.template_status = ""
+    PresMenuProperties.type_registry_dirty = True
+    PresMenuProperties.template_filter_cache = []
+    PresMenuProperties.override_count_cache = []
+    if type_registry_update_handler in bpy.app.handlers.depsgraph_update_post:
+        bpy.app.handlers.depsgraph_update_post.remove(type_registry_update_handler)
+    load_slide_index(bpy.context.scene)
+
+#------------------------------------------------------------
+
+# override a linked component when it is picked for editing
+@persistent
+def lazy_override_handler(scene):
+    if not scene.my_pres_tool.is_presentation or not scene.my_pres_tool.lazy_override:
+        return
+    obj = bpy.context.view_layer.objects.active if bpy.context.view_layer else None
+    if obj is None or obj.instance_type != 'COLLECTION' or obj.instance_collection is None:
+        return
+    if obj.instance_collection.library is None or obj.name in PresMenuProperties.override_queue:
+        return
+    if get_component_override(obj.instance_collection) is not None:
+        return
+    if not obj.select_get():
+        return
+    #can't change data while the depsgraph is updating -> override in a timer
+    PresMenuProperties.override_queue.add(obj.name)
+    bpy.app.timers.register(override_queued_components, first_interval=0)
+
+
+#------------------------------------------------------------
+
+# called every time the scene or nla or anything changes
+@persistent
+def nla_handler(scene):
+    if not scene.my_pres_tool.is_presentation:
+        return
+    pres_tool = bpy.context.scene.my_pres_tool
+    #markers moved in this update, a strip moved onto another one doesnt move them twice
+    moved = []
+    #stored timers, no need to walk the scene
+    for nla_name in pres_tool.timers.keys():
+        item = pres_tool.timers[nla_name]
+        obj = item.timer
+        if obj is not None and obj.animation_data is not None:
+            nla_start = round(obj.animation_data.nla_tracks[0].strips[0].frame_start)
+            nla_end = round(obj.animation_data.nla_tracks[0].strips[0].frame_end)
+            nla_len = nla_end - nla_start
+            if nla_name != '':
+                #strip moved -> update strips, markers and drivers
+                if item.start != nla_start:
+                    
+                    #strip snapping while overlaping
+                    #problem when strips contain one another after -> strip is scaled and unusable
+                    """
+                    if len(bpy.context.selected_nla_strips) == 1:
+                        #snap
+                        restart = True
                         forward = True
                         back    = True
                         while restart:
@@ -933,18 +4198,24 @@ def nla_handler(scene):
                                     restart = True
                     """
                                     
-                    #move markers
+                    #move markers in the old range of the strip (also the ones dragged since the last refresh)
+                    diff = nla_start - item.start
+                    item.markers.clear()
                     for m in bpy.context.scene.timeline_markers:
-                        if m in pres_tool.marker_timers[nla_name]:
-                            diff = nla_start - pres_tool.nla_strips[nla_name][0]
+                        if item.start <= m.frame <= item.end and m not in moved:
                             m.frame += diff
-                    check_marker_loops()
+                            moved.append(m)
+                            marker = item.markers.add()
+                            marker.name = m.name
+                            marker.frame = m.frame
                             
                     #update strips list
-                    pres_tool.nla_strips[nla_name][0] = nla_start
-                    pres_tool.nla_strips[nla_name][1] = nla_end
-                    tmp_dict = dict(sorted(pres_tool.nla_strips.items(), key=lambda item: item[1][0]))
-                    pres_tool.nla_strips = tmp_dict
+                    item.start = nla_start
+                    item.end = nla_end
+                    sort_timer_items(pres_tool)
+
+                    #timing changed -> baked camera path is out of date
+                    invalidate_deck_bake(bpy.context.scene)
                     
                     #update drivers (move other strips)
                     for o in bpy.context.scene.objects:
@@ -956,20 +4227,18 @@ def nla_handler(scene):
                         
                     #update interpolation cameras
                     cam_strips = set()
-                    for i, cam in enumerate(pres_tool.camera_objects):
-                        if i == len(pres_tool.camera_objects)-1:
-                            break
+                    timers = pres_tool.timers
+                    for i in range(len(timers)-1):
+                        cam = timers[i].camera
+                        if cam is None:
+                            continue
                         try:
-                            #list of nla ranges [start, end]
-                            nla_list = list(pres_tool.nla_strips.values())
-                            cam.animation_data.nla_tracks[1].strips[0].frame_start = nla_list[i][1]
-                            cam.animation_data.nla_tracks[1].strips[0].frame_end = nla_list[i+1][0]
+                            cam.animation_data.nla_tracks[1].strips[0].frame_start = timers[i].end
+                            cam.animation_data.nla_tracks[1].strips[0].frame_end = timers[i+1].start
                             cam_strips.add(cam.animation_data.nla_tracks[1].strips[0])
                         except:
-                            #list of nla ranges [start, end]
-                            nla_list = list(pres_tool.nla_strips.values())
-                            cam.animation_data.nla_tracks[0].strips[0].frame_start = nla_list[i][1]
-                            cam.animation_data.nla_tracks[0].strips[0].frame_end = nla_list[i+1][0]
+                            cam.animation_data.nla_tracks[0].strips[0].frame_start = timers[i].end
+                            cam.animation_data.nla_tracks[0].strips[0].frame_end = timers[i+1].start
                             cam_strips.add(cam.animation_data.nla_tracks[0].strips[0])
                             
                     #fix strip keyframe scale (changed while moving strip for some reason)
@@ -1028,24 +4297,23 @@ class AssignObjectType(bpy.types.Operator):
     bl_idname = 'presentation.assign_object_type'
     bl_label = 'Assign type to selected objects'
     
+    # assign to the objects shown in the template list instead of the selected ones
+    listed: bpy.props.BoolProperty(name="Listed objects", default=False)
+    
     def execute(self, context):
         pres_tool = bpy.context.scene.my_pres_tool
-        pres_tool.assigned_types = {'H1':0, 'H2':0, 'OL':0, 'UL':0, 'IMAGE':0, 'NUMBER':0}
         
         # check current types
-        for obj in bpy.data.objects:
-            try:
-                if '.' in obj["OBJECT TYPE"]:
-                    type_list = obj["OBJECT TYPE"].split('.')
-                    type = type_list[0]
-                    pres_tool.assigned_types[type] += 1
-                else:
-                    pres_tool.assigned_types[obj["OBJECT TYPE"]] += 1
-            except:
-                continue
+        counts = get_type_counts()
+        pres_tool.assigned_types = {type: counts.get(type, 0) for type in ['H1', 'H2', 'OL', 'UL', 'IMAGE', 'NUMBER']}
+        
+        if self.listed and PresMenuProperties.template_filter_cache:
+            objects = [bpy.data.objects[name] for name in PresMenuProperties.template_filter_cache[2] if name in bpy.data.objects]
+        else:
+            objects = bpy.context.selected_objects
         
         # assign type to selected
-        for obj in bpy.context.selected_objects:
+        for obj in objects:
             if pres_tool.object_type in ['H1','H2','OL','UL','NUMBER'] and obj.type != 'FONT':
                 self.report({'WARNING'}, "Object " + obj.name + " is not a Text Object!")
                 continue
@@ -1053,7 +4321,7 @@ class AssignObjectType(bpy.types.Operator):
                 self.report({'WARNING'}, "Object " + obj.name + " is not a Mesh Object!")
                 continue
 
-            obj["OBJECT TYPE"] = getCorrectTypeName(pres_tool.object_type)
+            set_object_type(obj, getCorrectTypeName(pres_tool.object_type))
             
         return{'FINISHED'}
 
@@ -1121,20 +4389,19 @@ class CreateComponentFromTemplate(bpy.types.Operator):
     bl_idname = 'presentation.component_from_template'
     bl_label = 'Generate Component'
     
-    def execute(self, context):
+    def start(self, context):
         pres_tool = bpy.context.scene.my_pres_tool
         
         if not bpy.data.is_saved:
             self.report({'WARNING'}, "Save this .blend file first.")
-            return {'CANCELLED'}
+            return False
         
         pres_tool.this_file = bpy.data.filepath
 
         # fix the path
         if "//" in pres_tool.json_path:
             tmp = pres_tool.json_path.split("//")
-            p = pres_tool.this_file.split("\\")
-            this_dir = ("\\").join(p[:-1])
+            this_dir = os.path.dirname(pres_tool.this_file)
             filename = os.path.join(this_dir, tmp[1])
             pres_tool.json_path = filename
 
@@ -1145,68 +4412,67 @@ class CreateComponentFromTemplate(bpy.types.Operator):
             f.close()
         except:
             self.report({'ERROR'}, "FILE ERROR. Can't open file " + pres_tool.json_path + ". Make sure it is an existing and valid JSON file. If the problem continues, try moving the JSON file to the same folder as the template.blend file and set the path manually to \"//filename.json\"")
-            return {'CANCELLED'}
+            return False
         
-        bpy.ops.wm.save_as_mainfile(filepath=pres_tool.this_file)
+        # the background blender reads the template from the disk
+        if bpy.data.is_dirty:
+            bpy.ops.wm.save_mainfile()
         
-        unused_keys = set()
+        self.total = len(data)
+        self.progress = os.path.join(os.path.dirname(pres_tool.this_file), ".template_progress.txt")
+        if os.path.exists(self.progress):
+            os.remove(self.progress)
+        job = {"data": pres_tool.json_path, "out_dir": os.path.dirname(pres_tool.this_file), "progress": self.progress}
+        self.job_path = os.path.join(os.path.dirname(pres_tool.this_file), ".template_job.json")
+        self.worker = start_template_worker(pres_tool.this_file, job, self.job_path)
+        return True
 
-        # fill the objects with json data        
-        slide_cnt = len(data)
-        for n, slide in enumerate(data):
-            for key in data[slide]:
-                key_found = False
-                for obj in bpy.data.objects:
-                    try:
-                        if bpy.data.objects[obj.name]["OBJECT TYPE"] == key:
-                            key_found = True
-                            if "H1" in key or "H2" in key:
-                                obj.data.body = data[slide][key]
-                                break
-                            if "OL" in key:
-                                for i, line in enumerate(data[slide][key]):
-                                    if i == 0:
-                                        obj.data.body = str(i+1) + ". " + line
-                                    else:
-                                        obj.data.body += "\n" + str(i+1) + ". " + line
-                                break
-                            if "UL" in key:
-                                for i, line in enumerate(data[slide][key]):
-                                    if i == 0:
-                                        obj.data.body = "- " + line
-                                    else:
-                                        obj.data.body += "\n- " + line
-                                break
-                            if "IMAGE" in key:
-                                img = bpy.data.images.load(filepath = data[slide][key])
-                                mat = bpy.data.materials.new(name="New_Mat")
-                                mat.use_nodes = True
-                                bsdf = mat.node_tree.nodes["Principled BSDF"]
-                                texImage = mat.node_tree.nodes.new('ShaderNodeTexImage')
-                                texImage.image = img
-                                mat.node_tree.links.new(bsdf.inputs['Base Color'], texImage.outputs['Color'])
-                                if obj.data.materials:
-                                    obj.data.materials[0] = mat
-                                else:
-                                    obj.data.materials.append(mat)
-                                break
-                        elif bpy.data.objects[obj.name]["OBJECT TYPE"] == "NUMBER":
-                            obj.data.body = str(n+1) + "/" + str(slide_cnt)
-                            key_found = True
-                    except:
-                        continue
-            # save it as new file
-            dir = bpy.data.filepath.split("\\")
-            dir = dir[:-1]
-            dir_str = "\\".join(dir)
-            slide_str = str(slide) + ".blend"
-            self.report({'INFO'}, "Creating file " + os.path.join(dir_str, slide_str))
-            bpy.ops.wm.save_as_mainfile(filepath = os.path.join(dir_str, slide_str))
-            
-        bpy.ops.wm.open_mainfile(filepath=pres_tool.this_file)     
-                
-        
-        return{'FINISHED'}
+    def execute(self, context):
+        if not self.start(context):
+            return {'CANCELLED'}
+        self.worker.wait()
+        return self.finish(context)
+
+    def invoke(self, context, event):
+        if not self.start(context):
+            return {'CANCELLED'}
+        PresMenuProperties.template_status = "Creating components: 0 / " + str(self.total)
+        self.timer = context.window_manager.event_timer_add(0.5, window=context.window)
+        context.window_manager.modal_handler_add(self)
+        return {'RUNNING_MODAL'}
+
+    def modal(self, context, event):
+        if event.type != 'TIMER' or event.timer != self.timer:
+            return {'PASS_THROUGH'}
+        PresMenuProperties.template_status = "Creating components: " + str(len(self.get_created())) + " / " + str(self.total)
+        for area in context.screen.areas:
+            if area.type == 'VIEW_3D':
+                area.tag_redraw()
+        if self.worker.poll() is None:
+            return {'PASS_THROUGH'}
+        context.window_manager.event_timer_remove(self.timer)
+        PresMenuProperties.template_status = ""
+        return self.finish(context)
+
+    # files written by the background blender so far
+    def get_created(self):
+        try:
+            with open(self.progress) as f:
+                return [line.strip() for line in f if line.strip() != ""]
+        except OSError:
+            return []
+
+    def finish(self, context):
+        created = self.get_created()
+        for path in (self.progress, self.job_path):
+            if os.path.exists(path):
+                os.remove(path)
+        for path in created:
+            self.report({'INFO'}, "Created file " + path)
+        if len(created) != self.total:
+            self.report({'ERROR'}, str(self.total - len(created)) + " component(s) could not be created.")
+            return {'CANCELLED'}
+        return {'FINISHED'}
 
 
 #------------------------------------------------------------  
@@ -1247,7 +4513,7 @@ class ChooseImage(bpy.types.Operator):
             filename = os.path.join(self.directory, file.name)
             if os.path.isfile(filename):
                 #image files -> get ready for import
-                bpy.context.scene.my_pres_tool.image_list.append(filename)
+                bpy.context.scene.my_pres_tool.image_list.add().filepath = filename
                 pres_tool.image_chosen += 1
             else:
                 #file not found
@@ -1279,7 +4545,7 @@ class AddImage(bpy.types.Operator):
         
         #import slides
         for i, file in enumerate(pres_tool.image_list[n_tmp:]):
-            filename = file
+            filename = file.filepath
             if os.path.isfile(filename): 
 
                 #create unique collection for the images
@@ -1308,9 +4574,7 @@ class AddImage(bpy.types.Operator):
                     bpy.context.scene.collection.children.link(collection)
                     
                 #import images as planes
-                f = filename.split("\\")
-                name = f[-1]
-                dir = ("\\").join(f[:-1])
+                dir, name = os.path.split(filename)
                 try:
                     bpy.ops.preferences.addon_enable(module="io_import_images_as_planes")
                     bpy.ops.import_image.to_plane(files=[{"name":name, "name":name}], directory=dir, relative=False)
@@ -1329,76 +4593,13 @@ class AddImage(bpy.types.Operator):
                 pres_tool.image_chosen -= 1
 
                 #arrange images
-                if pres_tool.slide_position == "x_axis":
-                    #set width to 1
-                    if i == 0:
-                        max_y = 0
-                    max_y = normalizeImageDimensions(bpy.context.object, max_y, i)
-                    #set rotation
-                    bpy.context.object.rotation_euler[0] = radians(90.0)
-                    bpy.context.object.rotation_euler[2] = 0
-                    #set location 
-                    bpy.context.object.location[0] = i
-                    bpy.context.object.location[1] = sin(radians(60.0))
-                    bpy.context.object.location[2] = 0
-                    z_rot = 60.0
-                elif pres_tool.slide_position == "y_axis":
-                    #set width to 1
-                    if i == 0:
-                        max_y = 0
-                    max_y = normalizeImageDimensions(bpy.context.object, max_y, i)
-                    #set rotation
-                    bpy.context.object.rotation_euler[0] = radians(90.0)
-                    bpy.context.object.rotation_euler[2] = 0
-                    #set location 
-                    bpy.context.object.location[0] = 0
-                    bpy.context.object.location[1] = (i+1)*sin(radians(60.0))
-                    bpy.context.object.location[2] = 0
-                    z_rot = 60.0
-                elif pres_tool.slide_position == "z_axis":
-                    #set width to 1
-                    if i == 0:
-                        max_y = 0
-                    max_y = normalizeImageDimensions(bpy.context.object, max_y, i)
-                    #set rotation
-                    bpy.context.object.rotation_euler[0] = radians(90.0)
-                    bpy.context.object.rotation_euler[2] = radians(-90.0)
-                    #set location 
-                    bpy.context.object.location[0] = sin(radians(60.0))
-                    bpy.context.object.location[1] = 0
-                    bpy.context.object.location[2] = -i
-                    z_rot = 60.0
-                elif pres_tool.slide_position == "circle":
-                    n = total
-                    z_rot = 360/n                      #z rotation
-                    alpha = (n-2)*180/n                #inner angle
-                    s = 1                              #polygon side length
-                    r1 = s/(2*sin(radians(180.0)/n))   #outer circle radius
-                    r2 = s/(2*tan(radians(180.0)/n))   #inner circle radius
-                    v = sin(alpha/2)*r1                #triangle height
-                    
-                    #set rotation
-                    bpy.context.object.rotation_euler[0] = radians(90.0)
-                    bpy.context.object.rotation_euler[2] = radians(-i*z_rot-90)
-                    #set location 
-                    if n == 1:
-                        bpy.context.object.location[0] = sin(radians(60.0))
-                        bpy.context.object.location[1] = 0
-                        bpy.context.object.location[2] = 0
-                        z_rot = 60.0
-                    elif n == 2:
-                        bpy.context.object.location[0] = pow(-1,i)*sin(radians(60.0))
-                        bpy.context.object.location[1] = 0
-                        bpy.context.object.location[2] = 0
-                        z_rot = 60.0
-                    else:
-                        bpy.context.object.location[0] = cos(-i*2*pi/n)*r2
-                        bpy.context.object.location[1] = sin(-i*2*pi/n)*r2
-                        bpy.context.object.location[2] = 0
-                    #set width to 1
-                    if i == 0:
-                        max_y = 0
-                    max_y = normalizeImageDimensions(bpy.context.object, max_y, i)
+                if i == 0:
+                    max_y = 0
+                max_y = normalizeImageDimensions(bpy.context.object, max_y, i)
+                location, rotation, z_rot = get_image_placement(i, total, pres_tool.slide_position)
+                bpy.context.object.rotation_euler[0] = radians(90.0)
+                bpy.context.object.rotation_euler[2] = rotation
+                bpy.context.object.location = location
 
             else:
                 self.report({'ERROR'}, os.path.split(filename)[1]+' FILE NOT FOUND')
@@ -1527,81 +4728,324 @@ class ChooseSlide(bpy.types.Operator):
     def execute(self, context):
         pres_tool = bpy.context.scene.my_pres_tool
         
+        if PresMenuProperties.write_queue is not None:
+            self.report({'WARNING'}, "Wait until the chosen Components are written.")
+            return {'CANCELLED'}
+        if not bpy.data.is_saved:
+            self.report({'WARNING'}, "Save this .blend file first.")
+            return {'CANCELLED'}
+
         if pres_tool.slide_count == 0 and pres_tool.slides_chosen == 0:
             time = 1
-            total = 1
         else:
             time = bpy.context.scene.frame_end
-            total = bpy.context.scene.frame_end
             
         n_tmp = pres_tool.slides_chosen
         pres_tool.slides_chosen = 0
-        raise_collection_warning = False
-        
-        if not bpy.data.is_saved:
-            self.report({'WARNING'}, "Save this .blend file first.")
-            return {'CANCELLED'}
         pres_tool.this_file = bpy.data.filepath
 
         #check for markers file and delete it
-        p = bpy.data.filepath.split("\\")
-        this_dir = ("\\").join(p[:-1])
-        this_fullname = p[-1].split(".")
-        this_name = this_fullname[0]
+        this_dir, this_fullname = os.path.split(bpy.data.filepath)
+        this_name = this_fullname.split(".")[0]
         m_name = os.path.join(this_dir, this_name, "markers.txt")
         if os.path.exists(m_name) and n_tmp == 0:
             os.remove(m_name)
         
         #set camera interpolation time
-        if pres_tool.interpolate_camera is True:
-            interpolation_time = bpy.context.scene.render.fps * pres_tool.transition_time
-        else:
-            interpolation_time = 1
+        interpolation_time = get_interpolation_time()
         
         #check selected files
+        files = []
         for i, file in enumerate(self.files):
             filename = os.path.join(self.directory, file.name)
-            if os.path.isfile(filename):
-                #blender file -> change timing
-                f_name = pres_tool.this_file
-                bpy.ops.wm.save_mainfile(filepath=bpy.data.filepath)
-                cnt = pres_tool.slides_chosen + pres_tool.slide_count
-                if pres_tool.already_imported is False:
-                    cnt += n_tmp
-                total, more_collections = change_timimg(filename, time, interpolation_time, cnt, bpy.data.filepath)
-                if total == -1:
-                    #camera error -> abort
-                    bpy.ops.wm.open_mainfile(filepath=f_name)
-                    pres_tool = bpy.context.scene.my_pres_tool
-                    pres_tool.slides_chosen = 0
-                    pres_tool.slide_list = []
-                    #todo - reset selected files (???)
-                    self.report({'ERROR'}, filename + ': CAMERA ERROR. Make sure each component contains EXACTLY 1 CAMERA.')
-                    return{'CANCELLED'}
-                if more_collections is True:
-                    raise_collection_warning = True
-                time = total
-                bpy.ops.wm.open_mainfile(filepath=f_name)
-                pres_tool = bpy.context.scene.my_pres_tool
-                pres_tool.slides_chosen += 1
+            entry = get_catalogue_entry(filename) if os.path.isfile(filename) else None
+            if entry is not None and entry.get("cameras") != 1:
+                #known from the catalogue, no need to open it
+                self.report({'ERROR'}, file.name + ': CAMERA ERROR. Make sure each component contains EXACTLY 1 CAMERA.')
+            elif os.path.isfile(filename):
+                files.append(filename)
             else:
                 #file not found
                 self.report({'ERROR'}, os.path.split(filename)[1]+' FILE NOT FOUND')
-                                 
-        if raise_collection_warning is True:
-            self.report({'WARNING'}, str(filename) + ': UNSURE WHICH COLLECTION TO CHOOSE, CHOOSING THE ONE WITH A CAMERA.')
-            self.report({'INFO'}, 'Please name the collection that you want to use as "Component" to avoid this.')
-        
-        bpy.context.scene.frame_start = 1
-        bpy.context.scene.frame_end = total
-        pres_tool.slides_chosen += n_tmp 
-        n_tmp = 0 
-        
+
+        #timed copies are written by background blenders, this file stays open
+        PresMenuProperties.write_queue = {"scene": bpy.context.scene.name, "files": files, "count": len(files),
+                                          "time": time, "interpolation_time": interpolation_time, "n_tmp": n_tmp,
+                                          "warning": False, "error": None}
+        if not bpy.app.background:
+            bpy.ops.presentation.write_timed_components('INVOKE_DEFAULT')
+            return{'FINISHED'}
+
+        #no window to keep working in, wait for every copy
+        state = write_timed_components(bpy.context.scene)
+        while state == "RUNNING":
+            PresMenuProperties.write_job[0].wait()
+            state = write_timed_components(bpy.context.scene)
+        queue = finish_timed_components(bpy.context.scene, state)
+        if report_timed_components(self, queue, state):
+            return{'CANCELLED'}
         return{'FINISHED'}
 
-#------------------------------------------------------------  
+#------------------------------------------------------------  
+
+# errors and warnings of the written components, True if it failed
+def report_timed_components(operator, queue, state):
+    if state == "CAMERA_ERROR":
+        operator.report({'ERROR'}, queue["error"] + ': CAMERA ERROR. Make sure each component contains EXACTLY 1 CAMERA.')
+        return True
+    if queue["warning"] is True:
+        operator.report({'WARNING'}, 'UNSURE WHICH COLLECTION TO CHOOSE, CHOOSING THE ONE WITH A CAMERA.')
+        operator.report({'INFO'}, 'Please name the collection that you want to use as "Component" to avoid this.')
+    return False
+
+
+#------------------------------------------------------------  
+
+class WriteTimedComponents(bpy.types.Operator):
+    """Write the timed copies of the chosen Components in a background Blender, you can keep working"""
+    bl_idname = 'presentation.write_timed_components'
+    bl_label = 'Write Timed Components'
+
+    def invoke(self, context, event):
+        if PresMenuProperties.write_queue is None:
+            return {'CANCELLED'}
+        self.timer = context.window_manager.event_timer_add(0.25, window=context.window)
+        context.window_manager.modal_handler_add(self)
+        return {'RUNNING_MODAL'}
+
+    def modal(self, context, event):
+        if event.type != 'TIMER' or event.timer != self.timer:
+            return {'PASS_THROUGH'}
+        scene = bpy.data.scenes.get(PresMenuProperties.write_queue["scene"])
+        state = write_timed_components(scene) if scene is not None else "FINISHED"
+        for area in context.screen.areas:
+            if area.type == 'VIEW_3D':
+                area.tag_redraw()
+        if state == "RUNNING":
+            return {'PASS_THROUGH'}
+
+        context.window_manager.event_timer_remove(self.timer)
+        if scene is None:
+            PresMenuProperties.write_queue = None
+            PresMenuProperties.write_status = ""
+            return {'CANCELLED'}
+        queue = finish_timed_components(scene, state)
+        if report_timed_components(self, queue, state):
+            return {'CANCELLED'}
+        self.report({'INFO'}, str(scene.my_pres_tool.slides_chosen) + " Component(s) chosen.")
+        return {'FINISHED'}
+
+#------------------------------------------------------------  
+
+
+class ScanCatalogue(bpy.types.Operator):
+    """Scan the components folder in background Blender processes, only changed files are read again"""
+    bl_idname = 'presentation.scan_catalogue'
+    bl_label = 'Scan Catalogue'
+
+    def invoke(self, context, event):
+        pres_tool = bpy.context.scene.my_pres_tool
+        self.directory = os.path.normpath(bpy.path.abspath(pres_tool.catalogue_dir))
+        if not os.path.isdir(self.directory):
+            self.report({'WARNING'}, "Components folder not found.")
+            return {'CANCELLED'}
+        if not os.path.exists(get_catalogue_dir(self.directory)):
+            os.makedirs(get_catalogue_dir(self.directory))
+
+        old_index = load_catalogue_index(self.directory)
+        self.index = {}
+        #touched files, the workers hash them and read only the changed ones
+        # changed = {path: [old entry or None, mtime]}
+        self.changed = {}
+        for path in sorted(glob.glob(os.path.join(self.directory, "*.blend"))):
+            name = os.path.basename(path)
+            mtime = os.path.getmtime(path)
+            entry = old_index.get(name)
+            if entry is not None and entry.get("version") != CATALOGUE_VERSION:
+                entry = None
+            if entry is not None and entry["mtime"] == mtime:
+                self.index[name] = entry
+                continue
+            self.changed[path] = [entry, mtime]
+
+        if len(self.changed) == 0:
+            save_catalogue_index(self.directory, self.index)
+            fill_catalogue_items(bpy.context.scene, self.directory, self.index)
+            self.report({'INFO'}, "Catalogue is up to date, " + str(len(self.index)) + " components.")
+            return {'FINISHED'}
+
+        #split the touched files between the processes
+        files = [[path, entry["hash"] if entry is not None else None] for path, (entry, mtime) in self.changed.items()]
+        jobs = min(pres_tool.prerender_jobs, len(files))
+        self.workers = [start_catalogue_worker(self.directory, files[n::jobs], n) for n in range(jobs)]
+        self.timer = context.window_manager.event_timer_add(0.5, window=context.window)
+        context.window_manager.modal_handler_add(self)
+        return {'RUNNING_MODAL'}
+
+    def modal(self, context, event):
+        if event.type != 'TIMER' or event.timer != self.timer:
+            return {'PASS_THROUGH'}
+        done = sum(1 for path in self.changed if os.path.exists(os.path.join(get_catalogue_dir(self.directory), os.path.basename(path) + ".json")))
+        PresMenuProperties.catalogue_status = "Scanning components: " + str(done) + " / " + str(len(self.changed))
+        for area in context.screen.areas:
+            if area.type == 'VIEW_3D':
+                area.tag_redraw()
+        if any(worker.poll() is None for worker in self.workers):
+            return {'PASS_THROUGH'}
+
+        context.window_manager.event_timer_remove(self.timer)
+        PresMenuProperties.catalogue_status = ""
+        failed = 0
+        scanned = 0
+        for path, (old_entry, mtime) in self.changed.items():
+            result = os.path.join(get_catalogue_dir(self.directory), os.path.basename(path) + ".json")
+            try:
+                with open(result) as f:
+                    entry = json.load(f)
+                os.remove(result)
+            except (OSError, ValueError):
+                failed += 1
+                continue
+            if entry.get("unchanged"):
+                entry = old_entry
+            else:
+                scanned += 1
+            entry.update({"mtime": mtime, "version": CATALOGUE_VERSION})
+            self.index[os.path.basename(path)] = entry
+        save_catalogue_index(self.directory, self.index)
+        fill_catalogue_items(bpy.context.scene, self.directory, self.index)
+        if failed != 0:
+            self.report({'WARNING'}, str(failed) + " component(s) could not be read.")
+        else:
+            self.report({'INFO'}, "Scanned " + str(scanned) + " changed component(s).")
+        return {'FINISHED'}
+
+
+#------------------------------------------------------------  
+
+class ChooseFromCatalogue(bpy.types.Operator):
+    """Choose the selected components of the catalogue"""
+    bl_idname = 'presentation.choose_from_catalogue'
+    bl_label = 'Choose Selected Component(s)'
+
+    def execute(self, context):
+        pres_tool = bpy.context.scene.my_pres_tool
+        selected = [item for item in pres_tool.catalogue if item.selected]
+        if len(selected) == 0:
+            self.report({'WARNING'}, "No components selected in the catalogue.")
+            return {'CANCELLED'}
+        directory = os.path.dirname(selected[0].filepath)
+        files = [{"name": item.name} for item in selected]
+        for item in selected:
+            item.selected = False
+        bpy.ops.presentation.choose_slide('EXEC_DEFAULT', directory=directory, files=files)
+        return {'FINISHED'}
+
+
+#------------------------------------------------------------  
+
+class BuildLodProxies(bpy.types.Operator):
+    """Build simplified proxies of the components in background Blender processes, built proxies are reused"""
+    bl_idname = 'presentation.build_lod_proxies'
+    bl_label = 'Build LOD Proxies'
+
+    def invoke(self, context, event):
+        pres_tool = bpy.context.scene.my_pres_tool
+        if not bpy.data.is_saved:
+            self.report({'WARNING'}, "Save this .blend file first.")
+            return {'CANCELLED'}
+        if not os.path.exists(get_lod_dir()):
+            os.makedirs(get_lod_dir())
+        #hashes of the timed copies, written with them
+        load_file_hashes(os.path.dirname(get_lod_dir()))
+
+        #one proxy per timed component file
+        self.instances = {}
+        for instance in get_component_instances(bpy.context.scene):
+            filepath = bpy.path.abspath(instance.instance_collection.library.filepath)
+            if os.path.isfile(filepath):
+                self.instances.setdefault(filepath, []).append(instance.name)
+        if len(self.instances) == 0:
+            self.report({'WARNING'}, "No linked components, overridden components stay in full detail.")
+            return {'CANCELLED'}
+        self.proxies = {}
+        files = []
+        for filepath in self.instances:
+            proxy = get_lod_proxy_path(pres_tool, filepath)
+            self.proxies[filepath] = proxy
+            if not os.path.exists(proxy):
+                files.append([filepath, proxy])
+
+        if len(files) == 0:
+            self.finish(context)
+            self.report({'INFO'}, "Proxies are up to date.")
+            return {'FINISHED'}
+
+        jobs = min(pres_tool.prerender_jobs, len(files))
+        self.total = len(files)
+        self.workers = [start_lod_worker(pres_tool, files[n::jobs], n) for n in range(jobs)]
+        self.missing = [proxy for filepath, proxy in files]
+        self.timer = context.window_manager.event_timer_add(0.5, window=context.window)
+        context.window_manager.modal_handler_add(self)
+        return {'RUNNING_MODAL'}
+
+    def modal(self, context, event):
+        if event.type != 'TIMER' or event.timer != self.timer:
+            return {'PASS_THROUGH'}
+        done = sum(1 for proxy in self.missing if os.path.exists(proxy))
+        PresMenuProperties.lod_status = "Building proxies: " + str(done) + " / " + str(self.total)
+        for area in context.screen.areas:
+            if area.type == 'VIEW_3D':
+                area.tag_redraw()
+        if any(worker.poll() is None for worker in self.workers):
+            return {'PASS_THROUGH'}
+
+        context.window_manager.event_timer_remove(self.timer)
+        PresMenuProperties.lod_status = ""
+        self.finish(context)
+        failed = self.total - done
+        if failed != 0:
+            self.report({'WARNING'}, str(failed) + " proxy(s) could not be built, those components stay in full detail.")
+        else:
+            self.report({'INFO'}, "Built " + str(self.total) + " proxy(s).")
+        return {'FINISHED'}
+
+    # remember the proxy of every component instance
+    def finish(self, context):
+        for filepath, names in self.instances.items():
+            for name in names:
+                instance = bpy.data.objects.get(name)
+                if instance is None:
+                    continue
+                if os.path.exists(self.proxies[filepath]):
+                    instance["lod_proxy_file"] = self.proxies[filepath]
+                elif "lod_proxy_file" in instance:
+                    del instance["lod_proxy_file"]
+
+
+#------------------------------------------------------------  
+
+class ArrangeComponents(bpy.types.Operator):
+    """Lay out the components by their size, keeping the clearance between them"""
+    bl_idname = 'presentation.arrange_components'
+    bl_label = 'Arrange Components'
+
+    def execute(self, context):
+        pres_tool = bpy.context.scene.my_pres_tool
+        if pres_tool.layout_arrangement == "PATH" and pres_tool.layout_path is None:
+            self.report({'WARNING'}, "Choose a curve object for the Path layout.")
+            return {'CANCELLED'}
+        build_slide_index(bpy.context.scene)
+        count = arrange_components(bpy.context.scene)
+        if count == 0:
+            self.report({'WARNING'}, "No components found.")
+            return {'CANCELLED'}
+        self.report({'INFO'}, str(count) + " component(s) arranged.")
+        return {'FINISHED'}
 
 
+#------------------------------------------------------------  
+
 class AddSlide(bpy.types.Operator):
     """Import the selected Component .blend files and create a Presentation"""
     bl_idname = 'presentation.add_slide'
@@ -1609,71 +5053,40 @@ class AddSlide(bpy.types.Operator):
 
     def execute(self, context):
         pres_tool = bpy.context.scene.my_pres_tool
+        if PresMenuProperties.write_queue is not None:
+            self.report({'WARNING'}, "Wait until the chosen Components are written.")
+            return {'CANCELLED'}
         n_tmp = pres_tool.slide_count
         pres_tool.slide_count = 0
+        pres_tool.is_presentation = True
+        activate_presentation_handlers()
         
         #import slides
         for i, file in enumerate(pres_tool.slide_list[n_tmp:]):
-            filename = file[0]
+            filename = file.filepath
             if os.path.isfile(filename):
                 
                 #link .blend file collection
-                section = "\\Collection\\"
-                collection_name = file[1]
+                section = os.sep + "Collection" + os.sep
+                collection_name = file.collection
                 filepath  = filename + section + collection_name
                 directory = filename + section
                 bpy.ops.wm.link(filepath=filepath, filename=collection_name, directory=directory)
                 #rename it
-                l = file[0].split("\\")
-                fullname = l[-1].split(".")
-                just_name = fullname[0]
+                just_name = os.path.basename(file.filepath).split(".")[0]
                 bpy.context.active_object.name = just_name
                 #set component location
-                if pres_tool.slide_position == "x_axis":
-                    bpy.context.object.location[0] = (i+n_tmp)*50
-                    bpy.context.object.location[1] = 0
-                    bpy.context.object.location[2] = 0
-                elif pres_tool.slide_position == "y_axis":
-                    bpy.context.object.location[0] = 0
-                    bpy.context.object.location[1] = (i+n_tmp)*50
-                    bpy.context.object.location[2] = 0
-                elif pres_tool.slide_position == "z_axis":
-                    bpy.context.object.location[0] = 0
-                    bpy.context.object.location[1] = 0
-                    bpy.context.object.location[2] = -(i+n_tmp)*30
-                elif pres_tool.slide_position == "circle":
-                    if pres_tool.already_imported is False:
-                        n = len(pres_tool.slide_list) 
-                        z_rot = 360/n                      #z rotation
-                        alpha = (n-2)*180/n                #inner angle
-                        s = 50                             #polygon side length
-                        r2 = s/(2*tan(radians(180.0)/n))   #inner circle radius
-                        #set rotation
-                        bpy.context.object.rotation_euler[2] = radians(-i*z_rot-90)
-                        #set location 
-                        if n == 1:
-                            bpy.context.object.location[0] = 0
-                            bpy.context.object.location[1] = 0
-                            bpy.context.object.location[2] = 0
-                        elif n == 2:
-                            bpy.context.object.location[0] = pow(-1,i)*25
-                            bpy.context.object.location[1] = 0
-                            bpy.context.object.location[2] = 0
-                        else:
-                            bpy.context.object.location[0] = cos(-i*2*pi/n)*r2
-                            bpy.context.object.location[1] = sin(-i*2*pi/n)*r2
-                            bpy.context.object.location[2] = 0
-                    else:
-                        bpy.context.object.location[0] = 0
-                        bpy.context.object.location[1] = -i*30
-                        bpy.context.object.location[2] = 0
+                location, rotation = get_component_placement(i, n_tmp, len(pres_tool.slide_list), pres_tool.slide_position, pres_tool.already_imported)
+                bpy.context.object.location = location
+                if rotation is not None:
+                    bpy.context.object.rotation_euler[2] = rotation
                     
                 pres_tool.slide_count += 1
                 pres_tool.slides_chosen -= 1                            
                 
                 #append camera as its own object
-                section = "\\Object\\"
-                camera_name = file[2]
+                section = os.sep + "Object" + os.sep
+                camera_name = file.camera
                 filepath  = filename + section + camera_name
                 directory = filename + section
                 try:
@@ -1693,47 +5106,19 @@ class AddSlide(bpy.types.Operator):
         pres_tool.slide_count += n_tmp
         
         #create markers
-        filename = pres_tool.slide_list[0][0]
-        l = filename.split("\\")
-        timed_dir = ("\\").join(l[:-1])
+        filename = pres_tool.slide_list[0].filepath
+        timed_dir = os.path.dirname(filename)
         m_name = os.path.join(timed_dir, "markers.txt")
         with open(m_name, "r") as f:
             for i, line in enumerate(f):
-                splited = line.split(":")
-                if splited[1].strip() == "":
+                parsed = parse_markers_line(line)
+                if parsed is None:
                     continue
-                min_frame = 999999
-                max_frame = -1
-                last_loop_start = -1
-                markers = splited[1].split(";")
-                markers = markers[:-1]
-                for m in markers:
-                    if "LS-" in m:
-                        m_frame = m.split("-")
-                        m_frame = m_frame[-1]
-                        pres_tool.last_loop_start = int(m_frame)
-                        bpy.context.scene.timeline_markers.new(name="LOOP_START", frame=int(m_frame))
-                        if int(m_frame) > max_frame:
-                            max_frame = int(m_frame)
-                        if int(m_frame) < min_frame:
-                            min_frame = int(m_frame)
-                        last_loop_start = int(m_frame)
-                    elif "LE-" in m:
-                        m_frame = m.split("-")
-                        m_frame = m_frame[-1]
-                        pres_tool.loops[int(m_frame)] = pres_tool.last_loop_start
-                        bpy.context.scene.timeline_markers.new(name="LOOP_END", frame=int(m_frame))
-                        if int(m_frame) > max_frame:
-                            max_frame = int(m_frame)
-                        if int(m_frame) < min_frame:
-                            min_frame = int(m_frame)
-                        pres_tool.loops[int(m_frame)] = last_loop_start
-                    else:
-                        bpy.context.scene.timeline_markers.new(name="F_" + m, frame=int(m))
-                        if int(m) > max_frame:
-                            max_frame = int(m)
-                        if int(m) < min_frame:
-                            min_frame = int(m)
+                name, markers, min_frame, max_frame = parsed
+                for frame, marker in markers:
+                    if marker is None:
+                        marker = "F_" + str(frame)
+                    bpy.context.scene.timeline_markers.new(name=marker, frame=frame)
                         
                 #automatic camera change
                 create_camera_change(i, max_frame, min_frame, n_tmp)
@@ -1742,21 +5127,23 @@ class AddSlide(bpy.types.Operator):
         convert_all_to_nla()
         
         #fill the structure for nla changes
-        for obj in bpy.context.scene.objects:
-            if "COMPONENT TIMER" in obj.name:
-                nla_name = obj.animation_data.nla_tracks[0].strips[0].name
-                nla_start = obj.animation_data.nla_tracks[0].strips[0].frame_start
-                nla_end = obj.animation_data.nla_tracks[0].strips[0].frame_end
-                pres_tool.nla_strips[nla_name] = [nla_start, nla_end]
-        tmp_dict = dict(sorted(pres_tool.nla_strips.items(), key=lambda item: item[1][0]))
-        pres_tool.nla_strips = tmp_dict
+        refresh_timer_structures(bpy.context.scene)
             
 
-        if presentation_handler not in bpy.app.handlers.frame_change_pre:
-            bpy.app.handlers.frame_change_pre.append(presentation_handler)
-                
         if os.path.exists(m_name):
             os.remove(m_name)
+        
+        #layout by the component sizes
+        if pres_tool.layout_on_import:
+            bpy.ops.presentation.arrange_components()
+
+        #presenter camera -> the new stops need a new bake
+        if pres_tool.transition_mode == "PRESENTER":
+            ensure_presenter_bake(bpy.context.scene)
+        
+        #proxies of the new components
+        if pres_tool.lod_mode != "NONE":
+            bpy.ops.presentation.build_lod_proxies('INVOKE_DEFAULT')
             
         pres_tool.already_imported = True
         n_tmp = 0
@@ -1773,25 +5160,30 @@ class OverrideSlides(bpy.types.Operator):
     def execute(self, context):
         pres_tool = bpy.context.scene.my_pres_tool
 
-        if presentation_handler not in bpy.app.handlers.frame_change_pre:
-            bpy.app.handlers.frame_change_pre.append(presentation_handler)
-
-        bpy.ops.wm.save_mainfile()
+        #streamed components need their library for the override
+        if pres_tool.stream_components:
+            pres_tool.stream_components = False
+        
+        if pres_tool.save_before_override and bpy.data.is_saved:
+            bpy.ops.wm.save_mainfile()
         
         #override hierarchies
-        for area in bpy.context.screen.areas:
-            if area.type == 'OUTLINER':
-                override = bpy.context.copy()
-                override['area'] = area
-                bpy.ops.outliner.show_one_level(override)
-                bpy.ops.outliner.select_all(override, action='SELECT')
-                try:
-                    bpy.ops.outliner.id_operation(override, type='OVERRIDE_LIBRARY_CREATE_HIERARCHY')
-                except:
-                    self.report({'WARNING'}, "INVALID CONTEXT.")
-                    return{'CANCELLED'}
-                bpy.ops.outliner.show_one_level(override, open=False)
-                break
+        if can_override_by_api():
+            override_components(bpy.context.scene, get_component_instances(bpy.context.scene))
+        else:
+            for area in bpy.context.screen.areas:
+                if area.type == 'OUTLINER':
+                    override = bpy.context.copy()
+                    override['area'] = area
+                    bpy.ops.outliner.show_one_level(override)
+                    bpy.ops.outliner.select_all(override, action='SELECT')
+                    try:
+                        bpy.ops.outliner.id_operation(override, type='OVERRIDE_LIBRARY_CREATE_HIERARCHY')
+                    except:
+                        self.report({'WARNING'}, "INVALID CONTEXT.")
+                        return{'CANCELLED'}
+                    bpy.ops.outliner.show_one_level(override, open=False)
+                    break
         
         # switch to Presentation workspace
         try:
@@ -1801,87 +5193,47 @@ class OverrideSlides(bpy.types.Operator):
         except:
             self.report({'WARNING'}, "Workspace \"Presentation\" not found. Use the PRESENTATION_TEMPLATE file for better results.")
 
-        #fill the structure for nla changes and marker movement
-        for obj in bpy.context.scene.objects:
-            if "COMPONENT TIMER" in obj.name:
-                nla_name = obj.animation_data.nla_tracks[0].strips[0].name
-                nla_start = obj.animation_data.nla_tracks[0].strips[0].frame_start
-                nla_end = obj.animation_data.nla_tracks[0].strips[0].frame_end
-                pres_tool.nla_strips[nla_name] = [nla_start, nla_end]
-                pres_tool.marker_timers[nla_name] = []
-                #fill markers
-                for m in bpy.context.scene.timeline_markers:
-                    if nla_start <= m.frame <= nla_end:
-                        pres_tool.marker_timers[nla_name].append(m)
-        #sort nla strips                
-        tmp_dict = dict(sorted(pres_tool.nla_strips.items(), key=lambda item: item[1][0]))
-        pres_tool.nla_strips = tmp_dict          
-                
-        #create a collection for original slides
-        try:
-            if bpy.data.collections["COMPONENTS"] is not None:
-                collection = bpy.data.collections["COMPONENTS"]
-        except:
-            collection = bpy.data.collections.new(name="COMPONENTS")
-            bpy.context.scene.collection.children.link(collection)
-        for obj in bpy.data.objects:
-            if obj.instance_type == 'COLLECTION':
-                comp_collection = get_parent_collection(obj)
-                if comp_collection == "Master Collection":
-                    collection.objects.link(obj)
-                    bpy.context.scene.collection.objects.unlink(obj)
-                else:
-                    if comp_collection == "COMPONENTS":
-                        continue
-                    else:
-                        collection.objects.link(obj)
-                        bpy.data.collections[comp_collection].objects.unlink(obj)
-                
-        #create a collection for override slides
-        try:
-            if bpy.data.collections["OVERRIDES"] is not None:
-                collection = bpy.data.collections["OVERRIDES"]
-        except:
-            collection = bpy.data.collections.new(name="OVERRIDES")
-            bpy.context.scene.collection.children.link(collection)
-        for col in bpy.data.collections:
-            if col.override_library is not None:
-                try:
-                    bpy.context.scene.collection.children.unlink(col)
-                    collection.children.link(col)
-                except:
-                    print(col.name, " is child collection, so its moved already")
-                
-        #create a collection for slide timers
-        try:
-            if bpy.data.collections["TIMERS"] is not None:
-                collection = bpy.data.collections["TIMERS"]
-        except:
-            collection = bpy.data.collections.new(name="TIMERS")
-            bpy.context.scene.collection.children.link(collection)
-        for obj in bpy.context.scene.objects:
-            if "COMPONENT TIMER" in obj.name and obj.name not in bpy.data.collections["TIMERS"].objects:
-                timer = bpy.context.scene.objects.get(obj.name)
-                collection.objects.link(obj)
-                
-                
-        #filter NLA strips by timer collection - doesnt work (??)
-        for area in bpy.context.screen.areas:
-            #for area in screen.areas:
-            if area.type == "NLA_EDITOR":
-                for space in area.spaces:
-                    if space.type == "NLA_EDITOR":
-                        space.dopesheet.filter_collection = bpy.data.collections["TIMERS"]
-                        break
-        
-        if presentation_handler not in bpy.app.handlers.frame_change_pre:
-            bpy.app.handlers.frame_change_pre.append(presentation_handler)
-        
+        #sort the overrides into collections
+        organize_overrides(bpy.context.scene)
+
         pres_tool.overriden = True
            
         return{'FINISHED'}
 
         
+#------------------------------------------------------------
+
+
+class OverrideSelectedComponents(bpy.types.Operator):
+    """Override only the selected Components to enable changes in them"""
+    bl_idname = 'presentation.override_selected'
+    bl_label = 'Override Selected Components'
+
+    @classmethod
+    def poll(cls, context):
+        return can_override_by_api() and len(context.selected_objects) != 0
+
+    def execute(self, context):
+        pres_tool = bpy.context.scene.my_pres_tool
+
+        instances = []
+        for obj in bpy.context.selected_objects:
+            if obj.instance_type == 'COLLECTION' and obj.instance_collection is not None:
+                if obj.instance_collection.library is not None and get_component_override(obj.instance_collection) is None:
+                    instances.append(obj)
+        if len(instances) == 0:
+            self.report({'WARNING'}, "No linked Components selected.")
+            return{'CANCELLED'}
+
+        if pres_tool.save_before_override and bpy.data.is_saved:
+            bpy.ops.wm.save_mainfile()
+
+        overrides = override_components(bpy.context.scene, instances)
+        self.report({'INFO'}, str(len(overrides)) + " Component(s) overridden.")
+
+        return{'FINISHED'}
+
+
 #------------------------------------------------------------  
 
 
@@ -1893,30 +5245,23 @@ class RecalculateCameras(bpy.types.Operator):
     def execute(self, context):
         pres_tool = bpy.context.scene.my_pres_tool
         
-        sorted_strips = dict(sorted(pres_tool.nla_strips.items(), key=lambda item: item[1][0]))
+        timers = pres_tool.timers
         sorted_markers = list(sorted(bpy.context.scene.timeline_markers.items(), key=lambda item: item[1].frame))
         
         #take the camera from end marker and set interpolation constrains to next start marker camera
         prev_camera = None
         const_start = -1
-        for i, s in enumerate(sorted_strips):
-            start = sorted_strips[s][0]
-            end   = sorted_strips[s][1]
+        for i, item in enumerate(timers):
+            start = item.start
+            end   = item.end
             for m in sorted_markers:
                 if m[1].frame == start:
                     if m[1].camera is not None:
                         #remove constraints
-                        try:
-                            constr = m[1].camera.constraints["Copy Location"]
-                            m[1].camera.constraints.remove(constr)
-                            constr = m[1].camera.constraints["Copy Rotation"]
-                            m[1].camera.constraints.remove(constr)
-                            constr = m[1].camera.constraints["Copy Scale"]
-                            m[1].camera.constraints.remove(constr)
-                        except:
+                        if not remove_camera_constraints(m[1].camera):
                             print(m[1].camera, " DOESNT HAVE CONSTRAINS")
                         #set it as target for previous camera
-                        if i != 0:
+                        if i != 0 and pres_tool.transition_mode == "CONSTRAINTS":
                             const_loc = prev_camera.constraints.new('COPY_LOCATION')
                             const_rot = prev_camera.constraints.new('COPY_ROTATION')
                             const_scl = prev_camera.constraints.new('COPY_SCALE')
@@ -1938,26 +5283,290 @@ class RecalculateCameras(bpy.types.Operator):
                         prev_camera = m[1].camera
                 elif m[1].frame == end:
                     #if its not the last one -> remember it next round
-                    if i != len(sorted_strips)-1:
+                    if i != len(timers)-1:
                         const_start = m[1].frame
                         
         convert_all_to_nla()
-        
+
+        #presenter camera -> bake the transitions again
+        if pres_tool.transition_mode == "PRESENTER":
+            bake_presenter_camera(bpy.context.scene)
+        #rebuild the baked camera path if there is one
+        if bpy.context.scene.get("PRESENTATION BAKE") is not None:
+            bake_deck(bpy.context.scene)
+
+        return{'FINISHED'}
+
+
+#------------------------------------------------------------
+
+class BakePresenterCamera(bpy.types.Operator):
+    """Bake all camera transitions onto one presenter camera (no constraints)"""
+    bl_idname = 'presentation.bake_presenter_camera'
+    bl_label = 'Bake Presenter Camera'
+
+    def execute(self, context):
+        scene = bpy.context.scene
+
+        #drop the constraint transitions, the presenter camera replaces them
+        for frame, cam in get_camera_stops(scene):
+            remove_camera_constraints(cam)
+
+        if bake_presenter_camera(scene) is None:
+            self.report({'WARNING'}, "No camera markers found. Import Components first.")
+            return{'CANCELLED'}
+
+        return{'FINISHED'}
+
+
+#------------------------------------------------------------
+
+class BakeDeck(bpy.types.Operator):
+    """Sample the whole camera path into a table used during the slideshow"""
+    bl_idname = 'presentation.bake_deck'
+    bl_label = 'Bake Deck'
+
+    def execute(self, context):
+        pres_tool = bpy.context.scene.my_pres_tool
+
+        if pres_tool.bake_storage == "SIDECAR" and not bpy.data.is_saved:
+            self.report({'WARNING'}, "Save this .blend file first.")
+            return {'CANCELLED'}
+
+        unbind_presenter_camera(bpy.context.scene)
+        table = bake_deck(bpy.context.scene)
+        self.report({'INFO'}, "Baked " + str(len(table) // BAKE_STRIDE) + " frames.")
+
         return{'FINISHED'}
 
 
+#------------------------------------------------------------
+
+class PrerenderDeck(bpy.types.Operator):
+    """Render the slideshow frames in background Blender processes, unchanged frames are skipped (Esc to stop)"""
+    bl_idname = 'presentation.prerender_deck'
+    bl_label = 'Pre-render Deck'
+
+    rerender_all: bpy.props.BoolProperty(name="Re-render all frames", default=False)
+
+    def invoke(self, context, event):
+        scene = bpy.context.scene
+        pres_tool = scene.my_pres_tool
+
+        if not bpy.data.is_saved:
+            self.report({'WARNING'}, "Save this .blend file first.")
+            return {'CANCELLED'}
+
+        frames = get_prerender_frames(scene)
+        self.keys, self.manifest, missing = prepare_prerender(scene, frames, self.rerender_all)
+        if len(missing) == 0:
+            self.report({'INFO'}, "Pre-rendered deck is up to date.")
+            return {'FINISHED'}
+        blend_path = save_prerender_copy(scene)
+
+        #split by frame range, one range per process
+        size = ceil(len(missing) / min(pres_tool.prerender_jobs, len(missing)))
+        self.workers = []
+        for i in range(0, len(missing), size):
+            chunk = missing[i:i+size]
+            self.workers.append([start_prerender_worker(blend_path, scene, chunk), chunk])
+        self.total = len(missing)
+
+        self.timer = context.window_manager.event_timer_add(0.5, window=context.window)
+        context.window_manager.modal_handler_add(self)
+        return {'RUNNING_MODAL'}
+
+    def finish(self, context):
+        context.window_manager.event_timer_remove(self.timer)
+        context.workspace.status_text_set(None)
+        rendered = 0
+        for worker, chunk in self.workers:
+            stopped = worker.poll() is None
+            if stopped:
+                worker.terminate()
+                worker.wait()
+            done = [f for f in chunk if os.path.exists(get_prerender_path(f))]
+            #last image of a stopped process might be half written
+            if stopped and len(done) != 0:
+                os.remove(get_prerender_path(done[-1]))
+                done.pop()
+            for f in done:
+                self.manifest[str(f)] = self.keys[str(f)]
+            rendered += len(done)
+        save_prerender_manifest(self.manifest)
+        return rendered
+
+    def modal(self, context, event):
+        if event.type == 'ESC':
+            rendered = self.finish(context)
+            self.report({'WARNING'}, "Pre-rendering stopped after " + str(rendered) + " frames, run it again to continue.")
+            return {'CANCELLED'}
+        if event.type != 'TIMER' or event.timer != self.timer:
+            return {'PASS_THROUGH'}
+
+        if any(worker.poll() is None for worker, chunk in self.workers):
+            done = sum(1 for worker, chunk in self.workers for f in chunk if os.path.exists(get_prerender_path(f)))
+            context.workspace.status_text_set("Pre-rendering deck: " + str(done) + " / " + str(self.total) + " frames (Esc to stop)")
+            return {'PASS_THROUGH'}
+
+        rendered = self.finish(context)
+        if rendered < self.total:
+            self.report({'WARNING'}, str(self.total - rendered) + " frames failed to render.")
+        else:
+            self.report({'INFO'}, "Pre-rendered " + str(rendered) + " frames.")
+        return {'FINISHED'}
+
+    def cancel(self, context):
+        self.finish(context)
+
+
+#------------------------------------------------------------
+
+class ExportVideo(bpy.types.Operator):
+    """Render the whole deck in background Blender processes and join it into a video (Esc to stop)"""
+    bl_idname = 'presentation.export_video'
+    bl_label = 'Export Video'
+
+    # how many times a failed chunk is rendered again
+    retries = 2
+
+    def invoke(self, context, event):
+        scene = bpy.context.scene
+        pres_tool = scene.my_pres_tool
+
+        if not bpy.data.is_saved:
+            self.report({'WARNING'}, "Save this .blend file first.")
+            return {'CANCELLED'}
+
+        #frames already pre-rendered are reused
+        frames = list(range(scene.frame_start, scene.frame_end+1))
+        self.keys, self.manifest, missing = prepare_prerender(scene, frames)
+        self.edits = get_export_edit_list(scene, round(pres_tool.export_hold * scene.render.fps / scene.render.fps_base), pres_tool.export_loops)
+        self.blend_path = save_prerender_copy(scene) if len(missing) != 0 else None
+
+        #one chunk per component
+        boundaries = [c["start"] for c in get_components(scene)]
+        chunks = {}
+        for f in missing:
+            chunks.setdefault(bisect.bisect_right(boundaries, f), []).append(f)
+        self.queue = [[chunk, 0] for i, chunk in sorted(chunks.items())]
+        self.running = []
+        self.failed = []
+        self.assembly = None
+        self.total = len(missing)
+        self.rendered = 0
+        self.start_time = time.time()
+
+        self.timer = context.window_manager.event_timer_add(0.5, window=context.window)
+        context.window_manager.modal_handler_add(self)
+        return {'RUNNING_MODAL'}
+
+    def update_status(self, context, text):
+        PresMenuProperties.export_status = text
+        context.workspace.status_text_set(text + " (Esc to stop)")
+        for area in context.screen.areas:
+            if area.type == 'VIEW_3D':
+                area.tag_redraw()
+
+    def finish(self, context):
+        context.window_manager.event_timer_remove(self.timer)
+        context.workspace.status_text_set(None)
+        PresMenuProperties.export_status = ""
+        for worker, chunk, tries in self.running:
+            worker.terminate()
+            worker.wait()
+            #keep the frames it already wrote, the last one might be half written
+            done = [f for f in chunk if os.path.exists(get_prerender_path(f))]
+            if len(done) != 0:
+                os.remove(get_prerender_path(done[-1]))
+                done.pop()
+            for f in done:
+                self.manifest[str(f)] = self.keys[str(f)]
+        self.running = []
+        if self.assembly is not None and self.assembly.poll() is None:
+            self.assembly.terminate()
+            self.assembly.wait()
+        save_prerender_manifest(self.manifest)
+
+    def modal(self, context, event):
+        pres_tool = bpy.context.scene.my_pres_tool
+        if event.type == 'ESC':
+            #keep the finished chunks for the next export
+            self.running = [w for w in self.running if w[0].poll() is None or self.collect(w)]
+            self.finish(context)
+            self.report({'WARNING'}, "Video export stopped.")
+            return {'CANCELLED'}
+        if event.type != 'TIMER' or event.timer != self.timer:
+            return {'PASS_THROUGH'}
+
+        #video is being joined
+        if self.assembly is not None:
+            if self.assembly.poll() is None:
+                return {'PASS_THROUGH'}
+            self.finish(context)
+            if self.assembly.returncode != 0:
+                self.report({'ERROR'}, "Joining the video failed.")
+                return {'CANCELLED'}
+            self.report({'INFO'}, "Exported " + bpy.path.abspath(pres_tool.export_path))
+            return {'FINISHED'}
+
+        #collect finished workers, start new ones
+        self.running = [w for w in self.running if w[0].poll() is None or self.collect(w)]
+        while len(self.queue) != 0 and len(self.running) < pres_tool.prerender_jobs:
+            chunk, tries = self.queue.pop(0)
+            self.running.append([start_prerender_worker(self.blend_path, bpy.context.scene, chunk), chunk, tries])
+
+        if len(self.running) != 0:
+            elapsed = time.time() - self.start_time
+            done = self.rendered + sum(1 for w in self.running for f in w[1] if os.path.exists(get_prerender_path(f)))
+            text = "Rendering video frames: " + str(done) + " / " + str(self.total)
+            if done != 0:
+                eta = int(elapsed / done * (self.total - done))
+                text += ", about " + str(eta // 60) + ":" + str(eta % 60).zfill(2) + " left"
+            self.update_status(context, text)
+            return {'PASS_THROUGH'}
+
+        if len(self.failed) != 0:
+            self.finish(context)
+            self.report({'ERROR'}, str(len(self.failed)) + " frames failed to render, first: " + str(self.failed[0]))
+            return {'CANCELLED'}
+        save_prerender_manifest(self.manifest)
+        self.assembly = start_export_assembly(bpy.context.scene, self.edits)
+        self.update_status(context, "Joining the video")
+        return {'PASS_THROUGH'}
+
+    # record a finished worker, queue its missing frames again, always False (not running)
+    def collect(self, running):
+        worker, chunk, tries = running
+        done = [f for f in chunk if os.path.exists(get_prerender_path(f))]
+        for f in done:
+            self.manifest[str(f)] = self.keys[str(f)]
+        self.rendered += len(done)
+        rest = [f for f in chunk if str(f) not in self.manifest]
+        if len(rest) != 0:
+            if tries < self.retries:
+                self.queue.append([rest, tries+1])
+            else:
+                self.failed.extend(rest)
+        return False
+
+    def cancel(self, context):
+        self.finish(context)
+
+
 #------------------------------------------------------------  
 
 class DeleteSlide(bpy.types.Operator):
-    """Delete selected Component, its markers and timer."""
+    """Delete selected Component, its markers and timer, and close the gap in the timeline."""
     bl_idname = 'presentation.delete_slide'
     bl_label = 'Delete Selected Slide(s)'
+    bl_options = {'REGISTER', 'UNDO'}
     
     @classmethod
     def poll(cls, context):
         comp = []
         for obj in bpy.context.selected_objects:
-            if obj.instance_type == 'COLLECTION':
+            if obj.instance_collection is not None:
                 comp.append(obj)
         if len(comp) != 0:
             return True
@@ -1966,40 +5575,15 @@ class DeleteSlide(bpy.types.Operator):
     
     def execute(self, context):
         pres_tool = bpy.context.scene.my_pres_tool
-        slides = []
-        deleted = 0
         
         if len(bpy.context.selected_objects) == 0:
             return{'CANCELLED'} 
         
-        for s in bpy.context.selected_objects:
-            if s.instance_type == 'COLLECTION':
-                timer_strip = ""
-                #delete markers
-                for strip in pres_tool.marker_timers:
-                    if s.name + '.blend TIMER STRIP' in strip:
-                        timer_strip = strip
-                        for m in pres_tool.marker_timers[strip]:
-                            bpy.context.scene.timeline_markers.remove(m)
-                pres_tool.marker_timers.pop(timer_strip)
-                pres_tool.nla_strips.pop(timer_strip)
-                #delete empty timer
-                for obj in bpy.context.scene.objects:
-                    if "COMPONENT TIMER" in obj.name:
-                        nla_name = obj.animation_data.nla_tracks[0].strips[0].name
-                        if nla_name == timer_strip:
-                            bpy.data.objects.remove(obj)
-                #delete component and children from scene
-                for child in s.children:
-                    child.select_set(True)
-                #bpy.data.objects.remove(s, do_unlink=True)
-                deleted += 1
-            else:
-                s.select_set(False)
-                
-        bpy.ops.object.delete()
+        instances = [s for s in bpy.context.selected_objects if s.instance_collection is not None]
+        deleted = delete_components(bpy.context.scene, instances)
         
         if deleted == 0:
+            self.report({'WARNING'}, "No Component timer found for the selection. Override the Components first.")
             return{'CANCELLED'}
         
         pres_tool.slide_count -= deleted
@@ -2009,6 +5593,58 @@ class DeleteSlide(bpy.types.Operator):
         return{'FINISHED'}
     
     
+#------------------------------------------------------------
+
+class ReorderComponents(bpy.types.Operator):
+    """Change the order of the Components in the Presentation"""
+    bl_idname = 'presentation.reorder_components'
+    bl_label = 'Reorder Components'
+    bl_options = {'REGISTER', 'UNDO'}
+
+    # comma separated component names in the new order
+    order: bpy.props.StringProperty(name="New order", default="")
+
+    def execute(self, context):
+        new_order = [name.strip() for name in self.order.split(",") if name.strip() != ""]
+        if not reorder_components(bpy.context.scene, new_order):
+            self.report({'INFO'}, "Component order didnt change.")
+            return{'CANCELLED'}
+        return{'FINISHED'}
+
+
+#------------------------------------------------------------
+
+class MoveComponent(bpy.types.Operator):
+    """Move the selected Component one place earlier or later in the Presentation"""
+    bl_idname = 'presentation.move_component'
+    bl_label = 'Move Component'
+    bl_options = {'REGISTER', 'UNDO'}
+
+    direction: bpy.props.EnumProperty(name="Direction",
+                items = [("EARLIER", "Earlier", "Move the component one place earlier"),
+                        ("LATER", "Later", "Move the component one place later")])
+
+    @classmethod
+    def poll(cls, context):
+        obj = context.active_object
+        return obj is not None and obj.instance_collection is not None
+
+    def execute(self, context):
+        components = get_components(bpy.context.scene)
+        names = [comp["instance"].name if comp["instance"] is not None else comp["name"] for comp in components]
+        name = bpy.context.active_object.name
+        if name not in names:
+            self.report({'WARNING'}, "Component timer not found. Override the Component first.")
+            return{'CANCELLED'}
+        i = names.index(name)
+        j = i-1 if self.direction == "EARLIER" else i+1
+        if j < 0 or j >= len(names):
+            return{'CANCELLED'}
+        names[i], names[j] = names[j], names[i]
+        reorder_components(bpy.context.scene, names)
+        return{'FINISHED'}
+
+
 #------------------------------------------------------------  
 
 class ResetPresentation(bpy.types.Operator):
@@ -2020,7 +5656,7 @@ class ResetPresentation(bpy.types.Operator):
         pres_tool = bpy.context.scene.my_pres_tool
 
         bpy.context.scene.my_pres_tool.slide_count = 0
-        bpy.context.scene.my_pres_tool.slide_list = []
+        bpy.context.scene.my_pres_tool.slide_list.clear()
         bpy.context.scene.my_pres_tool.image_count = 0
         bpy.context.scene.my_pres_tool.slides_chosen = 0
         bpy.context.scene.my_pres_tool.image_chosen = 0
@@ -2049,11 +5685,28 @@ class StartPresentation(bpy.types.Operator):
         pres_tool = bpy.context.scene.my_pres_tool
         
         bpy.ops.screen.animation_cancel()
+        PresentationPlayer.stop()
+        PresMenuProperties.transition_log = []
+        PresMenuProperties.transition_status = ""
         bpy.context.scene.frame_current = 1
+        build_slide_index(bpy.context.scene)
+        prerendered = False
+        if pres_tool.play_prerendered:
+            prerendered = show_prerendered_deck(bpy.context.scene)
+            if not prerendered:
+                self.report({'WARNING'}, "Pre-rendered deck is missing or out of date, presenting live. Use Pre-render Deck.")
+        if pres_tool.culling_mode != "NONE" and not prerendered:
+            build_culling_targets(bpy.context.scene)
+            update_culling(bpy.context.scene, [1])
+        if not prerendered:
+            update_streaming(bpy.context.scene, [1])
+        if pres_tool.lod_mode != "NONE" and not prerendered:
+            prepare_lod(bpy.context.scene)
+            update_lod(bpy.context.scene, [1])
+            overridden, total = get_override_counts(bpy.context.scene)
+            if overridden != 0 and overridden == total:
+                self.report({'WARNING'}, "Level of detail has no effect, all components are overridden.")
 
-        if presentation_handler not in bpy.app.handlers.frame_change_pre:
-            bpy.app.handlers.frame_change_pre.append(presentation_handler)
-            
         workspace = None
         
         # switch to Slideshow workspace
@@ -2072,11 +5725,40 @@ class StartPresentation(bpy.types.Operator):
                 if area.type == 'VIEW_3D':
                     for space in area.spaces:
                         if space.type == 'VIEW_3D':
-                            space.shading.type = 'RENDERED'
+                            if prerendered:
+                                #flat textured screen, nothing to render live
+                                space.shading.type = 'SOLID'
+                                space.shading.light = 'FLAT'
+                                space.shading.color_type = 'TEXTURE'
+                            else:
+                                space.shading.type = 'RENDERED'
                             space.region_3d.view_perspective = 'CAMERA'
                             #bpy.ops.screen.screen_full_area(use_hide_panels=True)
         if pres_tool.fullscreen:
             bpy.ops.wm.window_fullscreen_toggle()
+
+        # baked camera path -> one camera driven by the table
+        if pres_tool.play_baked and not prerendered:
+            scene = bpy.context.scene
+            unbind_presenter_camera(scene)
+            if load_deck_bake(scene) is None:
+                if pres_tool.bake_storage == "SIDECAR" and not bpy.data.is_saved:
+                    pres_tool.bake_storage = "BLEND"
+                bake_deck(scene)
+            stops = get_camera_stops(scene)
+            presenter = get_presenter_camera(scene, stops[0][1] if len(stops) != 0 else None)
+            use_presenter_actions(presenter, False)
+            mute_camera_constraints(scene, True)
+            bind_presenter_camera(scene)
+            if baked_camera_handler not in bpy.app.handlers.frame_change_pre:
+                bpy.app.handlers.frame_change_pre.append(baked_camera_handler)
+            baked_camera_handler(scene)
+        # presenter camera -> one camera drives the whole slideshow
+        elif pres_tool.transition_mode == "PRESENTER" and not prerendered:
+            presenter = ensure_presenter_bake(bpy.context.scene)
+            if presenter is not None:
+                use_presenter_actions(presenter, True)
+                bind_presenter_camera(bpy.context.scene)
             
         for camera in bpy.data.cameras:
             camera.passepartout_alpha = 1
@@ -2095,6 +5777,14 @@ class EndPresentation(bpy.types.Operator):
         pres_tool = bpy.context.scene.my_pres_tool
         
         bpy.ops.screen.animation_cancel()
+        PresentationPlayer.stop()
+        clear_culling()
+        clear_lod(bpy.context.scene)
+        path = save_transition_log(bpy.context.scene)
+        if path is not None:
+            self.report({'INFO'}, "Transition frame rates saved to " + path)
+        if PresMenuProperties.prerender_playing:
+            hide_prerendered_deck(bpy.context.scene)
         
         # switch to Presentation workspace
         try:
@@ -2106,6 +5796,17 @@ class EndPresentation(bpy.types.Operator):
 
         if pres_tool.fullscreen:
             bpy.ops.wm.window_fullscreen_toggle()
+
+        # stop driving the camera from the baked table
+        if baked_camera_handler in bpy.app.handlers.frame_change_pre:
+            bpy.app.handlers.frame_change_pre.remove(baked_camera_handler)
+            mute_camera_constraints(bpy.context.scene, False)
+            presenter = bpy.context.scene.objects.get("=> PRESENTER CAMERA")
+            if presenter is not None:
+                use_presenter_actions(presenter, True)
+
+        # component cameras back on the markers
+        unbind_presenter_camera(bpy.context.scene)
                 
         return {'FINISHED'}
 
@@ -2113,6 +5814,101 @@ class EndPresentation(bpy.types.Operator):
 #------------------------------------------------------------  
         
              
+class PresentationPlayer(bpy.types.Operator):
+    """Plays the presentation to the target stop frame, or plays a loop"""
+    bl_label = "Presentation Player"
+    bl_idname = "presentation.player"
+
+    # shared navigation state (one player at a time)
+    # state = IDLE, PLAYING (towards target), LOOPING (inside loop = [start, end])
+    running = False
+    state = "IDLE"
+    target = 0
+    direction = 1
+    loop = None
+    # clock of the current transition or loop, frames drawn since its start
+    clock_start = 0.0
+    clock_frame = 0
+    drawn = 0
+
+    @classmethod
+    def start(cls, context, state, target, direction, loop):
+        cls.state = state
+        cls.target = target
+        cls.direction = direction
+        cls.loop = loop
+        cls.clock_start = time.perf_counter()
+        cls.clock_frame = context.scene.frame_current
+        cls.drawn = 0
+        if not cls.running:
+            bpy.ops.presentation.player('INVOKE_DEFAULT')
+
+    @classmethod
+    def stop(cls):
+        cls.state = "IDLE"
+        cls.loop = None
+
+    def invoke(self, context, event):
+        cls = PresentationPlayer
+        bpy.ops.screen.animation_cancel()
+        fps = context.scene.render.fps / context.scene.render.fps_base
+        self.timer = context.window_manager.event_timer_add(1/fps, window=context.window)
+        context.window_manager.modal_handler_add(self)
+        cls.running = True
+        return {'RUNNING_MODAL'}
+
+    def finish(self, context):
+        context.window_manager.event_timer_remove(self.timer)
+        PresentationPlayer.running = False
+        PresentationPlayer.stop()
+        return {'FINISHED'}
+
+    def cancel(self, context):
+        self.finish(context)
+
+    def modal(self, context, event):
+        cls = PresentationPlayer
+        if event.type != 'TIMER' or event.timer != self.timer:
+            return {'PASS_THROUGH'}
+        if cls.state == "IDLE":
+            return self.finish(context)
+
+        scene = context.scene
+        fps = scene.render.fps / scene.render.fps_base
+        if scene.my_pres_tool.realtime_transitions:
+            #frame from the clock, the frames in between are skipped
+            elapsed = time.perf_counter() - cls.clock_start
+            if cls.state == "LOOPING":
+                frame = get_realtime_frame(cls.clock_frame, elapsed, fps, 1, cls.loop)
+            else:
+                frame = get_realtime_frame(cls.clock_frame, elapsed, fps, cls.direction)
+            if frame == scene.frame_current:
+                return {'PASS_THROUGH'}
+        else:
+            frame = scene.frame_current + cls.direction
+        landed = False
+        if cls.state == "LOOPING":
+            if frame >= cls.loop[1]:
+                frame = cls.loop[0] + 1
+        elif cls.direction > 0 and frame >= cls.target or cls.direction < 0 and frame <= cls.target:
+            #land exactly on the stop
+            frame = cls.target
+            log_transition(scene, cls.clock_frame, frame, time.perf_counter() - cls.clock_start, cls.drawn + 1, fps)
+            cls.stop()
+            landed = True
+        cls.drawn += 1
+        scene.frame_set(frame)
+        #camera view culling follows the transition camera every frame
+        if landed or scene.my_pres_tool.culling_mode == "FRUSTUM":
+            update_culling(scene, [frame])
+        if landed or scene.my_pres_tool.lod_mode == "DISTANCE":
+            update_lod(scene, [frame])
+        return {'PASS_THROUGH'}
+
+
+#------------------------------------------------------------  
+        
+             
 class RotateCameraUp(bpy.types.Operator):
     """Plays animation until next slide"""
     bl_label = "NEXT SLIDE"
@@ -2124,20 +5920,7 @@ class RotateCameraUp(bpy.types.Operator):
         layout.label(icon= 'PLAY')
     
     def execute(self, context):
-        pres_tool = bpy.context.scene.my_pres_tool
-
-        if presentation_handler not in bpy.app.handlers.frame_change_pre:
-            bpy.app.handlers.frame_change_pre.append(presentation_handler)
-        
-        check_marker_loops()
-
-        #check if im in a loop
-        for m in bpy.context.scene.my_pres_tool.loops:
-            if m > bpy.context.scene.frame_current > bpy.context.scene.my_pres_tool.loops[m]:
-                #break the loop
-                bpy.context.scene.frame_current = m+1
-                bpy.ops.screen.animation_play()
-        bpy.ops.screen.animation_play()
+        navigate_presentation(context, 1)
         
         return {'FINISHED'}
 
@@ -2149,21 +5932,105 @@ class RotateCameraDown(bpy.types.Operator):
     bl_idname = "wm.rotatecamdown"  
     
     def execute(self, context):
-        pres_tool = bpy.context.scene.my_pres_tool
+        navigate_presentation(context, -1)
+        
+        return {'FINISHED'}
 
-        if presentation_handler not in bpy.app.handlers.frame_change_pre:
-            bpy.app.handlers.frame_change_pre.append(presentation_handler)
+#------------------------------------------------------------
 
-        check_marker_loops()
+class GoToSlide(bpy.types.Operator):
+    """Jumps to the slide without playing the transitions in between"""
+    bl_label = "GO TO SLIDE"
+    bl_idname = "presentation.go_to_slide"
 
-        #check if im in a loop
-        for m in pres_tool.loops:
-            if bpy.context.scene.frame_current > pres_tool.loops[m] and bpy.context.scene.frame_current < m:
-                #break the loop
-                bpy.context.scene.frame_current = pres_tool.loops[m] - 1
-                bpy.ops.screen.animation_play(reverse=True)
-        bpy.ops.screen.animation_play(reverse=True)
-        
+    # slide number, starting from 1
+    slide: bpy.props.IntProperty(name="Slide", default=1, min=1)
+
+    def execute(self, context):
+        go_to_slide(context, self.slide-1)
+        return {'FINISHED'}
+
+    def invoke(self, context, event):
+        self.slide = get_current_slide(context.scene) + 1
+        return context.window_manager.invoke_props_dialog(self)
+
+#------------------------------------------------------------
+
+class GoToSection(bpy.types.Operator):
+    """Jumps to the start of the next or previous Component"""
+    bl_label = "GO TO SECTION"
+    bl_idname = "presentation.go_to_section"
+
+    direction: bpy.props.EnumProperty(name="Direction",
+                items = [("NEXT", "Next", "Next section"),
+                        ("PREVIOUS", "Previous", "Previous section")])
+
+    def execute(self, context):
+        scene = context.scene
+        frames, loops, sections = get_slide_index(scene)
+        if self.direction == "NEXT":
+            i = bisect.bisect_right(sections, scene.frame_current)
+        else:
+            i = bisect.bisect_left(sections, scene.frame_current) - 1
+        if i < 0 or i >= len(sections):
+            return {'CANCELLED'}
+        go_to_slide(context, bisect.bisect_left(frames, sections[i]))
+        return {'FINISHED'}
+
+#------------------------------------------------------------
+
+class BuildSlideIndex(bpy.types.Operator):
+    """Rebuilds the slide index from the markers"""
+    bl_label = "Build Slide Index"
+    bl_idname = "presentation.build_slide_index"
+
+    def execute(self, context):
+        build_slide_index(context.scene)
+        self.report({'INFO'}, str(len(context.scene.my_pres_tool.slides)) + " slides indexed.")
+        return {'FINISHED'}
+
+#------------------------------------------------------------      
+    
+class AnalyseResources(bpy.types.Operator):
+    """Measure the resources of every component and flag the ones over budget, also written as JSON"""
+    bl_label = "Analyse Components"
+    bl_idname = "presentation.analyse_resources"
+
+    def execute(self, context):
+        scene = context.scene
+        pres_tool = scene.my_pres_tool
+        if not bpy.data.is_saved:
+            self.report({'WARNING'}, "Save this .blend file first.")
+            return {'CANCELLED'}
+        build_slide_index(scene)
+        report = analyse_components(scene)
+        if len(report) == 0:
+            self.report({'WARNING'}, "No components found.")
+            return {'CANCELLED'}
+
+        pres_tool.report.clear()
+        for entry in report:
+            item = pres_tool.report.add()
+            for key, value in entry.items():
+                if key == "flags":
+                    item.flags = ", ".join(value)
+                else:
+                    setattr(item, key, value)
+        pres_tool.report_index = 0
+
+        if not os.path.exists(get_presentation_dir()):
+            os.makedirs(get_presentation_dir())
+        path = os.path.join(get_presentation_dir(), "resource_report.json")
+        budget = {"polygons": pres_tool.budget_polygons, "texture_mb": pres_tool.budget_texture_mb,
+                  "eval_ms": pres_tool.budget_eval_ms}
+        with open(path, "w") as f:
+            json.dump({"budget": budget, "components": report}, f, indent=2)
+
+        heavy = sum(1 for entry in report if entry["flags"])
+        if heavy != 0:
+            self.report({'WARNING'}, str(heavy) + " component(s) over budget, report saved to " + path)
+        else:
+            self.report({'INFO'}, "All components within budget, report saved to " + path)
         return {'FINISHED'}
 
 #------------------------------------------------------------      
@@ -2177,6 +6044,7 @@ class JumpToStart(bpy.types.Operator):
         pres_tool = bpy.context.scene.my_pres_tool
         
         bpy.ops.screen.animation_cancel()
+        PresentationPlayer.stop()
         bpy.context.scene.frame_current = bpy.context.scene.frame_start
         
         return {'FINISHED'}
@@ -2192,19 +6060,153 @@ class JumpToEnd(bpy.types.Operator):
         pres_tool = bpy.context.scene.my_pres_tool
         
         bpy.ops.screen.animation_cancel()
+        PresentationPlayer.stop()
         bpy.context.scene.frame_current = bpy.context.scene.frame_end
         
         return {'FINISHED'}
 
 
 
+# -----------------------------------------------------------------------------------------------------
+#                                           COMMAND LINE BUILD
+# -----------------------------------------------------------------------------------------------------
+
+# build a presentation from a deck description without any window (blender -b)
+# deck = {"output": presentation .blend (overwritten), "components": [component .blend, ...],
+#         "arrange": "x_axis", "interpolate_camera": true, "transition_time": 2,
+#         "transition_mode": "CONSTRAINTS", "transition_easing": "BEZIER", "override": true}
+# relative paths are relative to deck_dir
+# returns the report {"ok": bool, "errors": [{"stage", "component", "message"}], ...}
+def build_deck(deck, deck_dir):
+    started = time.perf_counter()
+    report = {"ok": False, "errors": [], "output": "", "components": 0, "slides": 0, "frame_end": 0, "seconds": 0}
+
+    def fail(stage, message, component=None):
+        report["errors"].append({"stage": stage, "component": component, "message": message})
+        report["seconds"] = round(time.perf_counter() - started, 2)
+        return report
+
+    if "output" not in deck or len(deck.get("components", [])) == 0:
+        return fail("input", "The deck needs an output file and at least one component.")
+    output = os.path.normpath(os.path.join(deck_dir, deck["output"]))
+    components = [os.path.normpath(os.path.join(deck_dir, c)) for c in deck["components"]]
+    report["output"] = output
+    for component in components:
+        if not os.path.isfile(component):
+            fail("input", "FILE NOT FOUND", component)
+    if report["errors"]:
+        return report
+
+    #new empty presentation file
+    stage = "open"
+    try:
+        for obj in list(bpy.data.objects):
+            bpy.data.objects.remove(obj)
+        for col in list(bpy.data.collections):
+            bpy.data.collections.remove(col)
+        if not os.path.exists(os.path.dirname(output)):
+            os.makedirs(os.path.dirname(output))
+        bpy.ops.wm.save_as_mainfile(filepath=output)
+
+        stage = "settings"
+        pres_tool = bpy.context.scene.my_pres_tool
+        pres_tool.slide_position = deck.get("arrange", "x_axis")
+        pres_tool.interpolate_camera = deck.get("interpolate_camera", True)
+        pres_tool.transition_time = deck.get("transition_time", 2)
+        pres_tool.transition_mode = deck.get("transition_mode", "CONSTRAINTS")
+        pres_tool.transition_easing = deck.get("transition_easing", "BEZIER")
+        bpy.ops.wm.save_mainfile()
+
+        #choose components folder by folder, keeping the order
+        stage = "choose"
+        groups = []
+        for component in components:
+            directory, name = os.path.split(component)
+            if groups and groups[-1][0] == directory:
+                groups[-1][1].append(name)
+            else:
+                groups.append([directory, [name]])
+        for directory, names in groups:
+            result = bpy.ops.presentation.choose_slide('EXEC_DEFAULT', directory=directory + os.sep,
+                                                       files=[{"name": name} for name in names])
+            chosen = {os.path.normpath(item.source) for item in bpy.context.scene.my_pres_tool.slide_list}
+            for name in names:
+                if os.path.join(directory, name) not in chosen:
+                    fail(stage, "CAMERA ERROR. Make sure each component contains EXACTLY 1 CAMERA.", os.path.join(directory, name))
+            if 'CANCELLED' in result or report["errors"]:
+                return report
+
+        stage = "import"
+        bpy.ops.presentation.add_slide()
+        pres_tool = bpy.context.scene.my_pres_tool
+        if pres_tool.slide_count != len(components):
+            return fail(stage, "Only " + str(pres_tool.slide_count) + " of " + str(len(components)) + " components were imported.")
+
+        if deck.get("override", True):
+            stage = "override"
+            if not can_override_by_api():
+                return fail(stage, "Overriding without the Outliner needs a newer Blender (override_hierarchy_create).")
+            bpy.ops.presentation.override_slides()
+
+        stage = "cameras"
+        bpy.ops.presentation.recalculate_cameras()
+        build_slide_index(bpy.context.scene)
+
+        stage = "save"
+        bpy.ops.wm.save_mainfile()
+    except Exception as e:
+        return fail(stage, str(e))
+
+    pres_tool = bpy.context.scene.my_pres_tool
+    report["ok"] = True
+    report["components"] = pres_tool.slide_count
+    report["slides"] = len(pres_tool.slides)
+    report["frame_end"] = bpy.context.scene.frame_end
+    report["seconds"] = round(time.perf_counter() - started, 2)
+    return report
+
+# blender -b --factory-startup --python presentation_plugin.py -- --build deck.json [--report report.json]
+# exit code 0 = built, 1 = failed (see the report), 2 = wrong arguments
+def build_from_command_line(argv):
+    args = argv[argv.index("--") + 1:] if "--" in argv else []
+    if "--build" not in args or args.index("--build") + 1 >= len(args):
+        print("usage: blender -b --python presentation_plugin.py -- --build deck.json [--report report.json]")
+        return 2
+    deck_path = os.path.abspath(args[args.index("--build") + 1])
+    report_path = None
+    if "--report" in args and args.index("--report") + 1 < len(args):
+        report_path = os.path.abspath(args[args.index("--report") + 1])
+    try:
+        with open(deck_path) as f:
+            deck = json.load(f)
+    except (OSError, ValueError) as e:
+        report = {"ok": False, "errors": [{"stage": "input", "component": None, "message": str(e)}]}
+    else:
+        report = build_deck(deck, os.path.dirname(deck_path))
+    if report_path is not None:
+        with open(report_path, "w") as f:
+            json.dump(report, f, indent=2)
+    print("PRESENTATION BUILD REPORT " + json.dumps(report))
+    return 0 if report["ok"] else 1
+
+
+
 # -----------------------------------------------------------------------------------------------------
 #                                               REGISTER
 # -----------------------------------------------------------------------------------------------------
 
 
 addon_keymaps = []
+
+# thumbnails of the component catalogue
+catalogue_previews = None
 my_classes =    [
+                PresCatalogueItem,
+                PresFileItem,
+                PresMarkerItem,
+                PresTimerItem,
+                PresReportItem,
+                PresSlideItem,
                 PresMenuProperties, 
                 SLIDE_PARENT_PT_panel, 
                 IMAGE_PT_panel, 
@@ -2213,25 +6215,48 @@ my_classes =    [
                 PRESENTATION_PARENT_PT_panel, 
                 IMPORT_SETTINGS_PT_panel, 
                 PRESENTATION_SETTINGS_PT_panel,
+                REPORT_PT_panel,
                 PRESENTATION_RESET_PT_panel, 
                 PRESENTING_PARENT_PT_panel, 
                 PRESENTATION_START_PT_panel, 
+                EXPORT_PT_panel,
                 NAVIGATION_PT_panel,
+                PRESENTATION_UL_slides,
+                PRESENTATION_UL_catalogue,
+                PRESENTATION_UL_report,
+                PRESENTATION_UL_template,
                 AssignObjectType, 
                 GenerateJsonFile, 
                 CreateComponentFromTemplate, 
                 ChooseSlide, 
+                WriteTimedComponents,
+                ScanCatalogue,
+                BuildLodProxies,
+                ArrangeComponents,
+                ChooseFromCatalogue,
                 ChooseImage, 
                 OverrideSlides, 
+                OverrideSelectedComponents,
                 RecalculateCameras, 
+                BakePresenterCamera,
+                BakeDeck,
+                PrerenderDeck,
+                ExportVideo,
                 AddSlide, 
                 AddImage, 
                 DeleteSlide, 
+                ReorderComponents,
+                MoveComponent,
                 ResetPresentation, 
                 StartPresentation,
                 EndPresentation, 
+                PresentationPlayer,
                 RotateCameraUp, 
                 RotateCameraDown, 
+                GoToSlide,
+                GoToSection,
+                BuildSlideIndex,
+                AnalyseResources,
                 JumpToStart, 
                 JumpToEnd
                 ]
@@ -2242,10 +6267,16 @@ def register():
         bpy.utils.register_class(cls)
         
     bpy.types.Scene.my_pres_tool = bpy.props.PointerProperty(type=PresMenuProperties)
+
+    global catalogue_previews
+    catalogue_previews = bpy.utils.previews.new()
     
-    #append handler
-    bpy.app.handlers.frame_change_pre.append(presentation_handler)
-    bpy.app.handlers.depsgraph_update_pre.append(nla_handler)
+    #editing handlers only for presentation files, checked on every file load
+    bpy.app.handlers.load_post.append(load_presentation_handler)
+    bpy.app.handlers.undo_post.append(type_registry_handler)
+    bpy.app.handlers.redo_post.append(type_registry_handler)
+    #file already open when the add-on is enabled (bpy.data is not accessible in register)
+    bpy.app.timers.register(lambda: load_presentation_handler(None), first_interval=0)
 
     wm = bpy.context.window_manager
     kc = wm.keyconfigs.addon
@@ -2265,20 +6296,32 @@ def unregister():
     for cls in my_classes:
         bpy.utils.unregister_class(cls)
         
-    #append handler
-    try:
-        bpy.app.handlers.depsgraph_update_pre.remove(nla_handler)
-        bpy.app.handlers.frame_change_pre.remove(presentation_handler)
-    except:
-        print("Couldnt unregister the handlers.")
+    #remove handlers
+    deactivate_presentation_handlers()
+    if load_presentation_handler in bpy.app.handlers.load_post:
+        bpy.app.handlers.load_post.remove(load_presentation_handler)
+    if type_registry_handler in bpy.app.handlers.undo_post:
+        bpy.app.handlers.undo_post.remove(type_registry_handler)
+    if type_registry_handler in bpy.app.handlers.redo_post:
+        bpy.app.handlers.redo_post.remove(type_registry_handler)
+    if type_registry_update_handler in bpy.app.handlers.depsgraph_update_post:
+        bpy.app.handlers.depsgraph_update_post.remove(type_registry_update_handler)
+    if baked_camera_handler in bpy.app.handlers.frame_change_pre:
+        bpy.app.handlers.frame_change_pre.remove(baked_camera_handler)
     
     for km,kmi in addon_keymaps:
         km.keymap_items.remove(kmi)
     addon_keymaps.clear()    
    
     del bpy.types.Scene.my_pres_tool
+
+    global catalogue_previews
+    bpy.utils.previews.remove(catalogue_previews)
+    catalogue_previews = None
    
    
 if __name__ == "__main__":
     register()
+    if "--build" in sys.argv:
+        sys.exit(build_from_command_line(sys.argv))
     
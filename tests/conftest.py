@@ -0,0 +1,33 @@
+# fake bpy and mathutils, enough to import the plug-in outside of Blender
+import os, sys, types
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+
+class StubModule(types.ModuleType):
+    # unknown names are empty classes in bpy.types and mathutils, functions anywhere else
+    def __getattr__(self, name):
+        if name.startswith("__"):
+            raise AttributeError(name)
+        if self.__name__ in ("bpy.types", "mathutils"):
+            value = type(name, (), {})
+        else:
+            value = lambda *args, **kwargs: None
+        setattr(self, name, value)
+        return value
+
+
+def stub_module(name):
+    module = StubModule(name)
+    sys.modules[name] = module
+    if "." in name:
+        parent, _, child = name.rpartition(".")
+        setattr(sys.modules[parent], child, module)
+    return module
+
+
+if "bpy" not in sys.modules:
+    for name in ["bpy", "bpy.types", "bpy.props", "bpy.app", "bpy.app.handlers", "bpy.utils",
+                 "bpy.utils.previews", "bpy.path", "bpy.ops", "bpy.data", "bpy.context", "mathutils"]:
+        stub_module(name)
+    sys.modules["bpy.app.handlers"].persistent = lambda function: function
@@ -0,0 +1,151 @@
+import random, time
+from math import sqrt, pi
+
+import pytest
+
+from presentation_core import (get_component_timing, parse_markers_line, get_realtime_frame, get_stops,
+                               get_camera_change, get_component_placement, get_image_placement,
+                               fit_image_dimensions, layout_positions)
+
+
+def test_component_timing_first():
+    assert get_component_timing(1, 1, 50, 48) == (0, 0, 1, 50)
+
+
+def test_component_timing_after_transition():
+    offset, marker_offset, frame_start, frame_end = get_component_timing(100, 10, 60, 48)
+    assert (offset, marker_offset) == (138, 138)
+    assert frame_start == 10 + offset
+    assert frame_end == 60 + offset
+
+
+def test_parse_markers_line():
+    assert parse_markers_line("comp.blend:LS-1;5;LE-9;\n") == \
+        ("comp.blend", [[1, "LOOP_START"], [5, None], [9, "LOOP_END"]], 1, 9)
+
+
+def test_parse_markers_line_without_markers():
+    assert parse_markers_line("comp.blend:\n") is None
+
+
+def test_realtime_frame():
+    assert get_realtime_frame(10, 0.5, 24, 1) == 22
+    assert get_realtime_frame(10, 0.5, 24, -1) == -2
+    assert get_realtime_frame(10, 0.01, 24, 1) == 10
+
+
+def test_realtime_frame_loop():
+    loop = [10, 20]
+    assert get_realtime_frame(10, 0, 24, 1, loop) == 10
+    assert get_realtime_frame(10, 1 / 24, 24, 1, loop) == 11
+    assert get_realtime_frame(10, 9 / 24, 24, 1, loop) == 19
+    assert get_realtime_frame(10, 10 / 24, 24, 1, loop) == 11
+
+
+def test_stops():
+    stops, loops = get_stops([(10, "A"), (1, "LOOP_START"), (5, "LOOP_END"), (10, "B")])
+    assert stops == [1, 10]
+    assert loops == [[1, 5]]
+
+
+def test_camera_change_first():
+    markers, transition = get_camera_change(0, 0, 3, 50, 1, 48)
+    assert markers == [("SLIDE 0 START", 1, 0), ("SLIDE 0 START", 98, 1)]
+    assert transition == (0, 1, 50, 98)
+
+
+def test_camera_change_after_imported():
+    markers, transition = get_camera_change(0, 2, 3, 200, 150, 48)
+    assert markers == [("SLIDE 2 START", 150, 2)]
+    assert transition is None
+
+
+def test_camera_change_middle():
+    markers, transition = get_camera_change(1, 0, 3, 100, 60, 24)
+    assert markers == [("SLIDE 1 START", 124, 2)]
+    assert transition == (1, 2, 100, 124)
+
+
+@pytest.mark.parametrize("arrangement, location", [("x_axis", (150, 0, 0)), ("y_axis", (0, 150, 0)), ("z_axis", (0, 0, -90))])
+def test_component_placement_axis(arrangement, location):
+    assert get_component_placement(2, 1, 4, arrangement, False) == (location, None)
+
+
+def test_component_placement_already_imported():
+    assert get_component_placement(2, 1, 4, "circle", True) == ((0, -60, 0), None)
+
+
+def test_component_placement_circle():
+    for n in (3, 4, 7):
+        radii = [sqrt(sum(c * c for c in get_component_placement(i, 0, n, "circle", False)[0])) for i in range(n)]
+        assert max(radii) - min(radii) == pytest.approx(0)
+    assert get_component_placement(0, 0, 1, "circle", False) == ((0, 0, 0), -pi / 2)
+    assert [get_component_placement(i, 0, 2, "circle", False)[0] for i in range(2)] == [(25, 0, 0), (-25, 0, 0)]
+
+
+def test_image_placement_axis():
+    assert get_image_placement(2, 3, "x_axis")[0][0] == 2
+    assert get_image_placement(2, 3, "z_axis")[0][2] == -2
+
+
+def test_fit_image_dimensions():
+    assert fit_image_dimensions((4, 2, 0), 0, 0) == ((1, 0.5, 0), 0.5)
+    fitted, max_y = fit_image_dimensions((1, 3, 0), 0.5, 1)
+    assert fitted == pytest.approx((1 / 3, 1, 0))
+    assert max_y == pytest.approx(1)
+    assert fit_image_dimensions((2, 1, 0), 1, 2) == ((1, 0.5, 0), 1)
+
+
+ARRANGEMENTS = ["ROW_X", "ROW_Y", "COLUMN_Z", "GRID", "SPHERE", "SPIRAL", "HELIX", "PATH"]
+PATH = [(0, 0, 0), (100, 0, 0), (100, 100, 0), (0, 100, 50)]
+
+
+def get_sizes(n, seed):
+    rng = random.Random(seed)
+    return [(rng.uniform(0.5, 10), rng.uniform(0.5, 10), rng.uniform(0.5, 10)) for i in range(n)]
+
+
+# boxes of the rows and the grid are apart on one axis, the rest keeps the bounding spheres apart
+def assert_clearance(sizes, positions, arrangement, clearance):
+    for a in range(len(sizes)):
+        for b in range(a + 1, len(sizes)):
+            p, q, ha, hb = positions[a], positions[b], sizes[a], sizes[b]
+            if arrangement in ("ROW_X", "ROW_Y", "COLUMN_Z", "GRID"):
+                gap = max(abs(p[k] - q[k]) - ha[k] - hb[k] for k in range(3))
+            else:
+                distance = sqrt(sum((p[k] - q[k]) ** 2 for k in range(3)))
+                gap = distance - sqrt(sum(c * c for c in ha)) - sqrt(sum(c * c for c in hb))
+            assert gap >= clearance - 1e-6, (arrangement, a, b, gap)
+
+
+@pytest.mark.parametrize("arrangement", ARRANGEMENTS)
+@pytest.mark.parametrize("n, clearance", [(2, 0), (7, 1), (30, 2.5)])
+def test_layout_clearance(arrangement, n, clearance):
+    sizes = get_sizes(n, n)
+    positions = layout_positions(sizes, arrangement, clearance, PATH)
+    assert len(positions) == n
+    assert_clearance(sizes, positions, arrangement, clearance)
+
+
+@pytest.mark.parametrize("arrangement", ARRANGEMENTS)
+def test_layout_single_and_empty(arrangement):
+    assert layout_positions([], arrangement, 1, PATH) == []
+    assert len(layout_positions([(1, 1, 1)], arrangement, 1, PATH)) == 1
+
+
+def test_layout_path_without_curve_is_a_row():
+    sizes = get_sizes(5, 1)
+    assert layout_positions(sizes, "PATH", 1) == layout_positions(sizes, "ROW_X", 1)
+
+
+# a tiny component among big ones or a thousand mixed ones without clearance must not march in tiny steps
+@pytest.mark.parametrize("arrangement", ["SPIRAL", "HELIX", "PATH"])
+def test_layout_is_fast_without_clearance(arrangement):
+    rng = random.Random(3)
+    mixed = [(rng.uniform(0.05, 20), rng.uniform(0.05, 20), rng.uniform(0.05, 20)) for i in range(1000)]
+    tiny = [(50, 50, 50)] * 200 + [(0.01, 0.01, 0.01)]
+    for sizes in (mixed, tiny):
+        start = time.perf_counter()
+        positions = layout_positions(sizes, arrangement, 0, PATH)
+        assert time.perf_counter() - start < 2
+        assert_clearance(sizes[-50:], positions[-50:], arrangement, 0)
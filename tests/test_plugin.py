@@ -0,0 +1,21 @@
+from types import SimpleNamespace
+
+import presentation_core
+import presentation_plugin
+
+
+def test_plugin_uses_the_core():
+    assert presentation_plugin.layout_positions is presentation_core.layout_positions
+    assert presentation_plugin.get_component_timing is presentation_core.get_component_timing
+
+
+def test_stop_list_from_the_scene_markers():
+    markers = [SimpleNamespace(frame=frame, name=name)
+               for frame, name in [(30, "B"), (1, "LOOP_START"), (20, "LOOP_END"), (10, "A")]]
+    scene = SimpleNamespace(timeline_markers=markers)
+    assert presentation_plugin.get_stop_list(scene) == ([1, 10, 30], [[1, 20]])
+
+
+def test_camera_names():
+    assert presentation_plugin.getCorrectCameraName(0) == "=> CAMERA"
+    assert presentation_plugin.getCorrectCameraName(12) == "=> CAMERA.012"